@@ -22,6 +22,9 @@ from hamcrest import assert_that, empty, equal_to, is_not, none  # noqa H301
 from stepler import base
 from stepler.third_party import waiter
 
+from whale import index
+from whale import polling
+
 
 class BaseSteps(base.BaseSteps):
     """Base steps-class for whale tests.
@@ -29,6 +32,33 @@ class BaseSteps(base.BaseSteps):
     This class contains common steps for whale tests.
     """
 
+    def __init__(self, client, ledger=None):
+        """Constructor.
+
+        Args:
+            client (obj): decapod client
+            ledger (ResourceLedger|None): ledger to record created resources
+        """
+        super(BaseSteps, self).__init__(client)
+        self._ledger = ledger
+        # index isn't shared between steps, because resources may be changed
+        # out of them (for ex. via UI) and shared index would be stale
+        self._resource_index = index.ResourceIndex()
+
+    def _record(self, resource, resource_id):
+        """Record created resource to ledger."""
+        if self._ledger is not None:
+            self._ledger.add(resource, resource_id)
+
+    def _forget(self, resource, resource_id):
+        """Forget deleted resource in ledger."""
+        if self._ledger is not None:
+            self._ledger.discard(resource, resource_id)
+
+    def _invalidate(self, resource):
+        """Drop index of changed resource collection."""
+        self._resource_index.invalidate(resource)
+
     @staticmethod
     def get_id(obj):
         """Step to retrieve id from object.
@@ -55,15 +85,16 @@ class BaseSteps(base.BaseSteps):
 
         return obj
 
-    @staticmethod
-    def get_resource_by_field(field_value, getter, field_name='name',
-                              check=True):
+    def get_resource_by_field(self, field_value, getter, field_name='name',
+                              resource_type=None, check=True):
         """Step to retrieve resource by field.
 
         Args:
             field_value (str): field value that is used to identify resource
             getter (obj): method to get resources
             field_name (str): field name that is used to identify resource
+            resource_type (str|None): resource type to lookup resource via
+                index of its collection; if None, collection is scanned
             check (bool): flag whether to check step or not
 
         Returns:
@@ -72,17 +103,39 @@ class BaseSteps(base.BaseSteps):
         Raises:
             AssertionError: if check failed
         """
-        for resource in getter():
-            if resource['data'][field_name] == field_value:
-                break
+        if resource_type:
+            resource = self._resource_index.get(
+                resource_type, field_value, getter, field_name=field_name)
         else:
-            resource = None
+            for resource in getter():
+                if resource['data'][field_name] == field_value:
+                    break
+            else:
+                resource = None
 
         if check:
             assert_that(resource, is_not(none()))
 
         return resource
 
+    @staticmethod
+    def is_resource_present(resource_id, getter):
+        """Step to define whether resource is present.
+
+        Args:
+            resource_id (str): resource id
+            getter (obj): method to get resource
+
+        Returns:
+            bool: flag whether resource is present and isn't deleted
+        """
+        try:
+            resource = getter(resource_id)
+        except exceptions.DecapodAPIError:
+            return False
+
+        return resource['time_deleted'] == 0
+
     @staticmethod
     def check_resource_presence(resource_id, getter, must_present=True,
                                 timeout=0):
@@ -99,13 +152,33 @@ class BaseSteps(base.BaseSteps):
                 exception
         """
         def _check_resource_presence():
-            try:
-                resource = getter(resource_id)
-            except exceptions.DecapodAPIError:
-                is_present = False
-            else:
-                is_present = True if resource['time_deleted'] == 0 else False
-
+            is_present = BaseSteps.is_resource_present(resource_id, getter)
             return waiter.expect_that(is_present, equal_to(must_present))
 
-        waiter.wait(_check_resource_presence, timeout_seconds=timeout)
+        polling.wait(_check_resource_presence, timeout_seconds=timeout)
+
+    @staticmethod
+    def check_resources_presence(resource_ids, getter, must_present=True,
+                                 timeout=0):
+        """Step to check that several resources are present.
+
+        All resources are checked in one polling loop.
+
+        Args:
+            resource_ids (list): resource ids
+            getter (obj): method to get resource
+            must_present (bool): flag whether resources should be present or
+                not
+            timeout (int): seconds to wait a result of check
+
+        Raises:
+            TimeoutExpired: if check failed after timeout
+        """
+        def _check_resources_presence():
+            unexpected_ids = [
+                resource_id for resource_id in resource_ids
+                if (BaseSteps.is_resource_present(resource_id, getter) !=
+                    must_present)]
+            return waiter.expect_that(unexpected_ids, empty())
+
+        polling.wait(_check_resources_presence, timeout_seconds=timeout)
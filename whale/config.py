@@ -27,12 +27,101 @@ import os
 # to deploy CEPH cluster. Other servers may be used for additional services.
 DEPLOY_SERVERS_COUNT = int(os.environ.get('DEPLOY_SERVERS_COUNT', 3))
 
+# If CLUSTER_POOL is defined, deployed clusters are leased from session pool
+# and reused between tests with the same deploy hints.
+CLUSTER_POOL = os.environ.get('CLUSTER_POOL')
+CLUSTER_POOL_SIZE = int(os.environ.get('CLUSTER_POOL_SIZE', 1))
+
+# Max count of resources which are deleted concurrently after test
+TEARDOWN_WORKERS = int(os.environ.get('TEARDOWN_WORKERS', 8))
+
+# Polling sleeps grow from interval to max interval by multiplier and deviate
+# randomly by jitter ratio, so concurrent checks don't hit API at once.
+POLLING_MULTIPLIER = 2
+POLLING_JITTER = 0.1
+RESOURCE_POLLING_INTERVAL = 0.1
+RESOURCE_POLLING_MAX_INTERVAL = 2
+
+# Seconds to keep collections indexed for lookups by name or login
+RESOURCE_INDEX_TTL = 10
+
 # Credentials
 DECAPOD_URL = os.environ.get('DECAPOD_URL')
 DECAPOD_WD_URL = 'http://{}'.format(DECAPOD_URL)
 DECAPOD_LOGIN = os.environ.get('DECAPOD_LOGIN', 'login')
 DECAPOD_PASSWORD = os.environ.get('DECAPOD_PASSWORD', 'password')
 
+# Max count of keep-alive connections to Decapod API shared by all steps
+DECAPOD_POOL_SIZE = int(os.environ.get('DECAPOD_POOL_SIZE', 10))
+
+# If DECAPOD_FAKE_API is defined, steps use in-memory fake of Decapod API
+# instead of DECAPOD_URL. Executions of fake API last FAKE_EXECUTION_DURATION
+# seconds and fail with FAKE_EXECUTION_FAILURE_RATE ratio.
+DECAPOD_FAKE_API = os.environ.get('DECAPOD_FAKE_API')
+FAKE_SERVERS_COUNT = int(os.environ.get('FAKE_SERVERS_COUNT', 5))
+FAKE_EXECUTION_DURATION = float(
+    os.environ.get('FAKE_EXECUTION_DURATION', 0))
+FAKE_EXECUTION_FAILURE_RATE = float(
+    os.environ.get('FAKE_EXECUTION_FAILURE_RATE', 0))
+
+# If DECAPOD_CASSETTE is defined, Decapod API interactions are recorded to
+# this file (DECAPOD_CASSETTE_MODE=record) or replayed from it without network
+# and without sleeps between polling checks (DECAPOD_CASSETTE_MODE=replay).
+DECAPOD_CASSETTE = os.environ.get('DECAPOD_CASSETTE')
+DECAPOD_CASSETTE_MODE = os.environ.get('DECAPOD_CASSETTE_MODE', 'replay')
+DECAPOD_REPLAY = bool(DECAPOD_CASSETTE) and DECAPOD_CASSETTE_MODE == 'replay'
+
+# Benchmarks of Decapod API are skipped unless BENCHMARK_RESULTS is defined.
+# Results are saved to this file and labeled with BENCHMARK_LABEL, for ex.
+# version of Decapod build.
+BENCHMARK_RESULTS = os.environ.get('BENCHMARK_RESULTS')
+BENCHMARK_LABEL = os.environ.get('BENCHMARK_LABEL', '')
+BENCHMARK_ITERATIONS = int(os.environ.get('BENCHMARK_ITERATIONS', 50))
+
+# Benchmark results, execution durations and test runtimes of each run may be
+# stored to baseline. Run is regression if its metric exceeds baseline more
+# than BENCHMARK_THRESHOLD (relative) with BENCHMARK_CONFIDENCE. Baseline is
+# pooled from last BENCHMARK_BASELINE_RUNS runs. Metric isn't compared until
+# it's present in BENCHMARK_MIN_BASELINE_RUNS runs with
+# BENCHMARK_MIN_BASELINE_SAMPLES values pooled.
+BENCHMARK_BASELINE = os.environ.get('BENCHMARK_BASELINE')
+BENCHMARK_THRESHOLD = float(os.environ.get('BENCHMARK_THRESHOLD', 0.1))
+BENCHMARK_CONFIDENCE = float(os.environ.get('BENCHMARK_CONFIDENCE', 0.95))
+BENCHMARK_BASELINE_RUNS = int(os.environ.get('BENCHMARK_BASELINE_RUNS', 5))
+BENCHMARK_MIN_BASELINE_RUNS = int(
+    os.environ.get('BENCHMARK_MIN_BASELINE_RUNS', 3))
+BENCHMARK_MIN_BASELINE_SAMPLES = int(
+    os.environ.get('BENCHMARK_MIN_BASELINE_SAMPLES', 3))
+
+# Benchmark of execution queue submits executions to growing count of
+# clusters at once and polls them each BENCHMARK_POLLING_INTERVAL seconds.
+BENCHMARK_EXECUTION_CLUSTERS = [
+    int(count) for count in
+    os.environ.get('BENCHMARK_EXECUTION_CLUSTERS', '1,2,4').split(',')]
+BENCHMARK_POLLING_INTERVAL = float(
+    os.environ.get('BENCHMARK_POLLING_INTERVAL', 1))
+
+# Benchmark of inventory registers synthetic servers until inventory grows to
+# each of BENCHMARK_INVENTORY_SIZES. Servers are registered and deleted by
+# BENCHMARK_WORKERS concurrent requests.
+BENCHMARK_INVENTORY_SIZES = [
+    int(size) for size in
+    os.environ.get('BENCHMARK_INVENTORY_SIZES', '100,1000,3000').split(',')]
+BENCHMARK_WORKERS = int(os.environ.get('BENCHMARK_WORKERS', 20))
+BENCHMARK_SERVER_REGISTRATION_TIMEOUT = 10 * 60
+
+# Load generator: count of concurrent operators, arrival rate of operations
+# per second (operators work back to back if it is 0), duration of load and
+# interval of reports in seconds, mix of operations with their weights.
+LOAD_OPERATORS = int(os.environ.get('LOAD_OPERATORS', 10))
+LOAD_ARRIVAL_RATE = float(os.environ.get('LOAD_ARRIVAL_RATE', 0))
+LOAD_DURATION = int(os.environ.get('LOAD_DURATION', 60))
+LOAD_REPORT_INTERVAL = int(os.environ.get('LOAD_REPORT_INTERVAL', 10))
+LOAD_OPERATION_MIX = os.environ.get(
+    'LOAD_OPERATION_MIX',
+    'create_cluster:1,create_user:1,create_playbook_config:1,'
+    'list_executions:4')
+
 # Playbooks
 PLAYBOOK_DEPLOY_CLUSTER = 'cluster_deploy'
 PLAYBOOK_PURGE_CLUSTER = 'purge_cluster'
@@ -64,11 +153,39 @@ FORCE_TIME_SYNC = 'sync_time'
 EXECUTION_COMPLETED_STATUS = 'completed'
 EXECUTION_FAILED_STATUS = 'failed'
 EXECUTION_COMPLETED_TIMEOUT = 30 * 60
+EXECUTION_POLLING_INTERVAL = 5
+EXECUTION_POLLING_MAX_INTERVAL = 60
+# Executions waited together fail after this count of consecutive failed
+# polling ticks
+EXECUTION_POLLING_MAX_ERRORS = 5
+EXECUTIONS_PAGE_SIZE = 50
 
 # UI
 BROWSER_WINDOW_SIZE = map(
     int, os.environ.get('BROWSER_WINDOW_SIZE', '1920,1080').split(','))
 VIRTUAL_DISPLAY = os.environ.get('VIRTUAL_DISPLAY')
+# Headless browser needs no X server, so VIRTUAL_DISPLAY and video capture
+# via X server are ignored.
+BROWSER_HEADLESS = os.environ.get('BROWSER_HEADLESS')
+# Video of UI test is captured via X server and saved for each test if
+# VIDEO_CAPTURE is 'always', or last VIDEO_BUFFER_SECONDS of X display frames
+# grabbed by VIDEO_ENCODER are kept in memory and encoded only if test is
+# failed, if it is 'failure', or isn't captured if it is 'off'.
+VIDEO_CAPTURE = os.environ.get('VIDEO_CAPTURE', 'off')
+VIDEO_BUFFER_SECONDS = float(os.environ.get('VIDEO_BUFFER_SECONDS', 30))
+VIDEO_FRAME_RATE = float(os.environ.get('VIDEO_FRAME_RATE', 2))
+VIDEO_ENCODER = os.environ.get('VIDEO_ENCODER', 'avconv')
+# Browsers are reused by tests of session (of each xdist worker), up to
+# BROWSER_POOL_SIZE idle browsers, and are relaunched after BROWSER_MAX_TESTS
+# tests. Browser is launched for each test if BROWSER_POOL_SIZE is 0.
+BROWSER_POOL_SIZE = int(os.environ.get('BROWSER_POOL_SIZE', 1))
+BROWSER_MAX_TESTS = int(os.environ.get('BROWSER_MAX_TESTS', 50))
+# UI tests log in via login form if UI_LOGIN is 'form', or with token got
+# from Decapod API, which is put to browser local storage under
+# UI_TOKEN_STORAGE_KEY, if it is 'token'. Storage key and format of token
+# depend on UI build, so token login should be enabled for verified build.
+UI_LOGIN = os.environ.get('UI_LOGIN', 'form')
+UI_TOKEN_STORAGE_KEY = os.environ.get('UI_TOKEN_STORAGE_KEY', 'token')
 UI_TIMEOUT = 30
 ACTION_TIMEOUT = 60
 EVENT_TIMEOUT = 180
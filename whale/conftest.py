@@ -23,5 +23,17 @@ from whale.decapod.conftest import *  # noqa
 from whale.decapod.conftest import __all__  # noqa
 
 pytest_plugins = [
+    'pytester',
     'stepler.third_party.idempotent_id',
+    'whale.third_party.api_budget',
+    'whale.third_party.step_timings',
+    'whale.third_party.trace_events',
 ]
+
+
+def pytest_configure(config):
+    """Register whale markers."""
+    config.addinivalue_line(
+        'markers',
+        'dirty_cluster: test changes state of deployed cluster, so pooled '
+        'cluster should be redeployed after it')
@@ -0,0 +1,288 @@
+"""
+--------------
+Baseline store
+--------------
+
+Stores metrics of runs to JSON-lines file, one run per line, and compares
+metrics of new run with baseline pooled from previous runs. Metrics are
+latencies of Decapod API endpoints, durations of executions and metrics of
+scenarios from benchmark results and runtimes of tests from JUnit XML
+report.
+"""
+
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or
+# implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import collections
+import json
+import math
+import os
+import time
+from xml.etree import ElementTree
+
+from whale.decapod.benchmarks import benchmark
+
+__all__ = [
+    'BaselineStore',
+    'Comparison',
+    'Sample',
+    'compare',
+    'make_run',
+    'pool',
+    'read_report',
+    'read_results',
+]
+
+Sample = collections.namedtuple('Sample', ['count', 'mean', 'stdev'])
+
+Comparison = collections.namedtuple(
+    'Comparison', ['name', 'baseline', 'current', 'low', 'high',
+                   'is_regression'])
+
+
+def _sample(stats):
+    return Sample(stats['count'], stats['mean'], stats.get('stdev') or 0.0)
+
+
+def read_results(path):
+    """Read metrics from benchmark results.
+
+    Args:
+        path (str): path to benchmark results file
+
+    Returns:
+        dict: samples of endpoint latencies, execution durations and
+            metrics of scenarios by name
+
+    Raises:
+        ValueError: if version of results is unsupported
+    """
+    with open(path) as f:
+        results = json.load(f)
+    if results.get('version') != benchmark.RESULTS_VERSION:
+        raise ValueError('Unsupported version {!r} of benchmark results '
+                         '{}'.format(results.get('version'), path))
+
+    metrics = collections.OrderedDict()
+    for scenario, data in sorted(results['scenarios'].items()):
+        for endpoint, stats in sorted(data['endpoints'].items()):
+            metrics['endpoint:{}/{}'.format(scenario, endpoint)] = \
+                _sample(stats)
+        executions = data.get('executions')
+        if executions and executions['count']:
+            metrics['execution:{}'.format(scenario)] = _sample(executions)
+        for name, stats in sorted(data.get('metrics', {}).items()):
+            if stats['count']:
+                metrics['metric:{}/{}'.format(scenario, name)] = \
+                    _sample(stats)
+    return metrics
+
+
+def read_report(path):
+    """Read runtimes of passed tests from JUnit XML report.
+
+    Args:
+        path (str): path to JUnit XML report
+
+    Returns:
+        dict: samples of test runtimes by name
+    """
+    metrics = collections.OrderedDict()
+    for case in ElementTree.parse(path).iter('testcase'):
+        if any(case.find(tag) is not None
+               for tag in ('skipped', 'failure', 'error')):
+            continue
+        name = 'test:{}::{}'.format(case.get('classname'), case.get('name'))
+        metrics[name] = Sample(1, float(case.get('time', 0)), 0.0)
+    return metrics
+
+
+def make_run(metrics, label=''):
+    """Make run record to store in baseline.
+
+    Args:
+        metrics (dict): samples of run by name
+        label (str): label of Decapod build under test
+
+    Returns:
+        dict: run record
+    """
+    return collections.OrderedDict([
+        ('version', benchmark.RESULTS_VERSION),
+        ('label', label),
+        ('time', time.time()),
+        ('metrics', collections.OrderedDict(
+            (name, sample._asdict()) for name, sample in metrics.items())),
+    ])
+
+
+def pool(samples):
+    """Pool samples to one as if all their values were counted together.
+
+    Args:
+        samples (list): samples to pool
+
+    Returns:
+        Sample: pooled sample
+    """
+    count = sum(s.count for s in samples)
+    mean = sum(s.count * s.mean for s in samples) / float(count)
+    squares = sum((s.count - 1) * s.stdev ** 2 + s.count * (s.mean - mean) ** 2
+                  for s in samples)
+    stdev = math.sqrt(squares / (count - 1)) if count > 1 else 0.0
+    return Sample(count, mean, stdev)
+
+
+def _incomplete_beta(a, b, x):
+    # regularized incomplete beta function by continued fraction
+    if x <= 0 or x >= 1:
+        return float(x >= 1)
+    if x > (a + 1) / (a + b + 2):
+        return 1 - _incomplete_beta(b, a, 1 - x)
+
+    tiny = 1e-300
+    front = math.exp(math.lgamma(a + b) - math.lgamma(a) - math.lgamma(b) +
+                     a * math.log(x) + b * math.log(1 - x)) / a
+    c, d = 1.0, 1 - (a + b) * x / (a + 1)
+    d = 1 / (d if abs(d) > tiny else tiny)
+    result = d
+    for m in range(1, 300):
+        for numerator in (m * (b - m) * x / ((a + 2 * m - 1) * (a + 2 * m)),
+                          -(a + m) * (a + b + m) * x /
+                          ((a + 2 * m) * (a + 2 * m + 1))):
+            d = 1 + numerator * d
+            d = 1 / (d if abs(d) > tiny else tiny)
+            c = 1 + numerator / c
+            c = c if abs(c) > tiny else tiny
+            result *= c * d
+        if abs(c * d - 1) < 1e-12:
+            break
+    return front * result
+
+
+def _t_score(confidence, dof):
+    # two-sided quantile of Student's t distribution by bisection
+    def _coverage(t):
+        return 1 - _incomplete_beta(dof / 2.0, 0.5, dof / (dof + t ** 2))
+
+    low, high = 0.0, 1.0
+    while _coverage(high) < confidence:
+        low, high = high, high * 2
+    for _ in range(100):
+        middle = (low + high) / 2
+        if _coverage(middle) < confidence:
+            low = middle
+        else:
+            high = middle
+    return high
+
+
+def compare(runs, metrics, threshold, confidence, min_runs=3,
+            min_samples=3):
+    """Compare metrics of run with baseline.
+
+    Confidence interval of relative change of mean is calculated by Welch's
+    t-test for each metric present in at least ``min_runs`` baseline runs
+    with at least ``min_samples`` values pooled. Variance of single-value
+    metric (like test runtime) is estimated by baseline. Metric is
+    regression if lower bound of its interval exceeds threshold, so noise
+    doesn't fail run. Metrics with insufficient data or without variance
+    aren't compared.
+
+    Args:
+        runs (list): baseline run records
+        metrics (dict): samples of run by name
+        threshold (float): max relative increase of mean, for ex. 0.1
+        confidence (float): confidence level of interval, for ex. 0.95
+        min_runs (int): min count of baseline runs with metric
+        min_samples (int): min count of baseline values of metric, at
+            least 2 to know its variance
+
+    Returns:
+        list: comparisons of metrics
+    """
+    min_samples = max(min_samples, 2)
+    comparisons = []
+    for name, current in metrics.items():
+        history = [Sample(**run['metrics'][name])
+                   for run in runs if name in run['metrics']]
+        if len(history) < min_runs:
+            continue
+        baseline = pool(history)
+        if baseline.count < min_samples or not baseline.mean:
+            continue
+
+        baseline_error = baseline.stdev ** 2 / baseline.count
+        if current.count > 1:
+            current_error = current.stdev ** 2 / current.count
+        else:
+            current_error = baseline.stdev ** 2
+        squared_error = current_error + baseline_error
+        if not squared_error:
+            continue
+
+        if current.count > 1:
+            # Welch-Satterthwaite degrees of freedom
+            dof = squared_error ** 2 / (
+                current_error ** 2 / (current.count - 1) +
+                baseline_error ** 2 / (baseline.count - 1))
+        else:
+            dof = baseline.count - 1
+        error = _t_score(confidence, dof) * math.sqrt(squared_error)
+        change = current.mean - baseline.mean
+        low = (change - error) / baseline.mean
+        high = (change + error) / baseline.mean
+        comparisons.append(Comparison(name, baseline, current, low, high,
+                                      low > threshold))
+    return comparisons
+
+
+class BaselineStore(object):
+    """JSON-lines file with metrics of runs."""
+
+    def __init__(self, path):
+        """Constructor.
+
+        Args:
+            path (str): path to baseline file
+        """
+        self.path = path
+
+    def load(self, runs_count=None):
+        """Load last runs with supported version.
+
+        Args:
+            runs_count (int|None): count of last runs to load, all by default
+
+        Returns:
+            list: run records from oldest to newest
+        """
+        if not os.path.exists(self.path):
+            return []
+
+        with open(self.path) as f:
+            runs = [json.loads(line) for line in f if line.strip()]
+        runs = [run for run in runs
+                if run.get('version') == benchmark.RESULTS_VERSION]
+        if runs_count is not None:
+            runs = runs[-runs_count:]
+        return runs
+
+    def append(self, run):
+        """Append run to baseline.
+
+        Args:
+            run (dict): run record
+        """
+        with open(self.path, 'a') as f:
+            f.write(json.dumps(run) + '\n')
@@ -0,0 +1,153 @@
+"""
+---------
+Benchmark
+---------
+"""
+
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or
+# implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import collections
+import contextlib
+import json
+import threading
+import time
+
+from whale import config
+from whale.decapod.benchmarks import histogram
+from whale import timing
+
+__all__ = [
+    'Benchmark',
+    'RESULTS_VERSION',
+]
+
+# version of results format, increase it on incompatible changes
+RESULTS_VERSION = 1
+
+
+class Benchmark(object):
+    """Benchmark of Decapod API latency.
+
+    Scenarios drive steps in loops inside ``measure`` block. Latency of each
+    call of Decapod API is counted to histogram of its client method,
+    durations of awaited executions are counted to separate histogram and
+    throughput of scenario is calculated by its wall time. Scenario may
+    record its own metrics, for ex. queueing delay of executions.
+    """
+
+    def __init__(self, iterations=config.BENCHMARK_ITERATIONS,
+                 label=config.BENCHMARK_LABEL):
+        """Constructor.
+
+        Args:
+            iterations (int): count of iterations of each scenario
+            label (str): label of Decapod build under benchmark
+        """
+        self.iterations = iterations
+        self.label = label
+        self._lock = threading.Lock()
+        self._scenarios = collections.OrderedDict()
+        self._metrics = collections.defaultdict(
+            lambda: collections.defaultdict(histogram.StreamingHistogram))
+
+    @contextlib.contextmanager
+    def measure(self, scenario):
+        """Measure latency of API calls made in block.
+
+        Args:
+            scenario (str): name of scenario
+
+        Yields:
+            function: function to count finished operation of scenario
+        """
+        endpoints = collections.defaultdict(histogram.StreamingHistogram)
+        executions = histogram.StreamingHistogram()
+        operations = [0]
+
+        def _count_call(record):
+            if record['category'] == timing.API:
+                with self._lock:
+                    endpoints[record['name']].add(record['duration'])
+            elif (record['category'] == timing.WAIT and
+                    record['name'] == 'execution'):
+                with self._lock:
+                    executions.add(record['duration'])
+
+        def _count_operation():
+            operations[0] += 1
+
+        timing.add_listener(_count_call)
+        start = time.time()
+        try:
+            yield _count_operation
+        finally:
+            duration = time.time() - start
+            timing.remove_listener(_count_call)
+
+        with self._lock:
+            calls = sum(h.count for h in endpoints.values())
+            self._scenarios[scenario] = collections.OrderedDict([
+                ('duration', duration),
+                ('operations', operations[0]),
+                ('operations_per_second', operations[0] / duration),
+                ('calls_per_second', calls / duration),
+                ('endpoints', collections.OrderedDict(
+                    (name, endpoints[name].to_dict())
+                    for name in sorted(endpoints))),
+                ('executions', executions.to_dict()),
+            ])
+
+    def record(self, scenario, name, value):
+        """Record value of scenario metric.
+
+        Args:
+            scenario (str): name of scenario
+            name (str): name of metric
+            value (float): value of metric in seconds
+        """
+        with self._lock:
+            self._metrics[scenario][name].add(value)
+
+    def to_dict(self):
+        """Get results of benchmark.
+
+        Returns:
+            dict: versioned results of all measured scenarios
+        """
+        with self._lock:
+            scenarios = collections.OrderedDict()
+            for scenario, results in self._scenarios.items():
+                scenarios[scenario] = collections.OrderedDict(results)
+                metrics = self._metrics.get(scenario, {})
+                scenarios[scenario]['metrics'] = collections.OrderedDict(
+                    (name, metrics[name].to_dict())
+                    for name in sorted(metrics))
+
+            return collections.OrderedDict([
+                ('version', RESULTS_VERSION),
+                ('label', self.label),
+                ('decapod_url', config.DECAPOD_URL),
+                ('time', time.time()),
+                ('iterations', self.iterations),
+                ('scenarios', scenarios),
+            ])
+
+    def save(self, path):
+        """Save results of benchmark to JSON file.
+
+        Args:
+            path (str): path to results file
+        """
+        with open(path, 'w') as f:
+            json.dump(self.to_dict(), f, indent=2)
@@ -0,0 +1,134 @@
+"""
+------------------
+Regression command
+------------------
+
+Compares run with baseline and exits with non-zero code on regressions::
+
+    python -m whale.decapod.benchmarks.compare \\
+        --results benchmark.json --report report.xml --update-baseline
+
+Baseline is stored next to report by default. Use ``--update-baseline``
+to append run to baseline after comparison, for ex. on runs of master.
+Comparison is skipped with zero exit code until baseline has enough runs.
+"""
+
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or
+# implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from __future__ import print_function
+
+import argparse
+import collections
+import os
+import sys
+
+from whale import config
+from whale.decapod.benchmarks import baseline
+
+__all__ = [
+    'main',
+]
+
+BASELINE_FILE = 'baseline.jsonl'
+
+
+def _parse_args(argv):
+    parser = argparse.ArgumentParser(
+        description='Compare benchmark results and test runtimes with '
+                    'baseline.')
+    parser.add_argument('--results', default=config.BENCHMARK_RESULTS,
+                        help='benchmark results file')
+    parser.add_argument('--report', default='report.xml',
+                        help='JUnit XML report with test runtimes')
+    parser.add_argument('--baseline', default=config.BENCHMARK_BASELINE,
+                        help='baseline file, {} next to report by '
+                             'default'.format(BASELINE_FILE))
+    parser.add_argument('--label', default=config.BENCHMARK_LABEL,
+                        help='label of Decapod build under test')
+    parser.add_argument('--threshold', type=float,
+                        default=config.BENCHMARK_THRESHOLD,
+                        help='max relative increase of metric')
+    parser.add_argument('--confidence', type=float,
+                        default=config.BENCHMARK_CONFIDENCE,
+                        help='confidence level of intervals')
+    parser.add_argument('--runs', type=int,
+                        default=config.BENCHMARK_BASELINE_RUNS,
+                        help='count of last runs to pool baseline from')
+    parser.add_argument('--min-runs', type=int,
+                        default=config.BENCHMARK_MIN_BASELINE_RUNS,
+                        help='min count of baseline runs to compare metric')
+    parser.add_argument('--min-samples', type=int,
+                        default=config.BENCHMARK_MIN_BASELINE_SAMPLES,
+                        help='min count of baseline values to compare '
+                             'metric')
+    parser.add_argument('--update-baseline', action='store_true',
+                        help='append run to baseline after comparison')
+    args = parser.parse_args(argv)
+    if not args.baseline:
+        args.baseline = os.path.join(
+            os.path.dirname(os.path.abspath(args.report)), BASELINE_FILE)
+    return args
+
+
+def main(argv=None):
+    """Compare run with baseline.
+
+    Args:
+        argv (list|None): command line arguments, ``sys.argv`` by default
+
+    Returns:
+        int: 1 if there are regressions, 0 otherwise
+    """
+    args = _parse_args(argv)
+
+    metrics = collections.OrderedDict()
+    if args.results and os.path.exists(args.results):
+        metrics.update(baseline.read_results(args.results))
+    if os.path.exists(args.report):
+        metrics.update(baseline.read_report(args.report))
+    if not metrics:
+        print('No benchmark results or report to compare')
+        return 0
+
+    store = baseline.BaselineStore(args.baseline)
+    runs = store.load(args.runs)
+    if len(runs) < args.min_runs:
+        print('Insufficient data: {} of {} required baseline runs, '
+              'comparison is skipped'.format(len(runs), args.min_runs))
+        regressions = []
+    else:
+        comparisons = baseline.compare(runs, metrics, args.threshold,
+                                       args.confidence, args.min_runs,
+                                       args.min_samples)
+        regressions = [c for c in comparisons if c.is_regression]
+        print('Compared {} of {} metrics with {} baseline runs, '
+              '{} regressions'.format(len(comparisons), len(metrics),
+                                      len(runs), len(regressions)))
+        if len(comparisons) < len(metrics):
+            print('Insufficient data: {} metrics are not '
+                  'compared'.format(len(metrics) - len(comparisons)))
+        for c in regressions:
+            print('REGRESSION {}: {:.4f}s -> {:.4f}s, change '
+                  '{:+.1%}..{:+.1%} exceeds {:.1%}'.format(
+                      c.name, c.baseline.mean, c.current.mean, c.low,
+                      c.high, args.threshold))
+
+    if args.update_baseline:
+        store.append(baseline.make_run(metrics, args.label))
+
+    return 1 if regressions else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,112 @@
+"""
+-------------------
+Benchmarks conftest
+-------------------
+"""
+
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or
+# implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import functools
+from multiprocessing.pool import ThreadPool
+import uuid
+
+import pytest
+
+from whale import config
+from whale.decapod.benchmarks import benchmark as benchmark_module
+from whale.decapod import teardown
+
+__all__ = [
+    'benchmark',
+    'register_servers',
+]
+
+SERVER_USERNAME = 'ansible'
+
+
+@pytest.fixture(scope='session')
+def benchmark():
+    """Session fixture to get benchmark of Decapod API.
+
+    Benchmarks are skipped if ``BENCHMARK_RESULTS`` isn't defined. Results
+    of all benchmarks are saved to it at the end of session.
+
+    Returns:
+        Benchmark: benchmark to measure scenarios
+    """
+    if not config.BENCHMARK_RESULTS:
+        pytest.skip('BENCHMARK_RESULTS is not defined')
+
+    _benchmark = benchmark_module.Benchmark()
+    yield _benchmark
+    _benchmark.save(config.BENCHMARK_RESULTS)
+
+
+def _synthetic_ip(index):
+    # 10.0.0.0/8 is enough for 16M servers
+    return '10.{}.{}.{}'.format(index >> 16 & 255, index >> 8 & 255,
+                                index & 255)
+
+
+@pytest.fixture
+def register_servers(server_steps):
+    """Callable fixture to register synthetic servers concurrently.
+
+    Servers get random ids and consecutive IPs from ``10.0.0.0/8``. All
+    registered servers are deleted concurrently after test.
+
+    Args:
+        server_steps (ServerSteps): instantiated server steps
+
+    Yields:
+        function: function to register servers
+    """
+    server_ids = []
+
+    def _register_servers(count):
+        if not count:
+            return []
+
+        offset = len(server_ids)
+        new_ids = [str(uuid.uuid4()) for _ in range(count)]
+        server_ids.extend(new_ids)
+
+        def _create_server(index):
+            server_steps.create_server(new_ids[index],
+                                       _synthetic_ip(offset + index),
+                                       SERVER_USERNAME,
+                                       check=False)
+
+        pool = ThreadPool(min(config.BENCHMARK_WORKERS, count))
+        try:
+            pool.map(_create_server, range(count))
+        finally:
+            pool.close()
+            pool.join()
+
+        server_steps.check_servers_presence(
+            new_ids, timeout=config.BENCHMARK_SERVER_REGISTRATION_TIMEOUT)
+        return new_ids
+
+    yield _register_servers
+
+    if not server_ids:
+        return
+
+    teardown.delete_resources(
+        server_ids, functools.partial(server_steps.delete_server, check=False),
+        workers=config.BENCHMARK_WORKERS)
+    server_steps.check_servers_presence(
+        server_ids, must_present=False,
+        timeout=config.BENCHMARK_SERVER_REGISTRATION_TIMEOUT)
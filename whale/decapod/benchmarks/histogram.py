@@ -0,0 +1,138 @@
+"""
+-------------------
+Streaming histogram
+-------------------
+"""
+
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or
+# implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import collections
+import math
+
+__all__ = [
+    'StreamingHistogram'
+]
+
+
+class StreamingHistogram(object):
+    """Histogram of latencies with bounded relative error.
+
+    Values are counted in logarithmic buckets, so memory doesn't depend on
+    count of values and any percentile is estimated with relative error not
+    greater than precision. Min, max and mean are exact.
+    """
+
+    def __init__(self, precision=0.01, min_value=1e-6):
+        """Constructor.
+
+        Args:
+            precision (float): max relative error of percentiles
+            min_value (float): values less than it are counted as it
+        """
+        self._base = math.log(1 + 2 * precision)
+        self._min_value = min_value
+        self._buckets = collections.Counter()
+        self.count = 0
+        self.total = 0
+        self.total_squares = 0
+        self.min = None
+        self.max = None
+
+    def _bucket(self, value):
+        return int(math.log(max(value, self._min_value) / self._min_value) /
+                   self._base)
+
+    def _value(self, bucket):
+        # middle of bucket
+        return self._min_value * math.exp((bucket + 0.5) * self._base)
+
+    def add(self, value):
+        """Count value.
+
+        Args:
+            value (float): value to count
+        """
+        self._buckets[self._bucket(value)] += 1
+        self.count += 1
+        self.total += value
+        self.total_squares += value ** 2
+        self.min = value if self.min is None else min(self.min, value)
+        self.max = value if self.max is None else max(self.max, value)
+
+    def merge(self, histogram):
+        """Count all values of other histogram with the same precision.
+
+        Args:
+            histogram (StreamingHistogram): histogram to merge
+        """
+        self._buckets.update(histogram._buckets)
+        self.count += histogram.count
+        self.total += histogram.total
+        self.total_squares += histogram.total_squares
+        for value in (histogram.min, histogram.max):
+            if value is not None:
+                self.min = value if self.min is None else min(self.min, value)
+                self.max = value if self.max is None else max(self.max, value)
+
+    def percentile(self, percent):
+        """Estimate percentile of counted values.
+
+        Args:
+            percent (float): percent from 0 to 100
+
+        Returns:
+            float|None: estimated percentile or None if there are no values
+        """
+        if not self.count:
+            return None
+
+        rank = max(int(math.ceil(self.count * percent / 100.0)), 1)
+        seen = 0
+        for bucket in sorted(self._buckets):
+            seen += self._buckets[bucket]
+            if seen >= rank:
+                return min(max(self._value(bucket), self.min), self.max)
+        return self.max
+
+    @property
+    def mean(self):
+        """Exact mean of counted values or None if there are no values."""
+        return self.total / self.count if self.count else None
+
+    @property
+    def stdev(self):
+        """Exact sample standard deviation of counted values."""
+        if self.count < 2:
+            return 0.0
+        count = float(self.count)
+        variance = ((self.total_squares - self.total ** 2 / count) /
+                    (count - 1))
+        return math.sqrt(max(variance, 0))
+
+    def to_dict(self):
+        """Summarize histogram.
+
+        Returns:
+            dict: count, mean, stdev, min, max and percentiles of values
+        """
+        return collections.OrderedDict([
+            ('count', self.count),
+            ('mean', self.mean),
+            ('stdev', self.stdev),
+            ('min', self.min),
+            ('p50', self.percentile(50)),
+            ('p90', self.percentile(90)),
+            ('p99', self.percentile(99)),
+            ('max', self.max),
+        ])
@@ -0,0 +1,411 @@
+"""
+--------------
+Load generator
+--------------
+
+Simulates concurrent operators of Decapod with API steps::
+
+    python -m whale.decapod.benchmarks.load \\
+        --operators 20 --rate 50 --duration 300 --output load.json
+
+Each operation is picked at random by weights of operation mix. With
+arrival rate operations arrive as Poisson process to shared queue and their
+latency is counted from arrival, so it includes waiting for free operator
+and shows when Decapod API can't serve the load anymore. Without arrival
+rate operators work back to back. Throughput, latency percentiles and error
+rate of operations are reported per interval. Resources created by
+operators are deleted at the end.
+"""
+
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or
+# implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from __future__ import print_function
+
+import argparse
+import bisect
+import collections
+import functools
+import json
+import math
+import random
+import sys
+import threading
+import time
+
+from six.moves import queue
+
+from whale import config
+from whale.decapod.benchmarks import histogram
+from whale.decapod import client
+from whale.decapod import fake_api
+from whale.decapod import steps
+from whale.decapod import teardown
+from whale import ledger
+
+__all__ = [
+    'LoadGenerator',
+    'OPERATIONS',
+    'Operator',
+    'main',
+    'parse_mix',
+]
+
+OPERATIONS = ('create_cluster', 'create_user', 'create_playbook_config',
+              'list_executions')
+
+
+def parse_mix(mix):
+    """Parse operation mix.
+
+    Args:
+        mix (str): comma separated operations with weights, for ex.
+            ``create_user:1,list_executions:4``
+
+    Returns:
+        list: pairs of operation and its weight
+
+    Raises:
+        ValueError: if operation is unknown or weight isn't positive
+    """
+    pairs = []
+    for item in mix.split(','):
+        operation, _, weight = item.strip().partition(':')
+        weight = float(weight or 1)
+        if operation not in OPERATIONS:
+            raise ValueError('Unknown operation {!r}, expected one of '
+                             '{}'.format(operation, ', '.join(OPERATIONS)))
+        if weight <= 0:
+            raise ValueError('Weight of {} should be positive'.format(
+                operation))
+        pairs.append((operation, weight))
+    return pairs
+
+
+class Operator(object):
+    """Simulated operator of Decapod with own steps."""
+
+    def __init__(self, decapod_client, resource_ledger):
+        """Constructor.
+
+        Args:
+            decapod_client (obj): decapod client of operator
+            resource_ledger (ResourceLedger): ledger of created resources
+        """
+        self._cluster_steps = steps.ClusterSteps(decapod_client,
+                                                 ledger=resource_ledger)
+        self._execution_steps = steps.ExecutionSteps(decapod_client)
+        self._playbook_config_steps = steps.PlaybookConfigSteps(
+            decapod_client, ledger=resource_ledger)
+        self._server_steps = steps.ServerSteps(decapod_client)
+        self._user_steps = steps.UserSteps(decapod_client,
+                                           ledger=resource_ledger)
+        self._cluster = None
+        self._server_ids = None
+
+    def prepare(self, operations):
+        """Create resources needed by operations.
+
+        Args:
+            operations (list): operations of load
+        """
+        if 'create_playbook_config' in operations:
+            self._cluster = self._cluster_steps.create_cluster()
+            self._server_ids = self._server_steps.get_server_ids()
+
+    def create_cluster(self):
+        """Create cluster."""
+        self._cluster_steps.create_cluster()
+
+    def create_user(self):
+        """Create user."""
+        self._user_steps.create_user()
+
+    def create_playbook_config(self):
+        """Create playbook configuration to deploy cluster of operator."""
+        self._playbook_config_steps.create_playbook_config(
+            cluster_id=self._cluster['id'],
+            playbook_id=config.PLAYBOOK_DEPLOY_CLUSTER,
+            server_ids=self._server_ids)
+
+    def list_executions(self):
+        """List first page of executions."""
+        self._execution_steps.get_executions(
+            check=False, per_page=config.EXECUTIONS_PAGE_SIZE)
+
+    def cleanup(self, resource_ledger):
+        """Delete resources created by all operators.
+
+        Args:
+            resource_ledger (ResourceLedger): ledger of created resources
+        """
+        for resource, delete in (
+                (ledger.PLAYBOOK_CONFIGS,
+                 self._playbook_config_steps.delete_playbook_config),
+                (ledger.CLUSTERS, self._cluster_steps.delete_cluster),
+                (ledger.USERS, self._user_steps.delete_user)):
+            teardown.delete_resources(resource_ledger.pop(resource),
+                                      functools.partial(delete, check=False))
+
+
+class _Window(object):
+
+    def __init__(self):
+        self.latencies = collections.defaultdict(
+            histogram.StreamingHistogram)
+        self.errors = collections.Counter()
+        self.backlog = 0
+
+
+def _summarize(windows, duration):
+    latencies = collections.defaultdict(histogram.StreamingHistogram)
+    errors = collections.Counter()
+    for window in windows:
+        for operation, latency in window.latencies.items():
+            latencies[operation].merge(latency)
+        errors.update(window.errors)
+
+    def _stats(latency, error_count):
+        return collections.OrderedDict([
+            ('count', latency.count),
+            ('throughput', latency.count / float(duration)),
+            ('errors', error_count),
+            ('error_rate',
+             error_count / float(latency.count) if latency.count else 0.0),
+            ('latency', latency.to_dict()),
+        ])
+
+    total = histogram.StreamingHistogram()
+    for latency in latencies.values():
+        total.merge(latency)
+    return collections.OrderedDict([
+        ('operations', collections.OrderedDict(
+            (operation, _stats(latencies[operation], errors[operation]))
+            for operation in sorted(latencies))),
+        ('total', _stats(total, sum(errors.values()))),
+    ])
+
+
+class LoadGenerator(object):
+    """Generator of load by concurrent operators."""
+
+    def __init__(self, operators, mix, rate=0, duration=60, interval=10):
+        """Constructor.
+
+        Args:
+            operators (list): operators to run operations
+            mix (list): pairs of operation and its weight
+            rate (float): arrival rate of operations per second, operators
+                work back to back if it is 0
+            duration (int): duration of load in seconds
+            interval (int): interval of reports in seconds
+        """
+        self._operators = operators
+        self._operations = [operation for operation, _ in mix]
+        self._weights = []
+        for _, weight in mix:
+            self._weights.append(weight + (self._weights[-1]
+                                           if self._weights else 0))
+        self._rate = rate
+        self._duration = duration
+        self._interval = interval
+        self._lock = threading.Lock()
+        self._windows = collections.defaultdict(_Window)
+        self._queue = queue.Queue()
+        self._stop = threading.Event()
+        self._start = None
+
+    def _choose(self):
+        point = random.random() * self._weights[-1]
+        return self._operations[bisect.bisect_right(self._weights, point)]
+
+    def _execute(self, operator, operation, arrival):
+        failed = False
+        try:
+            getattr(operator, operation)()
+        except Exception:
+            failed = True
+        end = time.time()
+
+        with self._lock:
+            window = self._windows[int((end - self._start) / self._interval)]
+            window.latencies[operation].add(end - arrival)
+            if failed:
+                window.errors[operation] += 1
+
+    def _work(self, operator):
+        if self._rate:
+            for operation, arrival in iter(self._queue.get, None):
+                self._execute(operator, operation, arrival)
+        else:
+            while not self._stop.is_set():
+                self._execute(operator, self._choose(), time.time())
+
+    def _dispatch(self):
+        deadline = self._start + self._duration
+        arrival = self._start
+        while not self._stop.is_set():
+            arrival += random.expovariate(self._rate)
+            if arrival >= deadline:
+                break
+            self._stop.wait(max(arrival - time.time(), 0))
+            self._queue.put((self._choose(), arrival))
+
+    def _drop_backlog(self):
+        dropped = 0
+        while True:
+            try:
+                self._queue.get_nowait()
+            except queue.Empty:
+                return dropped
+            dropped += 1
+
+    def run(self, report=None):
+        """Run load.
+
+        Args:
+            report (function|None): function to call with time and summary
+                of each finished interval
+
+        Returns:
+            dict: summaries of intervals and total summary of load
+        """
+        self._start = time.time()
+        threads = [threading.Thread(target=self._work, args=(operator,),
+                                    name='operator-{}'.format(i))
+                   for i, operator in enumerate(self._operators)]
+        if self._rate:
+            threads.append(threading.Thread(target=self._dispatch,
+                                            name='dispatcher'))
+        for thread in threads:
+            thread.daemon = True
+            thread.start()
+
+        windows_count = int(math.ceil(self._duration / float(self._interval)))
+        summaries = []
+        for index in range(windows_count):
+            time.sleep(max(self._start + (index + 1) * self._interval -
+                           time.time(), 0))
+            with self._lock:
+                window = self._windows[index]
+                window.backlog = self._queue.qsize()
+                summary = _summarize([window], self._interval)
+            summary['time'] = index * self._interval
+            summary['backlog'] = window.backlog
+            summaries.append(summary)
+            if report:
+                report(summary)
+
+        self._stop.set()
+        dropped = self._drop_backlog()
+        for _ in self._operators:
+            self._queue.put(None)
+        for thread in threads:
+            thread.join()
+        duration = time.time() - self._start
+
+        with self._lock:
+            total = _summarize(list(self._windows.values()), duration)
+        return collections.OrderedDict([
+            ('operators', len(self._operators)),
+            ('rate', self._rate),
+            ('duration', duration),
+            ('dropped', dropped),
+            ('intervals', summaries),
+            ('summary', total),
+        ])
+
+
+def _print_summary(summary):
+    total = summary['total']
+    latency = total['latency']
+    label = '{}s'.format(summary['time']) if 'time' in summary else 'total'
+    print('{:>7} {:>8.2f} ops/s  p50 {:>7.3f}s  p90 {:>7.3f}s  '
+          'p99 {:>7.3f}s  errors {:>6.1%}  backlog {}'.format(
+              label, total['throughput'],
+              latency['p50'] or 0, latency['p90'] or 0, latency['p99'] or 0,
+              total['error_rate'], summary.get('backlog', '-')))
+    sys.stdout.flush()
+
+
+def _make_clients(count):
+    if config.DECAPOD_FAKE_API:
+        # operators share state of one fake API
+        return [fake_api.FakeDecapodClient()] * count
+    return [client.DecapodClient(url=config.DECAPOD_URL,
+                                 login=config.DECAPOD_LOGIN,
+                                 password=config.DECAPOD_PASSWORD)
+            for _ in range(count)]
+
+
+def _parse_args(argv):
+    parser = argparse.ArgumentParser(
+        description='Generate load of concurrent operators on Decapod API.')
+    parser.add_argument('--operators', type=int,
+                        default=config.LOAD_OPERATORS,
+                        help='count of concurrent operators')
+    parser.add_argument('--rate', type=float,
+                        default=config.LOAD_ARRIVAL_RATE,
+                        help='arrival rate of operations per second, '
+                             'operators work back to back if it is 0')
+    parser.add_argument('--duration', type=int,
+                        default=config.LOAD_DURATION,
+                        help='duration of load in seconds')
+    parser.add_argument('--interval', type=int,
+                        default=config.LOAD_REPORT_INTERVAL,
+                        help='interval of reports in seconds')
+    parser.add_argument('--mix', default=config.LOAD_OPERATION_MIX,
+                        help='operations with weights, for ex. '
+                             'create_user:1,list_executions:4')
+    parser.add_argument('--output', help='file to save results as JSON')
+    return parser.parse_args(argv)
+
+
+def main(argv=None):
+    """Generate load on Decapod API.
+
+    Args:
+        argv (list|None): command line arguments, ``sys.argv`` by default
+
+    Returns:
+        int: exit code
+    """
+    args = _parse_args(argv)
+    mix = parse_mix(args.mix)
+
+    resource_ledger = ledger.ResourceLedger()
+    operators = [Operator(decapod_client, resource_ledger)
+                 for decapod_client in _make_clients(args.operators)]
+    try:
+        for operator in operators:
+            operator.prepare([operation for operation, _ in mix])
+
+        results = LoadGenerator(operators, mix,
+                                rate=args.rate,
+                                duration=args.duration,
+                                interval=args.interval).run(_print_summary)
+    finally:
+        operators[0].cleanup(resource_ledger)
+
+    _print_summary(results['summary'])
+    if results['dropped']:
+        print('{} operations were not started before end of load'.format(
+            results['dropped']))
+    if args.output:
+        with open(args.output, 'w') as f:
+            json.dump(results, f, indent=2)
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
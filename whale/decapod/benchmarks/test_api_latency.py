@@ -0,0 +1,154 @@
+"""
+-------------------------
+Decapod API latency tests
+-------------------------
+"""
+
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or
+# implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import pytest
+from stepler.third_party import utils
+
+from whale import config
+
+
+@pytest.mark.idempotent_id('48c62f96-afdf-44ef-bf58-382325af4888')
+def test_users_latency(benchmark, user_steps):
+    """**Scenario:** Measure latency of users API.
+
+    **Steps:**
+
+    #. Create user
+    #. Get user by id
+    #. Get list of users
+    #. Update user with new full name
+    #. Delete user
+    #. Repeat steps 1-5 configured count of times
+    """
+    with benchmark.measure('users') as count:
+        for _ in range(benchmark.iterations):
+            user = user_steps.create_user()
+            user_steps.get_user(user['id'])
+            user_steps.get_users()
+            user_steps.update_user(
+                user, {'full_name': next(utils.generate_ids('new_name'))})
+            user_steps.delete_user(user['id'])
+            count()
+
+
+@pytest.mark.idempotent_id('b8794d46-101b-4a54-b3a9-932e4b388548')
+def test_roles_latency(benchmark, role_steps):
+    """**Scenario:** Measure latency of roles API.
+
+    **Steps:**
+
+    #. Create role
+    #. Get role by id
+    #. Get list of roles
+    #. Update role with new name
+    #. Delete role
+    #. Repeat steps 1-5 configured count of times
+    """
+    with benchmark.measure('roles') as count:
+        for _ in range(benchmark.iterations):
+            role = role_steps.create_role()
+            role_steps.get_role(role['id'])
+            role_steps.get_roles()
+            role_steps.update_role(
+                role, {'name': next(utils.generate_ids('new_name'))})
+            role_steps.delete_role(role['id'])
+            count()
+
+
+@pytest.mark.idempotent_id('0d59af8f-03d8-4abf-94d1-c76156099b81')
+def test_clusters_latency(benchmark, cluster_steps):
+    """**Scenario:** Measure latency of clusters API.
+
+    **Steps:**
+
+    #. Create cluster
+    #. Get cluster by id
+    #. Get list of clusters
+    #. Update cluster with new name
+    #. Delete cluster
+    #. Repeat steps 1-5 configured count of times
+    """
+    with benchmark.measure('clusters') as count:
+        for _ in range(benchmark.iterations):
+            cluster = cluster_steps.create_cluster()
+            cluster_steps.get_cluster(cluster['id'])
+            cluster_steps.get_clusters()
+            cluster_steps.update_cluster(
+                cluster, {'name': next(utils.generate_ids('new_name'))})
+            cluster_steps.delete_cluster(cluster['id'])
+            count()
+
+
+@pytest.mark.idempotent_id('20a823d9-52af-4867-9d13-ef6d3b65175a')
+def test_servers_latency(benchmark, server_steps):
+    """**Scenario:** Measure latency of servers API.
+
+    **Steps:**
+
+    #. Get list of servers
+    #. Get server by id
+    #. Update server with new name
+    #. Restore name of server
+    #. Repeat steps 1-4 configured count of times
+    """
+    with benchmark.measure('servers') as count:
+        for _ in range(benchmark.iterations):
+            server = server_steps.get_servers()[0]
+            origin_name = server['data']['name']
+            server = server_steps.get_server(server['id'])
+            server = server_steps.update_server(
+                server, {'name': next(utils.generate_ids('server'))})
+            server_steps.update_server(server, {'name': origin_name})
+            count()
+
+
+@pytest.mark.idempotent_id('47bfbd6a-275f-4c68-89d4-699339d3e78e')
+def test_playbook_configs_latency(benchmark, cluster, server_steps,
+                                  playbook_config_steps):
+    """**Scenario:** Measure latency of playbook configurations API.
+
+    **Setup:**
+
+    #. Create cluster
+
+    **Steps:**
+
+    #. Get ids of all servers
+    #. Create playbook configuration
+    #. Get playbook configuration by id
+    #. Get list of playbook configurations
+    #. Delete playbook configuration
+    #. Repeat steps 2-5 configured count of times
+
+    **Teardown:**
+
+    #. Delete cluster
+    """
+    server_ids = server_steps.get_server_ids()
+    with benchmark.measure('playbook_configs') as count:
+        for _ in range(benchmark.iterations):
+            playbook_config = playbook_config_steps.create_playbook_config(
+                cluster_id=cluster['id'],
+                playbook_id=config.PLAYBOOK_DEPLOY_CLUSTER,
+                server_ids=server_ids)
+            playbook_config_steps.get_playbook_config(playbook_config['id'])
+            playbook_config_steps.get_playbook_configs()
+            playbook_config_steps.delete_playbook_config(
+                playbook_config['id'])
+            count()
@@ -0,0 +1,165 @@
+"""
+--------------
+Baseline tests
+--------------
+"""
+
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or
+# implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import math
+
+import pytest
+
+from whale.decapod.benchmarks import baseline
+
+METRIC = 'test:test_module::test_case'
+
+
+def _sample(values):
+    count = len(values)
+    mean = sum(values) / float(count)
+    squares = sum((value - mean) ** 2 for value in values)
+    stdev = math.sqrt(squares / (count - 1)) if count > 1 else 0.0
+    return baseline.Sample(count, mean, stdev)
+
+
+def _runs(*samples):
+    return [baseline.make_run({METRIC: sample}) for sample in samples]
+
+
+@pytest.mark.idempotent_id('e7b5b606-6f27-4550-8854-4e87b690e080')
+def test_pool_samples():
+    """**Scenario:** Check that pooled sample matches joined values.
+
+    **Steps:**
+
+    #. Pool samples of three value sets
+    #. Check that pooled sample equals sample of all values
+    """
+    values = [[1.0, 2.0, 4.0], [3.0], [5.0, 5.5]]
+    pooled = baseline.pool([_sample(v) for v in values])
+    expected = _sample(sum(values, []))
+
+    assert pooled.count == expected.count
+    assert pooled.mean == pytest.approx(expected.mean)
+    assert pooled.stdev == pytest.approx(expected.stdev)
+
+
+@pytest.mark.idempotent_id('9f9cf1da-73ad-40e5-bc73-2c04dfe69635')
+@pytest.mark.parametrize('confidence, dof, expected', [
+    (0.95, 1, 12.706),
+    (0.95, 5, 2.571),
+    (0.99, 10, 3.169),
+    (0.95, 1000, 1.962),
+])
+def test_t_score(confidence, dof, expected):
+    """**Scenario:** Check quantiles of Student's t distribution.
+
+    **Steps:**
+
+    #. Calculate two-sided quantile
+    #. Check that it matches tabulated one
+    """
+    assert baseline._t_score(confidence, dof) == pytest.approx(expected,
+                                                               abs=1e-3)
+
+
+@pytest.mark.idempotent_id('58f8feec-c802-49e0-9d02-2560b2e9b303')
+def test_compare_with_insufficient_runs():
+    """**Scenario:** Check that metric isn't compared by single run.
+
+    **Steps:**
+
+    #. Compare doubled test runtime with single baseline run
+    #. Check that metric isn't compared
+    """
+    runs = _runs(_sample([1.0]))
+
+    assert baseline.compare(runs, {METRIC: _sample([2.0])}, 0.1, 0.95,
+                            min_runs=1, min_samples=1) == []
+    assert baseline.compare(runs, {METRIC: _sample([2.0])}, 0.1,
+                            0.95) == []
+
+
+@pytest.mark.idempotent_id('d94b9700-a7dd-4df0-aae1-34318e5b4969')
+def test_compare_without_variance():
+    """**Scenario:** Check that metric without variance isn't compared.
+
+    **Steps:**
+
+    #. Compare doubled test runtime with baseline of equal runtimes
+    #. Check that metric isn't compared
+    """
+    runs = _runs(_sample([1.0]), _sample([1.0]), _sample([1.0]))
+
+    assert baseline.compare(runs, {METRIC: _sample([2.0])}, 0.1,
+                            0.95) == []
+
+
+@pytest.mark.idempotent_id('445e8d60-089c-41a3-9812-59a62e295272')
+def test_compare_noise_is_not_regression():
+    """**Scenario:** Check that noisy test runtime isn't regression.
+
+    **Steps:**
+
+    #. Compare test runtime 20% over mean of noisy baseline
+    #. Check that interval includes zero and metric isn't regression
+    """
+    runs = _runs(_sample([1.0]), _sample([1.3]), _sample([0.8]))
+
+    comparison, = baseline.compare(runs, {METRIC: _sample([1.23])}, 0.1,
+                                   0.95)
+
+    assert comparison.low < 0 < comparison.high
+    assert not comparison.is_regression
+
+
+@pytest.mark.idempotent_id('38a2f7be-5bec-4a99-a1e9-0e212239c518')
+def test_compare_regression():
+    """**Scenario:** Check that doubled latency is regression.
+
+    **Steps:**
+
+    #. Compare endpoint latency with stable baseline of three runs
+    #. Check that lower bound of interval exceeds threshold
+    """
+    runs = _runs(_sample([1.0, 1.1, 0.9]), _sample([1.05, 0.95]),
+                 _sample([1.0, 1.02, 0.98]))
+
+    comparison, = baseline.compare(
+        runs, {METRIC: _sample([2.0, 2.1, 1.9, 2.05])}, 0.1, 0.95)
+
+    assert comparison.baseline.count == 8
+    assert comparison.low > 0.1
+    assert comparison.is_regression
+
+
+@pytest.mark.idempotent_id('c18085a3-a900-409c-8542-2a9e4d236c24')
+def test_compare_uses_t_quantile():
+    """**Scenario:** Check that interval is widened by t quantile.
+
+    **Steps:**
+
+    #. Compare test runtime with baseline of three runs
+    #. Check that half width of interval is t quantile of two degrees
+        of freedom times standard error
+    """
+    runs = _runs(_sample([1.0]), _sample([1.2]), _sample([0.8]))
+
+    comparison, = baseline.compare(runs, {METRIC: _sample([1.0])}, 0.1,
+                                   0.95)
+
+    error = 0.2 * math.sqrt(1 + 1 / 3.0)
+    assert comparison.high == pytest.approx(4.303 * error, abs=1e-3)
+    assert comparison.low == pytest.approx(-4.303 * error, abs=1e-3)
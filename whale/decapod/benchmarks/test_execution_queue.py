@@ -0,0 +1,88 @@
+"""
+--------------------------
+Execution queue benchmarks
+--------------------------
+"""
+
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or
+# implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import time
+
+import pytest
+
+from whale import config
+from whale import polling
+
+
+@pytest.mark.idempotent_id('54cdb578-3457-4f09-9ccc-44c2a9805b21')
+@pytest.mark.parametrize('clusters_count',
+                         config.BENCHMARK_EXECUTION_CLUSTERS)
+def test_execution_queue_throughput(benchmark, clusters_count, cluster_steps,
+                                    server_steps, playbook_config_steps,
+                                    execution_steps):
+    """**Scenario:** Measure throughput of executions of several clusters.
+
+    **Setup:**
+
+    #. Create clusters
+    #. Create playbook configurations to deploy clusters on separate
+       vacant servers
+
+    **Steps:**
+
+    #. Create executions of all playbook configurations at once
+    #. Wait for all executions are completed
+    #. Measure queueing delay and run time of each execution and
+       throughput of completions
+
+    **Teardown:**
+
+    #. Delete clusters
+    """
+    servers_count = clusters_count * config.DEPLOY_SERVERS_COUNT
+    server_ids = server_steps.get_server_ids(vacant_only=True, check=False)
+    if len(server_ids) < servers_count:
+        pytest.skip('{} vacant servers are required to deploy {} clusters, '
+                    'only {} are available'.format(
+                        servers_count, clusters_count, len(server_ids)))
+
+    playbook_configs = []
+    for i in range(clusters_count):
+        cluster = cluster_steps.create_cluster()
+        playbook_configs.append(playbook_config_steps.create_playbook_config(
+            cluster_id=cluster['id'],
+            playbook_id=config.PLAYBOOK_DEPLOY_CLUSTER,
+            server_ids=server_ids[i::clusters_count][
+                :config.DEPLOY_SERVERS_COUNT]))
+
+    scenario = 'execution_queue_{}'.format(clusters_count)
+    with benchmark.measure(scenario) as count:
+        submit_times = []
+        execution_ids = []
+        for playbook_config in playbook_configs:
+            submit_times.append(time.time())
+            execution_ids.append(execution_steps.create_execution(
+                playbook_config['id'], check=False)['id'])
+
+        futures = execution_steps.wait_executions(
+            execution_ids, policy=polling.BENCHMARK_POLICY)
+        for _ in futures:
+            count()
+
+    for submit_time, future in zip(submit_times, futures):
+        finish_time = future.state_times[future.status]
+        # execution may be finished between polling ticks
+        start_time = future.state_times.get('started', finish_time)
+        benchmark.record(scenario, 'queueing_delay', start_time - submit_time)
+        benchmark.record(scenario, 'run_time', finish_time - start_time)
@@ -0,0 +1,71 @@
+"""
+---------------------------
+Server inventory benchmarks
+---------------------------
+"""
+
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or
+# implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import random
+
+import pytest
+from stepler.third_party import utils
+
+from whale import config
+
+
+@pytest.mark.idempotent_id('9af8d20c-3d88-4e34-bd6c-bc1c104d961f')
+def test_inventory_scale(benchmark, register_servers, cluster, server_steps,
+                         playbook_config_steps):
+    """**Scenario:** Measure latency of servers API as inventory grows.
+
+    **Setup:**
+
+    #. Create cluster
+
+    **Steps:**
+
+    #. Register synthetic servers concurrently until inventory grows to
+       next size
+    #. Get list of servers
+    #. Get random synthetic server by id
+    #. Update random synthetic server with new name
+    #. Create playbook configuration with all synthetic servers
+    #. Delete playbook configuration
+    #. Repeat steps 2-6 configured count of times
+    #. Repeat steps 1-7 for each inventory size
+
+    **Teardown:**
+
+    #. Delete synthetic servers concurrently
+    #. Delete cluster
+    """
+    server_ids = []
+    for size in sorted(config.BENCHMARK_INVENTORY_SIZES):
+        server_ids.extend(register_servers(size - len(server_ids)))
+
+        with benchmark.measure('inventory_{}'.format(size)) as count:
+            for _ in range(benchmark.iterations):
+                server_steps.get_servers()
+                server = server_steps.get_server(random.choice(server_ids))
+                server_steps.update_server(
+                    server, {'name': next(utils.generate_ids('server'))})
+                playbook_config = \
+                    playbook_config_steps.create_playbook_config(
+                        cluster_id=cluster['id'],
+                        playbook_id=config.PLAYBOOK_DEPLOY_CLUSTER,
+                        server_ids=server_ids)
+                playbook_config_steps.delete_playbook_config(
+                    playbook_config['id'])
+                count()
@@ -0,0 +1,274 @@
+"""
+--------
+Cassette
+--------
+"""
+
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or
+# implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import collections
+import hashlib
+import json
+import re
+import threading
+
+import requests
+from requests import adapters
+from requests import exceptions
+from requests import structures
+from six.moves.urllib import parse
+
+__all__ = [
+    'Cassette',
+    'RecordingAdapter',
+    'ReplayAdapter',
+    'RECORD',
+    'REPLAY',
+]
+
+RECORD = 'record'
+REPLAY = 'replay'
+
+UUID_RE = re.compile(
+    r'[0-9a-f]{8}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{12}', re.I)
+PLACEHOLDER_RE = re.compile(r'^00000000-0000-0000-000[01]-[0-9a-f]{12}$')
+PLACEHOLDER = '00000000-0000-0000-0000-{:012d}'
+REQUEST_PLACEHOLDER = '00000000-0000-0000-0001-{}'
+UNKNOWN_ID = '?'
+AUTH_PATH = '/auth/'
+
+
+class Cassette(object):
+    """Cassette of Decapod API interactions.
+
+    Interactions are stored as JSON lines. Ids and auth tokens are replaced
+    with placeholders. Ids which first appear in responses are numbered in
+    order of appearance and are returned to client as is during replay. Ids
+    generated by client get placeholders derived from request they first
+    appear in and count of the same requests before it, so they are mapped
+    to the same placeholders during record and replay regardless of order
+    of requests of concurrent threads. Request bodies of authentication
+    aren't stored.
+    """
+
+    def __init__(self, path, mode=REPLAY):
+        """Constructor.
+
+        Args:
+            path (str): path to cassette file
+            mode (str): ``record`` or ``replay``
+        """
+        self.path = path
+        self.mode = mode
+        self._lock = threading.Lock()
+        self._placeholders = {}
+        self._values = {}
+        self._requests = collections.Counter()
+        self._interactions = collections.defaultdict(collections.deque)
+
+        if mode == RECORD:
+            open(path, 'w').close()
+        else:
+            with open(path) as f:
+                for line in f:
+                    interaction = json.loads(line)
+                    key = (interaction['method'], interaction['url'],
+                           interaction['request'])
+                    self._interactions[key].append(interaction)
+
+    def _placeholder(self, match):
+        value = match.group(0).lower()
+        if value not in self._placeholders:
+            if PLACEHOLDER_RE.match(value):
+                placeholder = value
+            else:
+                placeholder = PLACEHOLDER.format(len(self._placeholders) + 1)
+            self._placeholders[value] = placeholder
+            self._values[placeholder] = value
+        return self._placeholders[value]
+
+    def _template(self, match):
+        value = match.group(0).lower()
+        if PLACEHOLDER_RE.match(value):
+            return value
+        return self._placeholders.get(value, UNKNOWN_ID)
+
+    def _value(self, match):
+        placeholder = match.group(0)
+        if placeholder not in self._values:
+            # id generated by Decapod during record
+            self._placeholders[placeholder] = placeholder
+            self._values[placeholder] = placeholder
+        return self._values[placeholder]
+
+    def normalize(self, text):
+        """Replace ids in text with placeholders.
+
+        Args:
+            text (str|None): text to normalize
+
+        Returns:
+            str|None: normalized text
+        """
+        if not text:
+            return text
+        return UUID_RE.sub(self._placeholder, text)
+
+    def denormalize(self, text):
+        """Replace placeholders in text with ids of current run.
+
+        Args:
+            text (str|None): text to denormalize
+
+        Returns:
+            str|None: denormalized text
+        """
+        if not text:
+            return text
+        return UUID_RE.sub(self._value, text)
+
+    def _normalize_request(self, request):
+        url = parse.urlsplit(request.url)
+        path = url.path + ('?' + url.query if url.query else '')
+
+        body = request.body
+        if isinstance(body, bytes):
+            body = body.decode('utf-8')
+        if url.path.endswith(AUTH_PATH):
+            body = None
+        elif body:
+            try:
+                body = json.dumps(json.loads(body), sort_keys=True)
+            except ValueError:
+                pass
+
+        # ids generated by client are unknown yet, so request template is
+        # the same during record and replay
+        text = '\n'.join([request.method, path, body or ''])
+        template = UUID_RE.sub(self._template, text)
+        index = self._requests[template]
+        self._requests[template] += 1
+
+        for position, match in enumerate(UUID_RE.finditer(text)):
+            value = match.group(0).lower()
+            if value in self._placeholders or PLACEHOLDER_RE.match(value):
+                continue
+            key = '\n'.join([template, str(index), str(position)])
+            digest = hashlib.sha1(key.encode('utf-8')).hexdigest()
+            placeholder = REQUEST_PLACEHOLDER.format(digest[:12])
+            self._placeholders[value] = placeholder
+            self._values[placeholder] = value
+
+        return self.normalize(path), self.normalize(body)
+
+    def record(self, request, response):
+        """Record interaction.
+
+        Args:
+            request (PreparedRequest): sent request
+            response (Response): received response
+        """
+        with self._lock:
+            url, body = self._normalize_request(request)
+            interaction = {
+                'method': request.method,
+                'url': url,
+                'request': body,
+                'status': response.status_code,
+                'content_type': response.headers.get('Content-Type'),
+                'response': self.normalize(response.text),
+            }
+            with open(self.path, 'a') as f:
+                f.write(json.dumps(interaction, sort_keys=True) + '\n')
+
+    def play(self, request):
+        """Get recorded response to request.
+
+        Interactions with the same method, url and body are played in
+        recorded order, the last one is repeated, because during replay
+        request may be polled more times than during record.
+
+        Args:
+            request (PreparedRequest): request to respond
+
+        Returns:
+            Response: recorded response
+
+        Raises:
+            ConnectionError: if there is no recorded response
+        """
+        with self._lock:
+            url, body = self._normalize_request(request)
+            interactions = self._interactions.get((request.method, url, body))
+            if not interactions:
+                raise exceptions.ConnectionError(
+                    "No recorded response to {} {} in cassette {}".format(
+                        request.method, url, self.path),
+                    request=request)
+
+            if len(interactions) > 1:
+                interaction = interactions.popleft()
+            else:
+                interaction = interactions[0]
+            content = self.denormalize(interaction['response'])
+
+        response = requests.Response()
+        response.status_code = interaction['status']
+        response.headers = structures.CaseInsensitiveDict(
+            {'Content-Type': interaction['content_type']})
+        response._content = (content or '').encode('utf-8')
+        response.encoding = 'utf-8'
+        response.url = request.url
+        response.request = request
+        return response
+
+
+class RecordingAdapter(adapters.HTTPAdapter):
+    """Transport adapter which records interactions to cassette."""
+
+    def __init__(self, cassette, **kwargs):
+        """Constructor.
+
+        Args:
+            cassette (Cassette): cassette to record to
+            **kwargs: any suitable keyword arguments of HTTPAdapter
+        """
+        super(RecordingAdapter, self).__init__(**kwargs)
+        self._cassette = cassette
+
+    def send(self, request, **kwargs):
+        """Send request and record interaction."""
+        response = super(RecordingAdapter, self).send(request, **kwargs)
+        self._cassette.record(request, response)
+        return response
+
+
+class ReplayAdapter(adapters.BaseAdapter):
+    """Transport adapter which responds from cassette without network."""
+
+    def __init__(self, cassette):
+        """Constructor.
+
+        Args:
+            cassette (Cassette): cassette to replay
+        """
+        super(ReplayAdapter, self).__init__()
+        self._cassette = cassette
+
+    def send(self, request, **kwargs):
+        """Respond to request from cassette."""
+        return self._cassette.play(request)
+
+    def close(self):
+        """Close adapter."""
@@ -0,0 +1,119 @@
+"""
+--------------
+Decapod client
+--------------
+"""
+
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or
+# implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import functools
+import threading
+
+from decapodlib import client as decapodclient
+from decapodlib import exceptions
+from requests import adapters
+
+from whale import config
+from whale.decapod import cassette
+from whale import timing
+
+__all__ = [
+    'DecapodClient'
+]
+
+UNAUTHORIZED_STATUS_CODE = 401
+
+
+class DecapodClient(object):
+    """Decapod client shared by steps during test session.
+
+    It proxies calls to ``decapodlib`` V1 client, keeps a pool of keep-alive
+    connections to Decapod API and logs in again if auth token has expired,
+    so one instance may be safely reused by all steps and threads. If
+    cassette is given, interactions with API are recorded to it or replayed
+    from it.
+    """
+
+    def __init__(self, url, login, password,
+                 pool_size=config.DECAPOD_POOL_SIZE, cassette=None, **kwargs):
+        """Constructor.
+
+        Args:
+            url (str): Decapod API url
+            login (str): user login
+            password (str): user password
+            pool_size (int): max count of keep-alive connections to API
+            cassette (Cassette|None): cassette to record or replay
+            **kwargs: any suitable keyword arguments of V1Client
+        """
+        self._url = url
+        self._login = login
+        self._password = password
+        self._pool_size = pool_size
+        self._cassette = cassette
+        self._kwargs = kwargs
+        self._lock = threading.Lock()
+        self._client = self._make_client()
+
+    def _make_client(self):
+        client = decapodclient.V1Client(url=self._url,
+                                        login=self._login,
+                                        password=self._password,
+                                        **self._kwargs)
+        # NOTE: decapodlib uses default requests adapter, which keeps only
+        # one connection per host. Mount pooled adapter to be able to share
+        # the client between threads without reconnections.
+        if self._cassette is None:
+            adapter = adapters.HTTPAdapter(pool_connections=self._pool_size,
+                                           pool_maxsize=self._pool_size)
+        elif self._cassette.mode == cassette.RECORD:
+            adapter = cassette.RecordingAdapter(
+                self._cassette, pool_connections=self._pool_size,
+                pool_maxsize=self._pool_size)
+        else:
+            adapter = cassette.ReplayAdapter(self._cassette)
+        client._session.mount('http://', adapter)
+        client._session.mount('https://', adapter)
+        return client
+
+    def _relogin(self, expired_client):
+        with self._lock:
+            # other thread could relogin already
+            if self._client is expired_client:
+                self._client = self._make_client()
+
+    def __getattr__(self, name):
+        attr = getattr(self._client, name)
+        if name.startswith('_') or not callable(attr):
+            return attr
+
+        @functools.wraps(attr)
+        def _call(*args, **kwargs):
+            with timing.span(name, timing.API):
+                return self._call_client(name, *args, **kwargs)
+
+        return _call
+
+    def _call_client(self, name, *args, **kwargs):
+        client = self._client
+        try:
+            return getattr(client, name)(*args, **kwargs)
+        except exceptions.DecapodAPIError as e:
+            response = getattr(e, 'response', None)
+            status_code = getattr(response, 'status_code', None)
+            if status_code != UNAUTHORIZED_STATUS_CODE:
+                raise
+
+        self._relogin(client)
+        return getattr(self._client, name)(*args, **kwargs)
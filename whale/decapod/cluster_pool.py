@@ -0,0 +1,252 @@
+"""
+------------
+Cluster pool
+------------
+"""
+
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or
+# implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import collections
+import logging
+import threading
+
+from decapodlib import exceptions
+
+from whale import config
+
+__all__ = [
+    'ClusterPool',
+    'purge_cluster',
+]
+
+LOGGER = logging.getLogger(__name__)
+
+
+def purge_cluster(cluster, playbook_config_steps, execution_steps):
+    """Purge deployed cluster via playbook executions.
+
+    Args:
+        cluster (dict): model of deployed cluster
+        playbook_config_steps (obj): instantiated playbook config steps
+        execution_steps (obj): instantiated execution steps
+
+    Returns:
+        list: created playbook configurations
+    """
+    playbook_configs = []
+    if 'osds' in cluster['data']['configuration']:
+        # we can't remove cluster with osd
+        server_ids = [
+            server['server_id']
+            for server in cluster['data']['configuration']['osds']
+        ]
+        osd_config = playbook_config_steps.create_playbook_config(
+            cluster['id'],
+            config.PLAYBOOK_REMOVE_OSD,
+            server_ids=server_ids)
+        playbook_configs.append(osd_config)
+        execution_steps.create_execution(osd_config['id'])
+
+    cluster_config = playbook_config_steps.create_playbook_config(
+        cluster['id'], config.PLAYBOOK_PURGE_CLUSTER)
+    playbook_configs.append(cluster_config)
+    execution_steps.create_execution(cluster_config['id'])
+
+    return playbook_configs
+
+
+class ClusterPool(object):
+    """Pool of deployed clusters shared between tests.
+
+    Clusters are keyed by deploy hints. Test leases cluster with required
+    hints and releases it after finish. Released cluster is kept warm for
+    the next test, but if it's dirty it is purged and deployed again in
+    background.
+    """
+
+    def __init__(self, cluster_steps, server_steps, playbook_config_steps,
+                 execution_steps, size=config.CLUSTER_POOL_SIZE):
+        """Constructor.
+
+        Args:
+            cluster_steps (obj): instantiated cluster steps
+            server_steps (obj): instantiated server steps
+            playbook_config_steps (obj): instantiated playbook config steps
+            execution_steps (obj): instantiated execution steps
+            size (int): max count of deployed clusters
+        """
+        self._cluster_steps = cluster_steps
+        self._server_steps = server_steps
+        self._playbook_config_steps = playbook_config_steps
+        self._execution_steps = execution_steps
+        self._size = size
+
+        self._lock = threading.Lock()
+        self._idle = collections.OrderedDict()
+        self._leased = {}
+        self._redeploys = {}
+        self._owned = set()
+        self._configs = collections.defaultdict(list)
+
+    @staticmethod
+    def _get_key(hints):
+        return tuple(sorted((hints or {}).items()))
+
+    @property
+    def cluster_ids(self):
+        """Ids of clusters owned by pool."""
+        with self._lock:
+            return set(self._owned)
+
+    def lease(self, hints=None):
+        """Lease deployed cluster.
+
+        Args:
+            hints (dict|None): hints to deploy cluster with
+
+        Returns:
+            dict: model of deployed cluster
+        """
+        key = self._get_key(hints)
+        self._wait_redeploy(key)
+
+        with self._lock:
+            cluster_id = self._idle.pop(key, None)
+
+        if cluster_id is None:
+            self._free_slot()
+            cluster_id = self._deploy(hints)
+
+        cluster = self._cluster_steps.get_cluster(cluster_id)
+        with self._lock:
+            self._leased[cluster_id] = (
+                hints, cluster['data']['configuration'])
+        return cluster
+
+    def release(self, cluster, dirty=False):
+        """Return leased cluster to pool.
+
+        Cluster is redeployed in background if it is dirty, its topology was
+        changed or it was deleted during test.
+
+        Args:
+            cluster (dict): model of leased cluster
+            dirty (bool): flag whether cluster state was changed by test
+        """
+        cluster_id = cluster['id']
+        with self._lock:
+            hints, configuration = self._leased.pop(cluster_id)
+
+        try:
+            cluster = self._cluster_steps.get_cluster(cluster_id, check=False)
+        except exceptions.DecapodAPIError:
+            cluster = None
+
+        if cluster is None or cluster['time_deleted']:
+            with self._lock:
+                self._owned.discard(cluster_id)
+            cluster = None
+        elif not dirty and cluster['data']['configuration'] == configuration:
+            with self._lock:
+                self._idle[self._get_key(hints)] = cluster_id
+            return
+
+        thread = threading.Thread(target=self._redeploy,
+                                  args=(cluster, hints),
+                                  name='redeploy-{}'.format(cluster_id))
+        thread.daemon = True
+        with self._lock:
+            self._redeploys[self._get_key(hints)] = thread
+        thread.start()
+
+    def close(self):
+        """Purge all clusters owned by pool."""
+        with self._lock:
+            keys = list(self._redeploys)
+        for key in keys:
+            self._wait_redeploy(key)
+
+        with self._lock:
+            self._idle.clear()
+        for cluster_id in self.cluster_ids:
+            self._purge(cluster_id)
+
+    def _wait_redeploy(self, key):
+        with self._lock:
+            thread = self._redeploys.pop(key, None)
+        if thread:
+            thread.join()
+
+    def _free_slot(self):
+        while len(self.cluster_ids) >= self._size:
+            with self._lock:
+                keys = list(self._redeploys)
+            for key in keys:
+                self._wait_redeploy(key)
+
+            with self._lock:
+                if not self._idle:
+                    # all clusters are leased, nothing to evict
+                    return
+                _, cluster_id = self._idle.popitem(last=False)
+
+            self._purge(cluster_id)
+
+    def _deploy(self, hints):
+        cluster = self._cluster_steps.create_cluster()
+        with self._lock:
+            self._owned.add(cluster['id'])
+
+        server_ids = self._server_steps.get_server_ids(
+            vacant_only=True)[:config.DEPLOY_SERVERS_COUNT]
+        playbook_config = self._playbook_config_steps.create_playbook_config(
+            cluster_id=cluster['id'],
+            playbook_id=config.PLAYBOOK_DEPLOY_CLUSTER,
+            server_ids=server_ids,
+            hints=hints)
+        self._configs[cluster['id']].append(playbook_config['id'])
+
+        self._execution_steps.create_execution(playbook_config['id'])
+        return cluster['id']
+
+    def _purge(self, cluster_id):
+        cluster = self._cluster_steps.get_cluster(cluster_id)
+        if cluster['data']['configuration']:
+            playbook_configs = purge_cluster(cluster,
+                                             self._playbook_config_steps,
+                                             self._execution_steps)
+            self._configs[cluster_id].extend(
+                playbook_config['id'] for playbook_config in playbook_configs)
+        else:
+            self._cluster_steps.delete_cluster(cluster_id)
+
+        for playbook_config_id in self._configs.pop(cluster_id, []):
+            self._playbook_config_steps.delete_playbook_config(
+                playbook_config_id)
+
+        with self._lock:
+            self._owned.discard(cluster_id)
+
+    def _redeploy(self, cluster, hints):
+        try:
+            if cluster:
+                self._purge(cluster['id'])
+            cluster_id = self._deploy(hints)
+        except Exception:
+            # next lease with these hints deploys cluster from scratch
+            LOGGER.exception("Can't redeploy cluster with hints %r", hints)
+            return
+
+        with self._lock:
+            self._idle[self._get_key(hints)] = cluster_id
@@ -0,0 +1,255 @@
+"""
+----------------
+Execution waiter
+----------------
+"""
+
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or
+# implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import collections
+import logging
+import threading
+import time
+
+from hamcrest import equal_to
+from stepler.third_party import waiter
+
+from whale import config
+from whale import polling
+from whale import timing
+
+__all__ = [
+    'ExecutionFuture',
+    'ExecutionWaiter',
+]
+
+LOGGER = logging.getLogger(__name__)
+
+
+class ExecutionFuture(object):
+    """Future of execution which is resolved by execution waiter.
+
+    Future keeps time when each state of execution was observed first, so
+    queueing delay and run time of execution may be estimated with
+    precision of polling interval.
+    """
+
+    def __init__(self, execution_id, status):
+        """Constructor.
+
+        Args:
+            execution_id (str): execution id
+            status (str): expected status of execution
+        """
+        self.execution_id = execution_id
+        self.status = status
+        self.state = None
+        self.time_created = None
+        self.state_times = collections.OrderedDict()
+        self.execution = None
+        self._error = None
+        self._event = threading.Event()
+
+    def done(self):
+        """Define whether execution is finished."""
+        return self._event.is_set()
+
+    def wait(self, timeout=None):
+        """Wait for execution finish.
+
+        Args:
+            timeout (int|None): seconds to wait
+
+        Returns:
+            bool: flag whether execution is finished
+        """
+        self._event.wait(timeout)
+        return self.done()
+
+    def result(self, timeout=None):
+        """Get finished execution.
+
+        Args:
+            timeout (int|None): seconds to wait execution finish
+
+        Returns:
+            dict: model of the execution
+
+        Raises:
+            TimeoutExpired: if execution isn't finished after timeout
+            AssertionError: if execution is failed
+        """
+        with timing.span('execution', timing.WAIT,
+                         execution_id=self.execution_id):
+            self.wait(timeout)
+        if self._error:
+            raise self._error
+
+        waiter.wait(lambda: waiter.expect_that(self.state,
+                                               equal_to(self.status)),
+                    timeout_seconds=0)
+        return self.execution
+
+    def _update(self, execution):
+        self.state = execution['data']['state'].lower()
+        self.time_created = execution.get('time_created')
+        self.state_times.setdefault(self.state, time.time())
+
+    def _resolve(self, execution=None, error=None):
+        self.execution = execution
+        self._error = error
+        self._event.set()
+
+
+class ExecutionWaiter(object):
+    """Waiter of several executions at once.
+
+    Waiter polls executions in background thread and lists executions from
+    newest one on each tick, whatever count of executions it tracks. Pages
+    are listed only until all tracked executions are found or older
+    executions are reached, usually it's single page. Executions absent in
+    listing (for ex. deleted ones) are requested separately. Failed tick
+    is retried on the next one, executions fail only if ticks fail
+    persistently.
+    """
+
+    def __init__(self, client,
+                 status=config.EXECUTION_COMPLETED_STATUS,
+                 failure_status=config.EXECUTION_FAILED_STATUS,
+                 policy=polling.EXECUTION_POLICY,
+                 per_page=config.EXECUTIONS_PAGE_SIZE,
+                 max_errors=config.EXECUTION_POLLING_MAX_ERRORS):
+        """Constructor.
+
+        Args:
+            client (obj): decapod client
+            status (str): expected status of executions
+            failure_status (str): status to fail execution
+            policy (PollingPolicy): policy of sleeps between polling ticks
+            per_page (int): count of executions per page of listing
+            max_errors (int): count of consecutive failed ticks to fail
+                tracked executions
+        """
+        self._client = client
+        self._per_page = per_page
+        self._max_errors = max_errors
+        self._status = status
+        self._failure_status = failure_status
+        self._policy = policy
+        self._futures = {}
+        self._lock = threading.Lock()
+        self._stop = threading.Event()
+        self._thread = None
+
+    def track(self, execution_id):
+        """Start tracking of execution.
+
+        Args:
+            execution_id (str): execution id
+
+        Returns:
+            ExecutionFuture: future of execution
+        """
+        with self._lock:
+            future = self._futures.get(execution_id)
+            if not future:
+                future = ExecutionFuture(execution_id, self._status)
+                self._futures[execution_id] = future
+
+            # polling thread clears its reference under lock when it exits
+            if self._thread is None:
+                self._stop.clear()
+                self._thread = threading.Thread(target=self._poll,
+                                                name='execution-waiter')
+                self._thread.daemon = True
+                self._thread.start()
+
+        return future
+
+    def stop(self):
+        """Stop polling of executions."""
+        self._stop.set()
+        with self._lock:
+            thread = self._thread
+        if thread:
+            thread.join()
+
+    def _poll(self):
+        errors_count = 0
+        for sleep_seconds in self._policy.sleeps():
+            with self._lock:
+                futures = dict(self._futures)
+                # exit is decided under the same lock as track() checks
+                # thread, so new execution can't be left without polling
+                if self._stop.is_set() or not futures:
+                    self._thread = None
+                    return
+
+            try:
+                self._tick(futures)
+                errors_count = 0
+            except Exception as e:
+                errors_count += 1
+                if errors_count < self._max_errors:
+                    # for ex. transient error of API
+                    LOGGER.warning('Polling of executions is failed',
+                                   exc_info=True)
+                else:
+                    for future in futures.values():
+                        future._resolve(error=e)
+
+            with self._lock:
+                for execution_id, future in futures.items():
+                    if future.done():
+                        self._futures.pop(execution_id, None)
+
+            self._stop.wait(sleep_seconds)
+
+    def _list_executions(self, futures):
+        executions = {}
+        times_created = [future.time_created for future in futures.values()]
+        # executions created before all tracked ones aren't needed
+        oldest_time = (min(times_created) if None not in times_created
+                       else None)
+        page = 1
+        while True:
+            items = self._client.get_executions(
+                page=page, per_page=self._per_page,
+                sort_by={'time_created': 'desc'})['items']
+            for execution in items:
+                executions[execution['id']] = execution
+
+            if (len(items) < self._per_page or
+                    all(execution_id in executions
+                        for execution_id in futures) or
+                    (oldest_time is not None and
+                     items[-1].get('time_created') < oldest_time)):
+                return executions
+            page += 1
+
+    def _tick(self, futures):
+        executions = self._list_executions(futures)
+
+        for execution_id, future in futures.items():
+            execution = executions.get(execution_id)
+            if execution is None:
+                execution = self._client.get_execution(execution_id)
+
+            future._update(execution)
+            if future.state == self._status:
+                future._resolve(execution)
+            elif future.state == self._failure_status:
+                future._resolve(execution, error=AssertionError(
+                    "Execution {!r} is {!r}".format(execution_id,
+                                                    future.state)))
@@ -0,0 +1,462 @@
+"""
+----------------
+Fake Decapod API
+----------------
+"""
+
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or
+# implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import copy
+import functools
+import inspect
+import json
+import random
+import threading
+import time
+import uuid
+
+from decapodlib import exceptions
+import requests
+
+from whale import config
+from whale import timing
+
+__all__ = [
+    'FakeDecapodClient'
+]
+
+PERMISSIONS = [
+    {'name': config.PERMISSIONS_GROUP_API,
+     'permissions': ['create_cluster', 'create_execution',
+                     'create_playbook_configuration', 'create_role',
+                     'create_server', 'create_user', 'delete_cluster',
+                     'delete_execution', 'delete_playbook_configuration',
+                     'delete_role', 'delete_server', 'delete_user',
+                     'edit_cluster', 'edit_playbook_configuration',
+                     'edit_role', 'edit_server', 'edit_user',
+                     'view_cluster', 'view_cluster_versions',
+                     'view_execution', 'view_execution_steps',
+                     'view_execution_version', 'view_playbook_configuration',
+                     'view_playbook_configuration_version', 'view_role',
+                     'view_role_versions', 'view_server',
+                     'view_server_versions', 'view_user',
+                     'view_user_versions']},
+    {'name': config.PERMISSIONS_GROUP_PLAYBOOK,
+     'permissions': [config.PLAYBOOK_ADD_MONITOR,
+                     config.PLAYBOOK_ADD_OSD,
+                     config.PLAYBOOK_ADD_RADOS_GATEWAY,
+                     config.PLAYBOOK_ADD_REST_API,
+                     config.PLAYBOOK_CINDER_INTEGRATON,
+                     config.PLAYBOOK_DEPLOY_CLUSTER,
+                     config.PLAYBOOK_PURGE_CLUSTER,
+                     config.PLAYBOOK_TELEGRAF_REMOVAL,
+                     config.PLAYBOOK_REMOVE_MONITOR,
+                     config.PLAYBOOK_REMOVE_OSD,
+                     config.PLAYBOOK_REMOVE_RADOS_GATEWAY,
+                     config.PLAYBOOK_REMOVE_REST_API,
+                     config.PLAYBOOK_TELEGRAF_INTEGRATION,
+                     config.PLAYBOOK_UPGRADE_CEPH]},
+]
+
+# playbook id: (cluster role, flag whether servers are added to role)
+ROLE_PLAYBOOKS = {
+    config.PLAYBOOK_ADD_OSD: ('osds', True),
+    config.PLAYBOOK_REMOVE_OSD: ('osds', False),
+    config.PLAYBOOK_ADD_MONITOR: ('mons', True),
+    config.PLAYBOOK_REMOVE_MONITOR: ('mons', False),
+    config.PLAYBOOK_ADD_REST_API: ('restapis', True),
+    config.PLAYBOOK_REMOVE_REST_API: ('restapis', False),
+    config.PLAYBOOK_ADD_RADOS_GATEWAY: ('rgws', True),
+    config.PLAYBOOK_REMOVE_RADOS_GATEWAY: ('rgws', False),
+}
+
+EXECUTION_STARTED = 'started'
+
+
+def _api_methods(cls):
+    # measure calls like calls of real client are measured
+    def _wrap(name, method):
+        @functools.wraps(method)
+        def _call(*args, **kwargs):
+            with timing.span(name, timing.API):
+                return method(*args, **kwargs)
+        return _call
+
+    for name, attr in list(vars(cls).items()):
+        if not name.startswith('_') and inspect.isfunction(attr):
+            setattr(cls, name, _wrap(name, attr))
+    return cls
+
+
+def _error(status_code, message):
+    response = requests.Response()
+    response.status_code = status_code
+    response._content = json.dumps({
+        'code': status_code,
+        'error': 'FakeError',
+        'message': message,
+    }).encode('utf-8')
+    return exceptions.DecapodAPIError(response)
+
+
+@_api_methods
+class FakeDecapodClient(object):
+    """In-memory fake of Decapod V1 API client.
+
+    It keeps models of all resources in memory and implements methods of
+    ``decapodlib`` V1 client which are used by steps. Executions last
+    simulated time, fail with simulated rate and change cluster topology
+    like real playbooks do.
+    """
+
+    def __init__(self, servers_count=config.FAKE_SERVERS_COUNT,
+                 execution_duration=config.FAKE_EXECUTION_DURATION,
+                 execution_failure_rate=config.FAKE_EXECUTION_FAILURE_RATE):
+        """Constructor.
+
+        Args:
+            servers_count (int): count of servers discovered initially
+            execution_duration (float): seconds which execution lasts
+            execution_failure_rate (float): ratio of failed executions
+        """
+        self._execution_duration = execution_duration
+        self._execution_failure_rate = execution_failure_rate
+        self._lock = threading.RLock()
+        self._models = {}
+        self._pending = {}
+
+        for index in range(servers_count):
+            self.create_server(server_id=str(uuid.uuid4()),
+                               host='10.0.0.{}'.format(index + 10),
+                               username='ansible')
+
+    def _collection(self, model_type):
+        return self._models.setdefault(model_type, {})
+
+    def _create(self, model_type, data, model_id=None):
+        model = {
+            'id': model_id or str(uuid.uuid4()),
+            'model': model_type,
+            'version': 1,
+            'initiator_id': None,
+            'time_created': time.time(),
+            'time_updated': time.time(),
+            'time_deleted': 0,
+            'data': data,
+        }
+        with self._lock:
+            self._collection(model_type)[model['id']] = model
+        return copy.deepcopy(model)
+
+    def _get(self, model_type, model_id, deleted=True):
+        with self._lock:
+            self._complete_executions()
+            model = self._collection(model_type).get(model_id)
+            if model is None or (model['time_deleted'] and not deleted):
+                raise _error(404, 'Cannot find {} {}'.format(
+                    model_type, model_id))
+            return copy.deepcopy(model)
+
+    def _list(self, model_type, page=None, per_page=None, sort_by=None,
+              **kwargs):
+        with self._lock:
+            self._complete_executions()
+            models = copy.deepcopy([
+                model for model in self._collection(model_type).values()
+                if not model['time_deleted']])
+
+        for field, order in (sort_by or {'time_created': 'asc'}).items():
+            models.sort(key=lambda model: model.get(field),
+                        reverse=order == 'desc')
+
+        total = len(models)
+        if page and per_page:
+            models = models[(page - 1) * per_page:page * per_page]
+
+        return {
+            'items': models,
+            'page': page or 1,
+            'per_page': per_page or total,
+            'total': total,
+        }
+
+    def _update(self, model_type, model):
+        with self._lock:
+            stored = self._collection(model_type).get(model['id'])
+            if stored is None or stored['time_deleted']:
+                raise _error(404, 'Cannot find {} {}'.format(
+                    model_type, model['id']))
+            stored['data'] = copy.deepcopy(model['data'])
+            stored['version'] += 1
+            stored['time_updated'] = time.time()
+            return copy.deepcopy(stored)
+
+    def _delete(self, model_type, model_id):
+        with self._lock:
+            model = self._collection(model_type).get(model_id)
+            if model is None or model['time_deleted']:
+                raise _error(404, 'Cannot find {} {}'.format(
+                    model_type, model_id))
+            model['time_deleted'] = time.time()
+            return copy.deepcopy(model)
+
+    def _complete_executions(self):
+        now = time.time()
+        for execution_id, (finish_at, failed) in list(self._pending.items()):
+            if finish_at > now:
+                continue
+
+            del self._pending[execution_id]
+            execution = self._collection('execution')[execution_id]
+            if failed:
+                execution['data']['state'] = config.EXECUTION_FAILED_STATUS
+            else:
+                execution['data']['state'] = config.EXECUTION_COMPLETED_STATUS
+                self._apply_playbook(
+                    execution['data']['playbook_configuration']['id'])
+
+    def _apply_playbook(self, playbook_config_id):
+        playbook_config = self._collection(
+            'playbook_configuration')[playbook_config_id]['data']
+        cluster = self._collection('cluster')[playbook_config['cluster_id']]
+        configuration = cluster['data']['configuration']
+        servers = self._collection('server')
+        server_ids = playbook_config['server_list']
+        playbook_id = playbook_config['playbook_id']
+
+        if playbook_id == config.PLAYBOOK_DEPLOY_CLUSTER:
+            configuration['mons'] = [{'server_id': server_ids[0]}]
+            configuration['osds'] = [{'server_id': server_id}
+                                     for server_id in server_ids[1:]]
+        elif playbook_id == config.PLAYBOOK_PURGE_CLUSTER:
+            configuration.clear()
+            cluster['time_deleted'] = time.time()
+        elif playbook_id in ROLE_PLAYBOOKS:
+            role, is_added = ROLE_PLAYBOOKS[playbook_id]
+            nodes = [node for node in configuration.get(role, [])
+                     if node['server_id'] not in server_ids]
+            if is_added:
+                nodes.extend({'server_id': server_id}
+                             for server_id in server_ids)
+            configuration[role] = nodes
+            if not nodes:
+                del configuration[role]
+
+        busy_ids = set(node['server_id']
+                       for nodes in configuration.values() for node in nodes)
+        for server in servers.values():
+            if server['id'] in busy_ids:
+                server['data']['cluster_id'] = cluster['id']
+            elif server['data']['cluster_id'] == cluster['id']:
+                server['data']['cluster_id'] = None
+
+    # Auth
+
+    def login(self, **kwargs):
+        """Get auth token."""
+        return {
+            'id': str(uuid.uuid4()),
+            'model': 'token',
+            'data': {'user': None, 'expires_at': time.time() + 3600},
+        }
+
+    # Clusters
+
+    def create_cluster(self, name, **kwargs):
+        """Create cluster."""
+        return self._create('cluster', {'name': name, 'configuration': {}})
+
+    def get_clusters(self, **kwargs):
+        """Get clusters."""
+        return self._list('cluster', **kwargs)
+
+    def get_cluster(self, cluster_id, **kwargs):
+        """Get cluster."""
+        return self._get('cluster', cluster_id)
+
+    def update_cluster(self, model_data, **kwargs):
+        """Update cluster."""
+        return self._update('cluster', model_data)
+
+    def delete_cluster(self, cluster_id, **kwargs):
+        """Delete cluster."""
+        with self._lock:
+            if self._get('cluster', cluster_id)['data']['configuration']:
+                raise _error(400, 'Cannot delete cluster with servers')
+            return self._delete('cluster', cluster_id)
+
+    # Servers
+
+    def create_server(self, server_id, host, username, **kwargs):
+        """Register server like server discovery does."""
+        with self._lock:
+            self._collection('server').pop(server_id, None)
+        self._create('server', {
+            'name': server_id,
+            'fqdn': server_id,
+            'ip': host,
+            'username': username,
+            'state': 'operational',
+            'cluster_id': None,
+            'facts': {},
+        }, model_id=server_id)
+        return {}
+
+    def get_servers(self, **kwargs):
+        """Get servers."""
+        return self._list('server', **kwargs)
+
+    def get_server(self, server_id, **kwargs):
+        """Get server."""
+        return self._get('server', server_id, deleted=False)
+
+    def put_server(self, model_data, **kwargs):
+        """Update server."""
+        return self._update('server', model_data)
+
+    def delete_server(self, server_id, **kwargs):
+        """Delete server."""
+        return self._delete('server', server_id)
+
+    # Users
+
+    def create_user(self, login, email, full_name='', role_id=None,
+                    **kwargs):
+        """Create user."""
+        return self._create('user', {
+            'login': login,
+            'email': email,
+            'full_name': full_name,
+            'role_id': role_id,
+        })
+
+    def get_users(self, **kwargs):
+        """Get users."""
+        return self._list('user', **kwargs)
+
+    def get_user(self, user_id, **kwargs):
+        """Get user."""
+        return self._get('user', user_id)
+
+    def update_user(self, model_data, **kwargs):
+        """Update user."""
+        return self._update('user', model_data)
+
+    def delete_user(self, user_id, **kwargs):
+        """Delete user."""
+        return self._delete('user', user_id)
+
+    # Roles
+
+    def create_role(self, name, permissions, **kwargs):
+        """Create role."""
+        return self._create('role', {
+            'name': name,
+            'permissions': copy.deepcopy(permissions),
+        })
+
+    def get_roles(self, **kwargs):
+        """Get roles."""
+        return self._list('role', **kwargs)
+
+    def get_role(self, role_id, **kwargs):
+        """Get role."""
+        return self._get('role', role_id)
+
+    def update_role(self, model_data, **kwargs):
+        """Update role."""
+        return self._update('role', model_data)
+
+    def delete_role(self, role_id, **kwargs):
+        """Delete role."""
+        return self._delete('role', role_id)
+
+    def get_permissions(self, **kwargs):
+        """Get permissions."""
+        return {'items': copy.deepcopy(PERMISSIONS)}
+
+    # Playbooks
+
+    def get_playbooks(self, **kwargs):
+        """Get playbooks."""
+        playbook_ids = sorted(PERMISSIONS[1]['permissions'])
+        return {'items': [{'id': playbook_id,
+                           'name': playbook_id,
+                           'description': playbook_id,
+                           'required_server_list': (
+                               playbook_id != config.PLAYBOOK_PURGE_CLUSTER),
+                           'hints': []}
+                          for playbook_id in playbook_ids]}
+
+    # Playbook configurations
+
+    def create_playbook_configuration(self, name, cluster_id, playbook_id,
+                                      server_ids, hints=None, **kwargs):
+        """Create playbook configuration."""
+        self._get('cluster', cluster_id, deleted=False)
+        return self._create('playbook_configuration', {
+            'name': name,
+            'cluster_id': cluster_id,
+            'playbook_id': playbook_id,
+            'server_list': list(server_ids),
+            'hints': hints or [],
+            'configuration': {'global_vars': {}, 'inventory': {}},
+        })
+
+    def get_playbook_configurations(self, **kwargs):
+        """Get playbook configurations."""
+        return self._list('playbook_configuration', **kwargs)
+
+    def get_playbook_configuration(self, playbook_configuration_id,
+                                   **kwargs):
+        """Get playbook configuration."""
+        return self._get('playbook_configuration', playbook_configuration_id)
+
+    def update_playbook_configuration(self, model_data, **kwargs):
+        """Update playbook configuration."""
+        return self._update('playbook_configuration', model_data)
+
+    def delete_playbook_configuration(self, playbook_configuration_id,
+                                      **kwargs):
+        """Delete playbook configuration."""
+        return self._delete('playbook_configuration',
+                            playbook_configuration_id)
+
+    # Executions
+
+    def create_execution(self, playbook_configuration_id,
+                         playbook_configuration_version, **kwargs):
+        """Create execution, which finishes after simulated duration."""
+        with self._lock:
+            self._get('playbook_configuration', playbook_configuration_id,
+                      deleted=False)
+            execution = self._create('execution', {
+                'playbook_configuration': {
+                    'id': playbook_configuration_id,
+                    'version': playbook_configuration_version,
+                },
+                'state': EXECUTION_STARTED,
+            })
+            failed = random.random() < self._execution_failure_rate
+            self._pending[execution['id']] = (
+                time.time() + self._execution_duration, failed)
+        return execution
+
+    def get_executions(self, **kwargs):
+        """Get executions."""
+        return self._list('execution', **kwargs)
+
+    def get_execution(self, execution_id, **kwargs):
+        """Get execution."""
+        return self._get('execution', execution_id)
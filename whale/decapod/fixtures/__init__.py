@@ -21,21 +21,28 @@ Decapod fixtures
 from .clusters import *  # noqa
 from .decapod import *  # noqa
 from .executions import *  # noqa
+from .ledger import *  # noqa
 from .playbooks import *  # noqa
 from .playbook_configs import *  # noqa
 from .roles import *  # noqa
 from .users import *  # noqa
 from .servers import *  # noqa
+from .teardown import *  # noqa
 
 __all__ = sorted([  # sort for documentation
     'get_decapod_client',
     'decapod_client',
 
+    'resource_ledger',
+    'resource_teardown',
+    'wait_resource_teardown',
+
     'get_playbook_steps',
     'playbook_steps',
 
     'get_playbook_config_steps',
     'playbook_config_steps',
+    'deploy_hints',
     'playbook_config_deploy',
     'cleanup_playbook_configs',
 
@@ -56,6 +63,7 @@ __all__ = sorted([  # sort for documentation
     'cluster_steps',
     'delete_cluster',
     'cluster',
+    'cluster_pool',
     'deploy_cluster',
     'cleanup_clusters',
 
@@ -20,30 +20,36 @@ Cluster fixtures
 import pytest
 
 from whale import config
+from whale.decapod import cluster_pool as pool
 from whale.decapod import steps
+from whale.decapod import teardown
+from whale import ledger
 
 __all__ = [
     'get_cluster_steps',
     'cluster_steps',
     'delete_cluster',
     'cluster',
+    'cluster_pool',
     'deploy_cluster',
     'cleanup_clusters',
 ]
 
 
 @pytest.fixture(scope="session")
-def get_cluster_steps(get_decapod_client):
+def get_cluster_steps(get_decapod_client, resource_ledger):
     """Callable session fixture to get cluster steps.
 
     Args:
         get_decapod_client (function): function to get decapod client
+        resource_ledger (ResourceLedger): ledger of created resources
 
     Returns:
         function: function to get cluster steps
     """
     def _get_cluster_steps():
-        return steps.ClusterSteps(get_decapod_client())
+        return steps.ClusterSteps(get_decapod_client(),
+                                  ledger=resource_ledger)
 
     return _get_cluster_steps
 
@@ -60,12 +66,10 @@ def cluster_steps(get_cluster_steps, cleanup_clusters):
         ClusterSteps: instantiated cluster steps
     """
     _cluster_steps = get_cluster_steps()
-    clusters = _cluster_steps.get_clusters(check=False)
-    clusters_ids_before = {cluster['id'] for cluster in clusters}
 
     yield _cluster_steps
 
-    cleanup_clusters(_cluster_steps, uncleanable_ids=clusters_ids_before)
+    cleanup_clusters(_cluster_steps)
 
 
 @pytest.fixture
@@ -87,30 +91,16 @@ def delete_cluster(get_cluster_steps,
     Returns:
         function: function to delete cluster
     """
-    def _delete_cluster(cluster_id):
+    def _delete_cluster(cluster_id, check=True):
         _cluster_steps = get_cluster_steps()
 
         cluster = _cluster_steps.get_cluster(cluster_id)
         if cluster['data']['configuration']:
             # cluster has servers
-            if 'osds' in cluster['data']['configuration']:
-                # we can't remove cluster with osd
-                server_ids = [
-                    server['server_id']
-                    for server in cluster['data']['configuration']['osds']
-                ]
-                osd_config = playbook_config_steps.create_playbook_config(
-                    cluster['id'],
-                    config.PLAYBOOK_REMOVE_OSD,
-                    server_ids=server_ids)
-                execution_steps.create_execution(osd_config['id'])
-
-            cluster_config = playbook_config_steps.create_playbook_config(
-                cluster['id'], config.PLAYBOOK_PURGE_CLUSTER)
-            execution_steps.create_execution(cluster_config['id'])
+            pool.purge_cluster(cluster, playbook_config_steps, execution_steps)
         else:
             # cluster doesn't have servers
-            _cluster_steps.delete_cluster(cluster_id)
+            _cluster_steps.delete_cluster(cluster_id, check=check)
 
     return _delete_cluster
 
@@ -128,38 +118,95 @@ def cluster(cluster_steps):
     return cluster_steps.create_cluster()
 
 
+@pytest.fixture(scope='session')
+def cluster_pool(get_decapod_client):
+    """Session fixture to get pool of deployed clusters.
+
+    Pool uses its own steps, which don't record resources to ledger, so
+    pooled clusters are never deleted by cleanup fixtures.
+
+    Args:
+        get_decapod_client (function): function to get decapod client
+
+    Yields:
+        ClusterPool: pool of deployed clusters
+    """
+    client = get_decapod_client()
+    _cluster_pool = pool.ClusterPool(steps.ClusterSteps(client),
+                                     steps.ServerSteps(client),
+                                     steps.PlaybookConfigSteps(client),
+                                     steps.ExecutionSteps(client))
+
+    yield _cluster_pool
+
+    _cluster_pool.close()
+
+
 @pytest.fixture
-def deploy_cluster(cluster_steps, playbook_config_deploy, execution_steps):
+def deploy_cluster(request, deploy_hints, get_cluster_steps):
     """Fixture to create and deploy cluster before test.
 
+    If ``CLUSTER_POOL`` is defined, cluster is leased from session pool
+    and returned back after test. Test which changes cluster state without
+    changing its topology should be marked with ``dirty_cluster`` to
+    redeploy cluster after it.
+
     Args:
-        cluster_steps (obj): instantiated cluster steps
-        playbook_config_deploy (dict): created playbook configuration
-            to deploy cluster
-        execution_steps (obj): instantiated execution steps
+        request (obj): pytest SubRequest instance
+        deploy_hints (dict): hints to deploy cluster with
+        get_cluster_steps (function): function to get cluster steps
 
-    Returns:
+    Yields:
         dict: model of the cluster
     """
-    execution_steps.create_execution(playbook_config_deploy['id'])
-    return cluster_steps.get_cluster(
-        playbook_config_deploy['data']['cluster_id'])
+    if not config.CLUSTER_POOL:
+        playbook_config_deploy = request.getfixturevalue(
+            'playbook_config_deploy')
+        execution_steps = request.getfixturevalue('execution_steps')
+
+        execution_steps.create_execution(playbook_config_deploy['id'])
+        yield get_cluster_steps().get_cluster(
+            playbook_config_deploy['data']['cluster_id'])
+        return
+
+    _cluster_pool = request.getfixturevalue('cluster_pool')
+    cluster = _cluster_pool.lease(deploy_hints)
+
+    yield cluster
+
+    _cluster_pool.release(cluster,
+                          dirty='dirty_cluster' in request.keywords)
 
 
 @pytest.fixture
-def cleanup_clusters(delete_cluster):
+def cleanup_clusters(delete_cluster, resource_ledger, resource_teardown):
     """"Callable session fixture to cleanup clusters.
 
+    Only clusters recorded to ledger by steps are deleted. They are deleted
+    concurrently in background and their absence is checked at once.
+
     Args:
         delete_cluster (function): function to delete cluster
+        resource_ledger (ResourceLedger): ledger of created resources
+        resource_teardown (ResourceTeardown): teardown of resources
 
     Returns:
         function: function to cleanup clusters after tests
     """
-    def _cleanup_clusters(_cluster_steps, uncleanable_ids=None):
-        uncleanable_ids = uncleanable_ids or []
-        for cluster in _cluster_steps.get_clusters(check=False):
-            if cluster['id'] not in uncleanable_ids:
-                delete_cluster(cluster['id'])
+    def _cleanup_clusters(_cluster_steps):
+
+        def _delete_cluster(cluster_id):
+            if _cluster_steps.is_resource_present(cluster_id,
+                                                  _cluster_steps.get_cluster):
+                delete_cluster(cluster_id, check=False)
+
+        def _cleanup():
+            cluster_ids = resource_ledger.pop(
+                ledger.CLUSTERS, getter=_cluster_steps.get_clusters)
+            teardown.delete_resources(cluster_ids, _delete_cluster)
+            _cluster_steps.check_resources_presence(
+                cluster_ids, _cluster_steps.get_cluster, must_present=False)
+
+        resource_teardown.submit(ledger.CLUSTERS, _cleanup)
 
     return _cleanup_clusters
@@ -16,10 +16,12 @@ Decapod fixtures
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
-from decapodlib import client as decapodclient
 import pytest
 
 from whale import config
+from whale.decapod import cassette
+from whale.decapod import client
+from whale.decapod import fake_api
 
 
 __all__ = [
@@ -32,13 +34,37 @@ __all__ = [
 def get_decapod_client():
     """Callable session fixture to get decapod client.
 
+    Client is created once per session and shared by all steps, so they
+    reuse its pooled connections and auth token. If ``DECAPOD_FAKE_API`` is
+    defined, in-memory fake of Decapod API is used instead. If
+    ``DECAPOD_CASSETTE`` is defined, API interactions are recorded or
+    replayed.
+
     Returns:
         function: function to get decapod client
     """
+    clients = []
+
     def _get_decapod_client():
-        return decapodclient.V1Client(url=config.DECAPOD_URL,
-                                      login=config.DECAPOD_LOGIN,
-                                      password=config.DECAPOD_PASSWORD)
+        if not clients:
+            if config.DECAPOD_FAKE_API:
+                _client = fake_api.FakeDecapodClient()
+            else:
+                url, _cassette = config.DECAPOD_URL, None
+                if config.DECAPOD_CASSETTE:
+                    _cassette = cassette.Cassette(
+                        config.DECAPOD_CASSETTE,
+                        mode=config.DECAPOD_CASSETTE_MODE)
+                if config.DECAPOD_REPLAY and not url:
+                    # replay doesn't need real url
+                    url = 'http://localhost'
+                _client = client.DecapodClient(
+                    url=url,
+                    login=config.DECAPOD_LOGIN,
+                    password=config.DECAPOD_PASSWORD,
+                    cassette=_cassette)
+            clients.append(_client)
+        return clients[0]
 
     return _get_decapod_client
 
@@ -51,6 +77,6 @@ def decapod_client(get_decapod_client):
         get_decapod_client (function): function to get decapod client
 
     Returns:
-        decapodclient.V1Client: instantiated decapod client
+        DecapodClient: instantiated decapod client
     """
     return get_decapod_client()
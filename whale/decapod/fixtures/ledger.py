@@ -0,0 +1,36 @@
+"""
+------------------------
+Resource ledger fixtures
+------------------------
+"""
+
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or
+# implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import pytest
+
+from whale import ledger
+
+__all__ = [
+    'resource_ledger',
+]
+
+
+@pytest.fixture(scope='session')
+def resource_ledger():
+    """Session fixture to get ledger of resources created by steps.
+
+    Returns:
+        ResourceLedger: ledger of created resources
+    """
+    return ledger.ResourceLedger()
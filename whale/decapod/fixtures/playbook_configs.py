@@ -21,27 +21,32 @@ import pytest
 
 from whale import config
 from whale.decapod import steps
+from whale.decapod import teardown
+from whale import ledger
 
 __all__ = [
     'get_playbook_config_steps',
     'playbook_config_steps',
+    'deploy_hints',
     'playbook_config_deploy',
     'cleanup_playbook_configs',
 ]
 
 
 @pytest.fixture(scope="session")
-def get_playbook_config_steps(get_decapod_client):
+def get_playbook_config_steps(get_decapod_client, resource_ledger):
     """Callable session fixture to get playbook configuration steps.
 
     Args:
         get_decapod_client (function): function to get decapod client
+        resource_ledger (ResourceLedger): ledger of created resources
 
     Returns:
         function: function to get playbook configuration steps
     """
     def _get_steps():
-        return steps.PlaybookConfigSteps(get_decapod_client())
+        return steps.PlaybookConfigSteps(get_decapod_client(),
+                                         ledger=resource_ledger)
 
     return _get_steps
 
@@ -59,24 +64,36 @@ def playbook_config_steps(get_playbook_config_steps, cleanup_playbook_configs):
         PlaybookConfigSteps: instantiated playbook config steps
     """
     _playbook_config_steps = get_playbook_config_steps()
-    configs = _playbook_config_steps.get_playbook_configs(check=False)
-    configs_ids_before = {conf['id'] for conf in configs}
 
     yield _playbook_config_steps
 
-    cleanup_playbook_configs(_playbook_config_steps,
-                             uncleanable_ids=configs_ids_before)
+    cleanup_playbook_configs(_playbook_config_steps)
 
 
 @pytest.fixture
-def playbook_config_deploy(request,
+def deploy_hints(request):
+    """Function fixture to get hints to deploy cluster with.
+
+    Hints may be set via indirect parametrization of this fixture.
+
+    Args:
+        request (obj): pytest SubRequest instance
+
+    Returns:
+        dict: hint IDs and their values
+    """
+    return getattr(request, 'param', {})
+
+
+@pytest.fixture
+def playbook_config_deploy(deploy_hints,
                            cluster,
                            server_steps,
                            playbook_config_steps):
     """Function fixture to create playbook config before test.
 
     Args:
-        request (obj): pytest SubRequest instance
+        deploy_hints (dict): hints to deploy cluster with
         cluster (dict): model of cluster
         server_steps (fixture): fixture to get servers ids
         playbook_config_steps (obj): instantiated playbook config steps
@@ -85,9 +102,8 @@ def playbook_config_deploy(request,
         dict: model of new playbook configuration
     """
     options = {}
-    hints = getattr(request, 'param', [])
-    if hints:
-        options['hints'] = hints
+    if deploy_hints:
+        options['hints'] = deploy_hints
 
     playbook_id = config.PLAYBOOK_DEPLOY_CLUSTER
     server_ids = server_steps.get_server_ids()[0:config.DEPLOY_SERVERS_COUNT]
@@ -99,17 +115,42 @@ def playbook_config_deploy(request,
 
 
 @pytest.fixture(scope='session')
-def cleanup_playbook_configs():
+def cleanup_playbook_configs(resource_ledger, resource_teardown):
     """"Callable session fixture to cleanup playbook configs.
 
+    Only playbook configs recorded to ledger by steps are deleted. They are
+    deleted concurrently in background after clusters, because clusters
+    purging creates new playbook configs, and their absence is checked at
+    once.
+
+    Args:
+        resource_ledger (ResourceLedger): ledger of created resources
+        resource_teardown (ResourceTeardown): teardown of resources
+
     Returns:
         function: function to cleanup playbook configs
     """
-    def _cleanup_playbook_configs(_playbook_config_steps,
-                                  uncleanable_ids=None):
-        uncleanable_ids = uncleanable_ids or []
-        for config in _playbook_config_steps.get_playbook_configs(check=False):
-            if config['id'] not in uncleanable_ids:
-                _playbook_config_steps.delete_playbook_config(config['id'])
+    def _cleanup_playbook_configs(_playbook_config_steps):
+
+        def _delete_playbook_config(playbook_config_id):
+            if _playbook_config_steps.is_resource_present(
+                    playbook_config_id,
+                    _playbook_config_steps.get_playbook_config):
+                _playbook_config_steps.delete_playbook_config(
+                    playbook_config_id, check=False)
+
+        def _cleanup():
+            playbook_config_ids = resource_ledger.pop(
+                ledger.PLAYBOOK_CONFIGS,
+                getter=_playbook_config_steps.get_playbook_configs)
+            teardown.delete_resources(playbook_config_ids,
+                                      _delete_playbook_config)
+            _playbook_config_steps.check_resources_presence(
+                playbook_config_ids,
+                _playbook_config_steps.get_playbook_config,
+                must_present=False)
+
+        resource_teardown.submit(ledger.PLAYBOOK_CONFIGS, _cleanup,
+                                 after=(ledger.CLUSTERS,))
 
     return _cleanup_playbook_configs
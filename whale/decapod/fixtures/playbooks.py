@@ -31,14 +31,20 @@ __all__ = [
 def get_playbook_steps(get_decapod_client):
     """Callable session fixture to get playbook steps.
 
+    Steps are shared during session to reuse catalogue of playbooks.
+
     Args:
         get_decapod_client (function): function to get decapod client
 
     Returns:
         function: function to get playbook steps
     """
+    playbook_steps = []
+
     def _get_playbook():
-        return steps.PlaybookSteps(get_decapod_client())
+        if not playbook_steps:
+            playbook_steps.append(steps.PlaybookSteps(get_decapod_client()))
+        return playbook_steps[0]
 
     return _get_playbook
 
@@ -20,6 +20,8 @@ Role fixtures
 import pytest
 
 from whale.decapod import steps
+from whale.decapod import teardown
+from whale import ledger
 
 __all__ = [
     'get_role_steps',
@@ -30,17 +32,25 @@ __all__ = [
 
 
 @pytest.fixture(scope="session")
-def get_role_steps(get_decapod_client):
+def get_role_steps(get_decapod_client, resource_ledger):
     """Callable session fixture to get role steps.
 
+    Steps are shared during session to reuse permissions catalogue.
+
     Args:
         get_decapod_client (function): function to get decapod client
+        resource_ledger (ResourceLedger): ledger of created resources
 
     Returns:
         function: function to get role steps
     """
+    role_steps = []
+
     def _get_role_steps():
-        return steps.RoleSteps(get_decapod_client())
+        if not role_steps:
+            role_steps.append(
+                steps.RoleSteps(get_decapod_client(), ledger=resource_ledger))
+        return role_steps[0]
 
     return _get_role_steps
 
@@ -57,12 +67,10 @@ def role_steps(get_role_steps, cleanup_roles):
         RoleSteps: instantiated role steps
     """
     _role_steps = get_role_steps()
-    roles = _role_steps.get_roles(check=False)
-    roles_ids_before = {role['id'] for role in roles}
 
     yield _role_steps
 
-    cleanup_roles(_role_steps, uncleanable_ids=roles_ids_before)
+    cleanup_roles(_role_steps)
 
 
 @pytest.fixture
@@ -79,12 +87,32 @@ def role(role_steps):
 
 
 @pytest.fixture(scope='session')
-def cleanup_roles():
-    """"Callable session fixture to cleanup roles."""
-    def _cleanup_roles(_roles_steps, uncleanable_ids=None):
-        uncleanable_ids = uncleanable_ids or []
-        for role in _roles_steps.get_roles(check=False):
-            if role['id'] not in uncleanable_ids:
-                _roles_steps.delete_role(role['id'])
+def cleanup_roles(resource_ledger, resource_teardown):
+    """"Callable session fixture to cleanup roles.
+
+    Only roles recorded to ledger by steps are deleted. They are deleted
+    concurrently in background after users and their absence is checked at
+    once.
+
+    Args:
+        resource_ledger (ResourceLedger): ledger of created resources
+        resource_teardown (ResourceTeardown): teardown of resources
+    """
+    def _cleanup_roles(_roles_steps):
+
+        def _delete_role(role_id):
+            if _roles_steps.is_resource_present(role_id,
+                                                _roles_steps.get_role):
+                _roles_steps.delete_role(role_id, check=False)
+
+        def _cleanup():
+            role_ids = resource_ledger.pop(ledger.ROLES,
+                                           getter=_roles_steps.get_roles)
+            teardown.delete_resources(role_ids, _delete_role)
+            _roles_steps.check_resources_presence(
+                role_ids, _roles_steps.get_role, must_present=False)
+
+        resource_teardown.submit(ledger.ROLES, _cleanup,
+                                 after=(ledger.USERS,))
 
     return _cleanup_roles
@@ -0,0 +1,51 @@
+"""
+--------------------------
+Resource teardown fixtures
+--------------------------
+"""
+
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or
+# implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import pytest
+
+from whale.decapod import teardown
+
+__all__ = [
+    'resource_teardown',
+    'wait_resource_teardown',
+]
+
+
+@pytest.fixture(scope='session')
+def resource_teardown():
+    """Session fixture to get teardown of resources.
+
+    Returns:
+        ResourceTeardown: teardown which cleans resource types in parallel
+    """
+    return teardown.ResourceTeardown()
+
+
+@pytest.fixture(autouse=True)
+def wait_resource_teardown(resource_teardown):
+    """Autouse function fixture to wait resources cleanup after test.
+
+    It's finalized after all other function fixtures, so it waits all
+    cleanups submitted by them.
+
+    Args:
+        resource_teardown (ResourceTeardown): teardown of resources
+    """
+    yield
+    resource_teardown.join()
@@ -20,6 +20,8 @@ User fixtures
 import pytest
 
 from whale.decapod import steps
+from whale.decapod import teardown
+from whale import ledger
 
 __all__ = [
     'get_user_steps',
@@ -30,17 +32,18 @@ __all__ = [
 
 
 @pytest.fixture(scope="session")
-def get_user_steps(get_decapod_client):
+def get_user_steps(get_decapod_client, resource_ledger):
     """Callable session fixture to get users steps.
 
     Args:
         get_decapod_client (function): function to get decapod client.
+        resource_ledger (ResourceLedger): ledger of created resources.
 
     Returns:
         function: function to get users steps.
     """
     def _get_user_steps():
-        return steps.UserSteps(get_decapod_client())
+        return steps.UserSteps(get_decapod_client(), ledger=resource_ledger)
 
     return _get_user_steps
 
@@ -57,12 +60,10 @@ def user_steps(get_user_steps, cleanup_users):
         object: instantiated user steps
     """
     _user_steps = get_user_steps()
-    users = _user_steps.get_users(check=False)
-    users_ids_before = {user['id'] for user in users}
 
     yield _user_steps
 
-    cleanup_users(_user_steps, uncleanable_ids=users_ids_before)
+    cleanup_users(_user_steps)
 
 
 @pytest.fixture
@@ -80,12 +81,31 @@ def user(role, user_steps):
 
 
 @pytest.fixture(scope='session')
-def cleanup_users():
-    """"Callable session fixture to cleanup users."""
-    def _cleanup_users(_users_steps, uncleanable_ids=None):
-        uncleanable_ids = uncleanable_ids or []
-        for user in _users_steps.get_users(check=False):
-            if user['id'] not in uncleanable_ids:
-                _users_steps.delete_user(user['id'])
+def cleanup_users(resource_ledger, resource_teardown):
+    """"Callable session fixture to cleanup users.
+
+    Only users recorded to ledger by steps are deleted. They are deleted
+    concurrently in background and their absence is checked at once.
+
+    Args:
+        resource_ledger (ResourceLedger): ledger of created resources.
+        resource_teardown (ResourceTeardown): teardown of resources.
+    """
+    def _cleanup_users(_users_steps):
+
+        def _delete_user(user_id):
+            if _users_steps.is_resource_present(user_id,
+                                                _users_steps.get_user):
+                _users_steps.delete_user(user_id, check=False)
+
+        def _cleanup():
+            user_ids = resource_ledger.pop(ledger.USERS,
+                                           getter=_users_steps.get_users,
+                                           field_name='login')
+            teardown.delete_resources(user_ids, _delete_user)
+            _users_steps.check_resources_presence(
+                user_ids, _users_steps.get_user, must_present=False)
+
+        resource_teardown.submit(ledger.USERS, _cleanup)
 
     return _cleanup_users
@@ -23,6 +23,7 @@ from stepler.third_party import steps_checker
 from stepler.third_party import utils
 
 from whale import base
+from whale import ledger
 
 __all__ = [
     'ClusterSteps'
@@ -52,6 +53,8 @@ class ClusterSteps(base.BaseSteps):
         cluster_name = cluster_name.replace('-', '')
 
         cluster = self._client.create_cluster(cluster_name, **kwargs)
+        self._record(ledger.CLUSTERS, cluster['id'])
+        self._invalidate(ledger.CLUSTERS)
 
         if check:
             self.check_cluster_presence(cluster['id'])
@@ -81,6 +84,7 @@ class ClusterSteps(base.BaseSteps):
         cluster['data'].update(new_data)
 
         cluster = self._client.update_cluster(cluster, **kwargs)
+        self._invalidate(ledger.CLUSTERS)
 
         if check:
             assert_that(cluster['data'], has_entries(new_data))
@@ -100,6 +104,8 @@ class ClusterSteps(base.BaseSteps):
             TimeoutExpired: if check failed
         """
         self._client.delete_cluster(cluster_id, **kwargs)
+        self._forget(ledger.CLUSTERS, cluster_id)
+        self._invalidate(ledger.CLUSTERS)
 
         if check:
             self.check_cluster_presence(cluster_id, must_present=False)
@@ -178,4 +184,5 @@ class ClusterSteps(base.BaseSteps):
             AssertionError: if check failed
         """
         return self.get_resource_by_field(
-            cluster_name, self.get_clusters, check=check)
+            cluster_name, self.get_clusters, resource_type=ledger.CLUSTERS,
+            check=check)
@@ -17,12 +17,16 @@ Execution steps
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import time
+
 from hamcrest import assert_that, empty, equal_to, is_not, none  # noqa H301
 from stepler.third_party import steps_checker
 from stepler.third_party import waiter
 
 from whale import base
 from whale import config
+from whale.decapod import execution_waiter
+from whale import polling
 
 __all__ = [
     'ExecutionSteps'
@@ -32,6 +36,17 @@ __all__ = [
 class ExecutionSteps(base.BaseSteps):
     """Execution steps."""
 
+    def __init__(self, client, ledger=None):
+        """Constructor.
+
+        Args:
+            client (obj): decapod client
+            ledger (ResourceLedger|None): ledger to record created resources
+        """
+        super(ExecutionSteps, self).__init__(client, ledger=ledger)
+        # latest executions created by steps, keyed by playbook config id
+        self._last_executions = {}
+
     @steps_checker.step
     def create_execution(self,
                          playbook_config_id,
@@ -54,6 +69,7 @@ class ExecutionSteps(base.BaseSteps):
         """
         execution = self._client.create_execution(
             playbook_config_id, playbook_config_version, **kwargs)
+        self._last_executions[playbook_config_id] = execution['id']
 
         if check:
             self.check_resource_presence(execution['id'],
@@ -106,14 +122,23 @@ class ExecutionSteps(base.BaseSteps):
         return execution
 
     @steps_checker.step
-    def get_last_execution_by_config_id(self,
-                                        playbook_config_id,
-                                        check=True,
-                                        **kwargs):
+    def get_last_execution_by_config_id(
+            self,
+            playbook_config_id,
+            per_page=config.EXECUTIONS_PAGE_SIZE,
+            check=True,
+            **kwargs):
         """Step to retrieve new execution by playbook config id.
 
+        Execution created by steps is returned if it's still the newest
+        execution, which is checked with single-item page. Otherwise (for
+        ex. newer execution is started via UI) executions are scanned page
+        by page from newest one until the first execution of playbook
+        config.
+
         Args:
             playbook_config_id (str): playbook config id
+            per_page (int): count of executions per page
             check (bool): flag whether to check step or not
             **kwargs: any suitable keyword arguments
 
@@ -123,12 +148,20 @@ class ExecutionSteps(base.BaseSteps):
         Raises:
             AssertionError: if check failed
         """
-        for execution in self.get_executions(**kwargs):
-            if (execution['data']['playbook_configuration']['id'] ==
-                    playbook_config_id):
-                break
-        else:
-            execution = None
+        execution = None
+        execution_id = self._last_executions.pop(playbook_config_id, None)
+        if execution_id:
+            newest = self._client.get_executions(
+                page=1, per_page=1, sort_by={'time_created': 'desc'},
+                **kwargs)['items']
+            if newest and newest[0]['id'] == execution_id:
+                execution = newest[0]
+
+        if execution is None:
+            execution = self._find_last_execution(playbook_config_id,
+                                                  per_page, **kwargs)
+        if execution:
+            self._last_executions[playbook_config_id] = execution['id']
 
         if check:
             assert_that(execution, is_not(none()))
@@ -157,4 +190,57 @@ class ExecutionSteps(base.BaseSteps):
             assert_that(actual_status, is_not(failure_status))
             return waiter.expect_that(actual_status, equal_to(status))
 
-        waiter.wait(_check_execution_status, timeout_seconds=timeout)
+        polling.wait(_check_execution_status, timeout_seconds=timeout,
+                     policy=polling.EXECUTION_POLICY)
+
+    @steps_checker.step
+    def wait_executions(self, execution_ids,
+                        status=config.EXECUTION_COMPLETED_STATUS,
+                        failure_status=config.EXECUTION_FAILED_STATUS,
+                        timeout=config.EXECUTION_COMPLETED_TIMEOUT,
+                        policy=polling.EXECUTION_POLICY):
+        """Step to wait for finish of several executions at once.
+
+        Args:
+            execution_ids (list): execution ids
+            status (str): expected status of executions
+            failure_status (str): status to fail waiting
+            timeout (int): seconds to wait for finish of executions
+            policy (PollingPolicy): policy of sleeps between polling ticks
+
+        Returns:
+            list: finished futures of executions with time of their states
+
+        Raises:
+            TimeoutExpired|AssertionError: if any execution isn't finished
+                with expected status
+        """
+        _waiter = execution_waiter.ExecutionWaiter(
+            self._client, status=status, failure_status=failure_status,
+            policy=policy)
+        futures = [_waiter.track(execution_id)
+                   for execution_id in execution_ids]
+        deadline = time.time() + timeout
+
+        try:
+            for future in futures:
+                future.result(max(deadline - time.time(), 0))
+            return futures
+        finally:
+            _waiter.stop()
+
+    def _find_last_execution(self, playbook_config_id, per_page, **kwargs):
+        page = 1
+        while True:
+            executions = self._client.get_executions(
+                page=page, per_page=per_page,
+                sort_by={'time_created': 'desc'}, **kwargs)['items']
+
+            for execution in executions:
+                if (execution['data']['playbook_configuration']['id'] ==
+                        playbook_config_id):
+                    return execution
+
+            if len(executions) < per_page:
+                return None
+            page += 1
@@ -23,6 +23,7 @@ from stepler.third_party import steps_checker
 from stepler.third_party import utils
 
 from whale import base
+from whale import ledger
 
 __all__ = [
     'PlaybookConfigSteps'
@@ -58,6 +59,7 @@ class PlaybookConfigSteps(base.BaseSteps):
 
         playbook_config = self._client.create_playbook_configuration(
             name, cluster_id, playbook_id, server_ids, hints=hints, **kwargs)
+        self._record(ledger.PLAYBOOK_CONFIGS, playbook_config['id'])
 
         if check:
             self.check_resource_presence(
@@ -159,6 +161,7 @@ class PlaybookConfigSteps(base.BaseSteps):
         """
         playbook_config = self._client.delete_playbook_configuration(
             playbook_config_id, **kwargs)
+        self._forget(ledger.PLAYBOOK_CONFIGS, playbook_config_id)
 
         if check:
             self.check_resource_presence(
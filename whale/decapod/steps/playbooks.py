@@ -28,11 +28,27 @@ __all__ = [
 
 
 class PlaybookSteps(base.BaseSteps):
-    """Playbook steps."""
+    """Playbook steps.
+
+    Playbooks are plugins of Decapod and don't change during test session,
+    so steps keep catalogue of playbooks to get them by id without requests.
+    """
+
+    def __init__(self, client, ledger=None):
+        """Constructor.
+
+        Args:
+            client (obj): decapod client
+            ledger (ResourceLedger|None): ledger to record created resources
+        """
+        super(PlaybookSteps, self).__init__(client, ledger=ledger)
+        self._catalogue = None
 
     def get_playbooks(self, check=True, **kwargs):
         """Step to get all available playbooks.
 
+        Catalogue of playbooks is refreshed with retrieved playbooks.
+
         Args:
             check (bool): flag whether to check step or not
             **kwargs: any suitable keyword arguments
@@ -44,6 +60,9 @@ class PlaybookSteps(base.BaseSteps):
             AssertionError: if check failed
         """
         playbooks = self._client.get_playbooks(**kwargs)['items']
+        if not kwargs:
+            self._catalogue = {playbook['id']: playbook
+                               for playbook in playbooks}
         if check:
             assert_that(playbooks, is_not(empty()))
         return playbooks
@@ -51,6 +70,8 @@ class PlaybookSteps(base.BaseSteps):
     def get_playbook(self, playbook_id, check=True, **kwargs):
         """Step to get a playbook by its id.
 
+        Playbook is taken from catalogue, which is retrieved once.
+
         Args:
             playbook_id (str): id of playbook
             check (bool): flag whether to check step or not
@@ -62,15 +83,25 @@ class PlaybookSteps(base.BaseSteps):
         Raises:
             AssertionError: if check failed
         """
-        playbooks = self.get_playbooks(**kwargs)
-
-        for playbook in playbooks:
-            if playbook['id'] == playbook_id:
-                break
+        if kwargs:
+            playbooks = {playbook['id']: playbook
+                         for playbook in self.get_playbooks(**kwargs)}
         else:
-            playbook = None
+            if self._catalogue is None:
+                self.refresh_playbooks()
+            playbooks = self._catalogue
+
+        playbook = playbooks.get(playbook_id)
 
         if check:
             assert_that(playbook, is_not(none()))
 
         return playbook
+
+    def refresh_playbooks(self):
+        """Step to refresh catalogue of playbooks.
+
+        Returns:
+            list: list of all playbooks
+        """
+        return self.get_playbooks()
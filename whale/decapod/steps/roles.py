@@ -17,6 +17,8 @@ Role steps
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import copy
+
 from hamcrest import (assert_that, empty, equal_to, has_entries,
                       is_in, is_not)  # noqa H301
 from stepler.third_party import steps_checker
@@ -25,6 +27,8 @@ from stepler.third_party import waiter
 
 from whale import base
 from whale import config
+from whale import ledger
+from whale import polling
 
 __all__ = [
     'RoleSteps'
@@ -32,7 +36,21 @@ __all__ = [
 
 
 class RoleSteps(base.BaseSteps):
-    """Role steps."""
+    """Role steps.
+
+    Permissions catalogue doesn't change during test session, so steps keep
+    it after the first retrieval.
+    """
+
+    def __init__(self, client, ledger=None):
+        """Constructor.
+
+        Args:
+            client (obj): decapod client
+            ledger (ResourceLedger|None): ledger to record created resources
+        """
+        super(RoleSteps, self).__init__(client, ledger=ledger)
+        self._permissions = None
 
     @steps_checker.step
     def create_role(self, role_name=None, permissions=None, check=True,
@@ -52,9 +70,11 @@ class RoleSteps(base.BaseSteps):
             TimeoutExpired: if check failed after timeout
         """
         role_name = role_name or next(utils.generate_ids('role'))
-        permissions = permissions or self.get_permissions()
+        permissions = permissions or self.get_permission_catalogue()
 
         role = self._client.create_role(role_name, permissions, **kwargs)
+        self._record(ledger.ROLES, role['id'])
+        self._invalidate(ledger.ROLES)
 
         if check:
             self.check_resource_presence(role['id'], self._client.get_role)
@@ -86,6 +106,7 @@ class RoleSteps(base.BaseSteps):
         role['data'].update(new_data)
 
         role = self._client.update_role(role, **kwargs)
+        self._invalidate(ledger.ROLES)
 
         if check:
             assert_that(role['data'], has_entries(new_data))
@@ -105,6 +126,8 @@ class RoleSteps(base.BaseSteps):
             TimeoutExpired: if check failed
         """
         self._client.delete_role(role_id, **kwargs)
+        self._forget(ledger.ROLES, role_id)
+        self._invalidate(ledger.ROLES)
 
         if check:
             self.check_resource_presence(role_id, self._client.get_role,
@@ -165,7 +188,9 @@ class RoleSteps(base.BaseSteps):
             AssertionError: if check failed
         """
         return self.get_resource_by_field(role_name, self.get_roles,
-                                          field_name='name', check=check)
+                                          field_name='name',
+                                          resource_type=ledger.ROLES,
+                                          check=check)
 
     @steps_checker.step
     def get_role_permissions_by_group(self, role_id, group_name, check=True):
@@ -229,12 +254,14 @@ class RoleSteps(base.BaseSteps):
 
             return waiter.expect_that(permission, matcher)
 
-        waiter.wait(_check_role_permission_presence, timeout_seconds=timeout)
+        polling.wait(_check_role_permission_presence, timeout_seconds=timeout)
 
     @steps_checker.step
     def get_permissions(self, check=True, **kwargs):
         """Step to retrieve permissions.
 
+        Permissions catalogue is refreshed with retrieved permissions.
+
         Args:
             check (bool): flag whether to check step or not
             **kwargs: any suitable keyword arguments
@@ -243,8 +270,23 @@ class RoleSteps(base.BaseSteps):
             list: a list of permissions
         """
         permissions = self._client.get_permissions(**kwargs)['items']
+        if not kwargs:
+            self._permissions = permissions
 
         if check:
             assert_that(permissions, is_not(empty()))
 
         return permissions
+
+    @steps_checker.step
+    def get_permission_catalogue(self):
+        """Step to get permissions catalogue, which is retrieved once.
+
+        Returns:
+            list: a list of permissions
+        """
+        if self._permissions is None:
+            self.get_permissions()
+
+        # role steps may modify permissions passed to them
+        return copy.deepcopy(self._permissions)
@@ -20,8 +20,10 @@ Servers steps
 from hamcrest import (assert_that, empty, equal_to, has_entries,
                       is_not)  # noqa H301
 from stepler.third_party import steps_checker
+from stepler.third_party import waiter
 
 from whale import base
+from whale import polling
 
 __all__ = [
     'ServerSteps'
@@ -44,7 +46,8 @@ class ServerSteps(base.BaseSteps):
             **kwargs: any suitable keyword arguments
 
         Returns:
-            dict: model of new server
+            dict: model of new server or empty dict if check is skipped,
+                because server is registered asynchronously
 
         Raises:
             TimeoutExpired|AssertionError: if check was triggered to an error
@@ -63,7 +66,7 @@ class ServerSteps(base.BaseSteps):
             assert_that(server['data']['ip'], equal_to(server_ip))
             assert_that(server['data']['username'], equal_to(username))
 
-        return server or self.get_server(server_id)
+        return server
 
     @steps_checker.step
     def delete_server(self, server_id, check=True, **kwargs):
@@ -83,6 +86,36 @@ class ServerSteps(base.BaseSteps):
             self.check_resource_presence(server_id, self._client.get_server,
                                          must_present=False, timeout=60)
 
+    @steps_checker.step
+    def check_servers_presence(self, server_ids, must_present=True,
+                               timeout=0):
+        """Step to check that several servers are present.
+
+        Servers are checked with single request to list servers per polling
+        tick, whatever count of servers is checked.
+
+        Args:
+            server_ids (list): server ids
+            must_present (bool): flag whether servers should be present or
+                not
+            timeout (int): seconds to wait a result of check
+
+        Raises:
+            TimeoutExpired: if check failed after timeout
+        """
+        server_ids = set(server_ids)
+
+        def _check_servers_presence():
+            present_ids = {server['id']
+                           for server in self.get_servers(check=False)}
+            if must_present:
+                unexpected_ids = server_ids - present_ids
+            else:
+                unexpected_ids = server_ids & present_ids
+            return waiter.expect_that(sorted(unexpected_ids), empty())
+
+        polling.wait(_check_servers_presence, timeout_seconds=timeout)
+
     @steps_checker.step
     def get_servers(self, vacant_only=False, busy_only=False, check=True,
                     **kwargs):
@@ -23,6 +23,7 @@ from stepler.third_party import steps_checker
 from stepler.third_party import utils
 
 from whale import base
+from whale import ledger
 
 __all__ = [
     'UserSteps'
@@ -59,6 +60,8 @@ class UserSteps(base.BaseSteps):
                                         full_name=user_full_name,
                                         role_id=role_id,
                                         **kwargs)
+        self._record(ledger.USERS, user['id'])
+        self._invalidate(ledger.USERS)
 
         if check:
             self.check_resource_presence(user['id'], self._client.get_user)
@@ -90,6 +93,7 @@ class UserSteps(base.BaseSteps):
             user = self.get_user(user)
         user['data'].update(new_data)
         user = self._client.update_user(user, **kwargs)
+        self._invalidate(ledger.USERS)
         if check:
             assert_that(user['data'], has_entries(new_data))
         return user
@@ -124,6 +128,8 @@ class UserSteps(base.BaseSteps):
             **kwargs: any suitable keyword arguments
         """
         self._client.delete_user(user_id, **kwargs)
+        self._forget(ledger.USERS, user_id)
+        self._invalidate(ledger.USERS)
 
         if check:
             self.check_resource_presence(user_id, self._client.get_user,
@@ -165,4 +171,6 @@ class UserSteps(base.BaseSteps):
             AssertionError: if check failed
         """
         return self.get_resource_by_field(user_login, self.get_users,
-                                          field_name='login', check=check)
+                                          field_name='login',
+                                          resource_type=ledger.USERS,
+                                          check=check)
@@ -0,0 +1,141 @@
+"""
+-----------------
+Resource teardown
+-----------------
+"""
+
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or
+# implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from multiprocessing.pool import ThreadPool
+import threading
+
+from whale import config
+
+__all__ = [
+    'ResourceTeardown',
+    'delete_resources',
+]
+
+
+def delete_resources(resource_ids, delete, workers=config.TEARDOWN_WORKERS):
+    """Delete resources concurrently via bounded pool of workers.
+
+    Args:
+        resource_ids (list): ids of resources to delete
+        delete (function): function to delete resource by its id
+        workers (int): max count of concurrent deletions
+
+    Raises:
+        Exception: first error raised by any deletion
+    """
+    if not resource_ids:
+        return
+
+    pool = ThreadPool(min(workers, len(resource_ids)))
+    try:
+        pool.map(delete, resource_ids)
+    finally:
+        pool.close()
+        pool.join()
+
+
+class _Job(threading.Thread):
+
+    def __init__(self, resource, cleanup, after):
+        super(_Job, self).__init__()
+        self.daemon = True
+        self.error = None
+        self.resource = resource
+        self.after = after
+        self.dependencies = []
+        self._cleanup = cleanup
+
+    def run(self):
+        for dependency in self.dependencies:
+            dependency.join()
+
+        try:
+            self._cleanup()
+        except Exception as e:
+            self.error = e
+
+
+class ResourceTeardown(object):
+    """Teardown of independent resource types in parallel.
+
+    Cleanup fixtures submit cleanup of resource type and don't wait for it,
+    so resources of different types are deleted at the same time. Cleanup
+    may depend on cleanups of other types, which are finished before it.
+    Such cleanup is started on join, when cleanups of all types it depends
+    on are submitted, regardless of order of submission.
+    """
+
+    def __init__(self):
+        """Constructor."""
+        self._lock = threading.Lock()
+        self._jobs = []
+
+    def submit(self, resource, cleanup, after=()):
+        """Submit cleanup of resource type.
+
+        Cleanup without dependencies is started in background at once.
+
+        Args:
+            resource (str): resource type
+            cleanup (function): function to cleanup resources
+            after (tuple): resource types which should be cleaned before
+        """
+        job = _Job(resource, cleanup, after)
+        with self._lock:
+            self._jobs.append(job)
+        if not after:
+            job.start()
+
+    def join(self):
+        """Start dependent cleanups and wait for all submitted cleanups.
+
+        Raises:
+            Exception: first error raised by any cleanup
+            ValueError: if cleanups depend on each other in cycle
+        """
+        with self._lock:
+            jobs, self._jobs = self._jobs, []
+
+        pending = [job for job in jobs if job.after]
+        for job in pending:
+            job.dependencies = [dependency for dependency in jobs
+                                if dependency.resource in job.after]
+
+        # job is started only after its dependencies, because thread can't
+        # be joined before start
+        while pending:
+            ready = [job for job in pending
+                     if all(dependency.ident is not None
+                            for dependency in job.dependencies)]
+            if not ready:
+                for job in jobs:
+                    if job.ident is not None:
+                        job.join()
+                raise ValueError('Cleanups of {} depend on each other'.format(
+                    ', '.join(sorted(job.resource for job in pending))))
+            for job in ready:
+                pending.remove(job)
+                job.start()
+
+        for job in jobs:
+            job.join()
+
+        for job in jobs:
+            if job.error:
+                raise job.error
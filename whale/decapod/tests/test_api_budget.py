@@ -0,0 +1,184 @@
+"""
+----------------
+API budget tests
+----------------
+
+Tests run API budget plugin in separate pytest process on synthetic spans
+of Decapod API, so they don't need Decapod.
+"""
+
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or
+# implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import os
+
+import pytest
+
+import whale
+
+HEADER = """
+import threading
+
+import pytest
+
+from whale import timing
+
+
+def call_api(name, count=1):
+    for _ in range(count):
+        with timing.span(name, timing.API):
+            pass
+
+
+def call_api_in_thread(name, count=1):
+    thread = threading.Thread(target=call_api, args=(name, count))
+    thread.start()
+    thread.join()
+"""
+
+
+@pytest.fixture
+def run_tests(testdir, monkeypatch):
+    """Callable fixture to run tests with API budget plugin.
+
+    Args:
+        testdir (Testdir): pytester temporary directory
+        monkeypatch (MonkeyPatch): monkeypatch fixture
+
+    Returns:
+        function: function to run tests source with pytest options
+    """
+    path = os.path.dirname(os.path.dirname(os.path.abspath(whale.__file__)))
+    monkeypatch.setenv('PYTHONPATH', os.pathsep.join(
+        filter(None, [path, os.environ.get('PYTHONPATH')])))
+
+    def _run_tests(source, *args):
+        testdir.makepyfile(HEADER + source)
+        return testdir.runpytest_subprocess(
+            '-p', 'whale.third_party.api_budget', *args)
+
+    return _run_tests
+
+
+@pytest.mark.idempotent_id('5cb89e97-c58f-4d15-bd94-bbcad443edba')
+def test_calls_within_api_budget(run_tests):
+    """**Scenario:** Check that test within API budget passes.
+
+    **Steps:**
+
+    #. Run test which calls API method once, while budget allows single
+        call
+    #. Check that test passes and its call is printed in summary
+    """
+    result = run_tests("""
+@pytest.mark.api_budget(get_users=1)
+def test_foo():
+    call_api('get_users')
+""")
+
+    result.assert_outcomes(passed=1)
+    result.stdout.fnmatch_lines(['*Decapod API calls*',
+                                 '1 *test_foo',
+                                 '*1 get_users'])
+
+
+@pytest.mark.idempotent_id('4baf4136-f4f1-4721-876d-e24da26b8feb')
+def test_calls_over_api_budget(run_tests):
+    """**Scenario:** Check that test over API budget fails.
+
+    **Steps:**
+
+    #. Run test which calls API method twice, while budget allows single
+        call
+    #. Check that test fails with exceeded budget
+    """
+    result = run_tests("""
+@pytest.mark.api_budget(get_users=1)
+def test_foo():
+    call_api('get_users', count=2)
+""")
+
+    result.assert_outcomes(failed=1)
+    result.stdout.fnmatch_lines(['*API budget is exceeded*',
+                                 'get_users: 2 calls, budget 1'])
+
+
+@pytest.mark.idempotent_id('93b9583c-c394-477d-97e3-1dd0efdb29ae')
+def test_calls_of_fixtures_are_not_limited(run_tests):
+    """**Scenario:** Check that API calls of fixtures aren't limited.
+
+    **Steps:**
+
+    #. Run test with fixture which calls API method on setup and teardown,
+        while budget allows single call
+    #. Check that test passes and all calls are printed in summary
+    """
+    result = run_tests("""
+@pytest.fixture
+def users():
+    call_api('get_users', count=2)
+    yield
+    call_api('get_users', count=2)
+
+
+@pytest.mark.api_budget(get_users=1)
+def test_foo(users):
+    call_api('get_users')
+""")
+
+    result.assert_outcomes(passed=1)
+    result.stdout.fnmatch_lines(['5 *test_foo'])
+
+
+@pytest.mark.idempotent_id('5088329a-9fdb-4c9d-a558-709e94d4d345')
+def test_calls_of_background_threads_are_not_counted(run_tests):
+    """**Scenario:** Check that API calls of other threads aren't counted.
+
+    **Steps:**
+
+    #. Run test which calls API method once and twice more in background
+        thread, while budget allows single call
+    #. Check that test passes and only its own call is counted
+    """
+    result = run_tests("""
+@pytest.mark.api_budget(get_users=1)
+def test_foo():
+    call_api('get_users')
+    call_api_in_thread('get_users', count=2)
+""")
+
+    result.assert_outcomes(passed=1)
+    result.stdout.fnmatch_lines(['1 *test_foo'])
+
+
+@pytest.mark.idempotent_id('b11fc111-6dc6-40d9-8f4f-1dcb78de324e')
+def test_api_calls_limit(run_tests):
+    """**Scenario:** Check that API calls limit fails test without budget.
+
+    **Steps:**
+
+    #. Run tests which call API method twice and three times with limit of
+        two calls of each method
+    #. Check that only test over limit fails
+    """
+    result = run_tests("""
+def test_foo():
+    call_api('get_users', count=2)
+
+
+def test_bar():
+    call_api('get_users', count=3)
+""", '--api-calls-limit=2')
+
+    result.assert_outcomes(passed=1, failed=1)
+    result.stdout.fnmatch_lines(['*get_users: 3 calls, budget 2'])
@@ -18,3 +18,5 @@ Decapod application, pages and custom UI
 # limitations under the License.
 
 from .decapod import Decapod  # noqa
+from .pool import BrowserPool  # noqa
+from .recorder import FrameRecorder  # noqa
@@ -23,6 +23,7 @@ import pom
 from pom import ui
 from pom.ui import base
 from selenium.common import exceptions
+from selenium.webdriver.firefox.options import Options
 from selenium.webdriver import FirefoxProfile
 from selenium.webdriver.remote.remote_connection import RemoteConnection
 
@@ -64,10 +65,18 @@ class Decapod(pom.App):
     def __init__(self, url, *args, **kwgs):
         """Constructor."""
         self.profile = Profile()
+        options = Options()
+        if config.BROWSER_HEADLESS:
+            # only this browser is headless, unlike via MOZ_HEADLESS of
+            # process environment
+            options.add_argument('-headless')
         super(Decapod, self).__init__(
-            url, 'firefox', firefox_profile=self.profile, *args, **kwgs)
+            url, 'firefox', firefox_profile=self.profile,
+            firefox_options=options, *args, **kwgs)
 
-        self.webdriver.maximize_window()
+        if not config.BROWSER_HEADLESS:
+            # headless browser has no screen to maximize window to
+            self.webdriver.maximize_window()
         self.webdriver.set_window_size(*config.BROWSER_WINDOW_SIZE)
         self.webdriver.set_page_load_timeout(config.ACTION_TIMEOUT)
 
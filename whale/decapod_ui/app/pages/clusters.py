@@ -31,11 +31,13 @@ class RowCluster(ui.Row):
     """Row of cluster."""
 
 
-class ListClusters(ui.List):
+class ListClusters(_ui.KeyedList):
     """List of clusters."""
 
     row_cls = RowCluster
     row_xpath = './/div[contains(@class, "box")]'
+    row_selector = 'div[class*="box"]'
+    key_selector = 'div.name'
 
 
 @ui.register_ui(
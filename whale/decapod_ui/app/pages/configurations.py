@@ -40,11 +40,13 @@ class RowConfiguration(ui.Row):
     """Row of configuration."""
 
 
-class ListConfigurations(ui.List):
+class ListConfigurations(_ui.KeyedList):
     """List of configurations."""
 
     row_cls = RowConfiguration
     row_xpath = './/div[contains(@class, "box")]'
+    row_selector = 'div[class*="box"]'
+    key_selector = 'div.name'
 
 
 @ui.register_ui(
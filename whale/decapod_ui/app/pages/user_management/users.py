@@ -34,11 +34,13 @@ class RowUser(ui.Row):
     """Row of user."""
 
 
-class ListUsers(ui.List):
+class ListUsers(_ui.KeyedList):
     """List of users."""
 
     row_cls = RowUser
     row_xpath = './/div[contains(@class, "box")]'
+    row_selector = 'div[class*="box"]'
+    key_selector = 'div.name'
 
 
 @ui.register_ui(
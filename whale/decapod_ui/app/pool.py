@@ -0,0 +1,164 @@
+"""
+------------
+Browser pool
+------------
+"""
+
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or
+# implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import logging
+import os
+import shutil
+import threading
+
+from selenium.common import exceptions
+
+from whale import config
+from whale.decapod_ui.app import decapod
+
+__all__ = [
+    'BrowserPool',
+]
+
+LOGGER = logging.getLogger(__name__)
+
+CLEAR_STORAGE_SCRIPT = """
+window.localStorage.clear();
+window.sessionStorage.clear();
+"""
+
+
+class BrowserPool(object):
+    """Pool of launched browsers with Decapod app shared between tests.
+
+    Test acquires browser and releases it after finish. Released browser is
+    reset to initial state and kept warm for the next test. Browser which
+    fails reset or health check, or served max count of tests, is quit and
+    new one is launched instead.
+    """
+
+    def __init__(self, url, size=config.BROWSER_POOL_SIZE,
+                 max_tests=config.BROWSER_MAX_TESTS):
+        """Constructor.
+
+        Args:
+            url (str): Decapod UI url
+            size (int): max count of idle browsers
+            max_tests (int): max count of tests served by one browser
+        """
+        self._url = url
+        self._size = size
+        self._max_tests = max_tests
+        self._lock = threading.Lock()
+        self._idle = []
+        self._tests = {}
+
+    def acquire(self):
+        """Acquire healthy browser, launching it if pool is empty.
+
+        Returns:
+            Decapod: application in browser
+        """
+        while True:
+            with self._lock:
+                application = self._idle.pop() if self._idle else None
+
+            if application is None:
+                return self._launch()
+            if self._is_healthy(application):
+                return application
+            self._quit(application)
+
+    def release(self, application):
+        """Reset browser and return it to pool.
+
+        Args:
+            application (Decapod): application in browser
+        """
+        with self._lock:
+            self._tests[application] = self._tests.get(application, 0) + 1
+            exhausted = self._tests[application] >= self._max_tests
+            full = len(self._idle) >= self._size
+
+        if exhausted or full or not self._reset(application):
+            self._quit(application)
+            return
+
+        with self._lock:
+            self._idle.append(application)
+
+    def close(self):
+        """Quit all idle browsers."""
+        with self._lock:
+            applications, self._idle = self._idle, []
+        for application in applications:
+            self._quit(application)
+
+    def _launch(self):
+        application = decapod.Decapod(self._url)
+        with self._lock:
+            self._tests[application] = 0
+        return application
+
+    def _quit(self, application):
+        with self._lock:
+            self._tests.pop(application, None)
+        try:
+            application.quit()
+        except Exception:
+            LOGGER.exception("Can't quit browser")
+        shutil.rmtree(application.download_dir, ignore_errors=True)
+
+    @staticmethod
+    def _is_healthy(application):
+        try:
+            return application.webdriver.execute_script(
+                'return document.readyState') == 'complete'
+        except exceptions.WebDriverException:
+            LOGGER.warning('Browser is unhealthy', exc_info=True)
+            return False
+
+    def _reset(self, application):
+        webdriver = application.webdriver
+        try:
+            try:
+                webdriver.switch_to.alert.dismiss()
+            except exceptions.NoAlertPresentException:
+                pass
+
+            # close windows opened by test
+            for handle in webdriver.window_handles[1:]:
+                webdriver.switch_to.window(handle)
+                webdriver.close()
+            webdriver.switch_to.window(webdriver.window_handles[0])
+
+            # storage can be cleared only on page of app origin
+            webdriver.get(self._url)
+            webdriver.execute_script(CLEAR_STORAGE_SCRIPT)
+            application.flush_session()
+            webdriver.get(self._url)
+        except exceptions.WebDriverException:
+            LOGGER.warning("Can't reset browser", exc_info=True)
+            return False
+
+        for name in os.listdir(application.download_dir):
+            path = os.path.join(application.download_dir, name)
+            if os.path.isdir(path):
+                shutil.rmtree(path, ignore_errors=True)
+            else:
+                os.remove(path)
+
+        application.current_username = None
+        application.current_project = None
+        return self._is_healthy(application)
@@ -0,0 +1,144 @@
+"""
+--------------
+Frame recorder
+--------------
+"""
+
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or
+# implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import collections
+import logging
+import os
+import subprocess
+import threading
+import time
+
+from whale import config
+
+__all__ = [
+    'FrameRecorder',
+]
+
+LOGGER = logging.getLogger(__name__)
+
+# JPEG frame ends with EOI marker, which can't occur inside of frame data
+JPEG_END = b'\xff\xd9'
+READ_SIZE = 64 * 1024
+
+
+class FrameRecorder(object):
+    """Recorder of last seconds of X display.
+
+    Frames are grabbed from X display by separate ``VIDEO_ENCODER`` process
+    as JPEG images, so webdriver session used by test isn't touched. Only
+    last frames are kept in bounded in-memory ring buffer. Frames are
+    encoded to video only on demand, for ex. if test is failed.
+    """
+
+    def __init__(self, display, size, seconds=config.VIDEO_BUFFER_SECONDS,
+                 frame_rate=config.VIDEO_FRAME_RATE):
+        """Constructor.
+
+        Args:
+            display (str): X display to grab, for ex. ``:0``
+            size (tuple): width and height of grabbed area
+            seconds (float): seconds of frames to keep
+            frame_rate (float): frames per second to grab
+        """
+        self._display = display
+        self._size = tuple(size)
+        self._frame_rate = frame_rate
+        self._frames = collections.deque(
+            maxlen=max(int(seconds * frame_rate), 1))
+        self._grabber = None
+        self._thread = None
+
+    def start(self):
+        """Start grabbing of frames.
+
+        Returns:
+            FrameRecorder: started recorder
+        """
+        command = [config.VIDEO_ENCODER, '-loglevel', 'error',
+                   '-f', 'x11grab', '-r', '{:.3f}'.format(self._frame_rate),
+                   '-s', '{}x{}'.format(*self._size), '-i', self._display,
+                   '-f', 'image2pipe', '-c:v', 'mjpeg', '-q:v', '5', '-']
+        try:
+            self._grabber = subprocess.Popen(command, stdout=subprocess.PIPE)
+        except OSError:
+            LOGGER.exception("Can't grab frames of display %s", self._display)
+            return self
+
+        self._thread = threading.Thread(target=self._read,
+                                        name='frame-recorder')
+        self._thread.daemon = True
+        self._thread.start()
+        return self
+
+    def stop(self):
+        """Stop grabbing of frames."""
+        if self._grabber and self._grabber.poll() is None:
+            self._grabber.terminate()
+            self._grabber.wait()
+        if self._thread:
+            self._thread.join()
+
+    def _read(self):
+        stream = self._grabber.stdout.fileno()
+        data = b''
+        while True:
+            chunk = os.read(stream, READ_SIZE)
+            if not chunk:
+                return
+            data += chunk
+            end = data.find(JPEG_END)
+            while end >= 0:
+                end += len(JPEG_END)
+                self._frames.append((time.time(), data[:end]))
+                data = data[end:]
+                end = data.find(JPEG_END)
+
+    def save(self, path):
+        """Encode kept frames to video file.
+
+        Args:
+            path (str): path to video file
+
+        Returns:
+            bool: flag whether video is saved
+        """
+        frames = list(self._frames)
+        if not frames:
+            return False
+
+        # frames may be grabbed slower than planned, so real rate is used
+        duration = frames[-1][0] - frames[0][0]
+        frame_rate = ((len(frames) - 1) / duration if duration > 0
+                      else self._frame_rate)
+
+        command = [config.VIDEO_ENCODER, '-y', '-loglevel', 'error',
+                   '-r', '{:.3f}'.format(frame_rate),
+                   '-f', 'image2pipe', '-c:v', 'mjpeg', '-i', '-',
+                   # yuv420p needs even size of frames
+                   '-vf', 'scale=trunc(iw/2)*2:trunc(ih/2)*2',
+                   '-c:v', 'libx264', '-pix_fmt', 'yuv420p', path]
+        try:
+            encoder = subprocess.Popen(command, stdin=subprocess.PIPE)
+            for _, frame in frames:
+                encoder.stdin.write(frame)
+            encoder.stdin.close()
+            return encoder.wait() == 0
+        except (OSError, IOError):
+            LOGGER.exception("Can't encode video to %s", path)
+            return False
@@ -19,7 +19,46 @@ Custom table block
 
 from pom import ui
 from pom.ui import table as ui_table
+from selenium.common import exceptions
 from selenium.webdriver.common.by import By
+from stepler.third_party import waiter
+
+
+# Keys of items are read in browser and cached on container element until
+# observer sees mutation of its DOM subtree, so repeated lookups don't walk
+# DOM and each of them is one webdriver call only.
+INDEX_SCRIPT = """
+var element = arguments[0], itemSelector = arguments[1],
+    keySelector = arguments[2], attribute = arguments[3];
+
+if (!element._whaleObserver) {
+    element._whaleObserver = new MutationObserver(function() {
+        element._whaleIndex = {};
+    });
+    element._whaleObserver.observe(element, {
+        attributes: true, characterData: true, childList: true,
+        subtree: true});
+    element._whaleIndex = {};
+}
+
+var cacheKey = [itemSelector, keySelector, attribute].join('|');
+if (!element._whaleIndex.hasOwnProperty(cacheKey)) {
+    var items = element.querySelectorAll(itemSelector), keys = [];
+    for (var i = 0; i < items.length; i++) {
+        var node = keySelector ? items[i].querySelector(keySelector)
+                               : items[i];
+        if (!node) {
+            keys.push(null);
+        } else if (attribute) {
+            keys.push(node.getAttribute(attribute));
+        } else {
+            keys.push(node.textContent.trim());
+        }
+    }
+    element._whaleIndex[cacheKey] = keys;
+}
+return element._whaleIndex[cacheKey];
+"""
 
 
 def _merge_xpath(xpath, attr):
@@ -44,21 +83,77 @@ class ListField(ui.List):
         return row
 
 
-class _CellIndexMixin(ui_table._CellsMixin):
+class _IndexMixin(object):
+    """Mixin to read keys of items of element with one webdriver call."""
+
+    def read_keys(self, item_selector, key_selector=None, attribute=None):
+        """Read keys of items in order of their position.
+
+        Arguments:
+            - item_selector: CSS selector of items inside element.
+            - key_selector: CSS selector of key element inside item, item
+              itself is key element by default.
+            - attribute: attribute of key element to be key, its text is key
+              by default.
+
+        Returns:
+            - list: keys of items, None for item without key element.
+        """
+        webelement = self.webelement
+        return webelement.parent.execute_script(
+            INDEX_SCRIPT, webelement, item_selector, key_selector, attribute)
+
+
+class KeyedList(ui.List, _IndexMixin):
+    """List with rows identified by text of key element.
+
+    Presence of rows is checked by their keys read with one webdriver call,
+    instead of lookup of each row element.
+    """
+
+    row_selector = None
+    key_selector = None
+
+    @property
+    def row_keys(self):
+        """Keys of rows in order of their position."""
+        return self.read_keys(self.row_selector, self.key_selector)
+
+    def wait_for_rows(self, present=(), absent=(), timeout=None):
+        """Wait for rows with keys to be present and absent.
+
+        Arguments:
+            - present: keys of rows which should be present.
+            - absent: keys of rows which should be absent.
+            - timeout: seconds to wait, timeout of element by default.
+
+        Raises:
+            - TimeoutExpired: if rows aren't present or absent after timeout.
+        """
+        def _check_rows():
+            try:
+                keys = self.row_keys
+            except exceptions.NoSuchElementException:
+                # list itself may be not rendered yet
+                return False
+            return (all(key in keys for key in present) and
+                    not any(key in keys for key in absent))
+
+        waiter.wait(_check_rows, timeout_seconds=timeout or self.timeout)
+
+
+class _CellIndexMixin(ui_table._CellsMixin, _IndexMixin):
     """Cell mixin to add index to columns dict if it doesn't exist."""
 
-    element_xpath = './/div[@title="{}"]'
+    element_selector = ':scope > *'
+    element_attribute = 'title'
 
     def get_index(self, name):
         """Get index by cell name."""
-        locator = By.XPATH, '*'
-        elements = self.find_elements(locator)
-
-        element = ui.Block(By.XPATH, self.element_xpath.format(name))
-        element.container = self
-
-        if element.webelement in elements:
-            result = elements.index(element.webelement) + 1
+        keys = self.read_keys(self.element_selector,
+                              attribute=self.element_attribute)
+        if name in keys:
+            result = keys.index(name) + 1
         else:
             result = -1
 
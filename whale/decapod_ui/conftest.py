@@ -19,5 +19,17 @@ Contains fixtures specific for Decapod (UI testing).
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import pytest
+
 from .fixtures import *  # noqa
 from .fixtures import __all__  # noqa
+from .fixtures import app
+
+
+@pytest.hookimpl(hookwrapper=True)
+def pytest_runtest_makereport(item, call):
+    """Save screenshot and video of failed test before fixtures teardown."""
+    outcome = yield
+    report = outcome.get_result()
+    if report.failed and report.when in ('setup', 'call'):
+        app.save_failure_artifacts(item)
@@ -25,12 +25,15 @@ from .user import *  # noqa
 
 __all__ = sorted([  # sort for documentation
     'auth_steps',
+    'browser_pool',
     'decapod',
     'login',
 
     'video_capture',
     'virtual_display',
     'report_dir',
+    'stepler_video_capture',
+    'stepler_virtual_display',
 
     'ui_cluster_steps',
     'ui_configuration_steps',
@@ -17,10 +17,15 @@ Fixtures to run horizon, login, create demo user, etc
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import logging
+import os
+
 import pytest
 from stepler.horizon.fixtures.auto_use import report_dir
-from stepler.horizon.fixtures.auto_use import video_capture
-from stepler.horizon.fixtures.auto_use import virtual_display
+from stepler.horizon.fixtures.auto_use import \
+    video_capture as stepler_video_capture
+from stepler.horizon.fixtures.auto_use import \
+    virtual_display as stepler_virtual_display
 
 from whale import config
 from whale.decapod_ui import app
@@ -28,21 +33,111 @@ from whale.decapod_ui import steps
 
 __all__ = [
     'auth_steps',
+    'browser_pool',
     'decapod',
     'login',
 
     'video_capture',
     'virtual_display',
     'report_dir',
+    'stepler_video_capture',
+    'stepler_virtual_display',
 ]
 
+LOGGER = logging.getLogger(__name__)
+
+
+@pytest.yield_fixture(scope='session')
+def virtual_display(request):
+    """Session fixture to run browsers in virtual X server.
+
+    Headless browser doesn't need X server, so it isn't started then.
+    """
+    if not config.BROWSER_HEADLESS:
+        request.getfixturevalue('stepler_virtual_display')
+    yield
+
+
+@pytest.yield_fixture
+def video_capture(request):
+    """Fixture to capture video of test via X server.
+
+    Video of whole test is captured if ``VIDEO_CAPTURE`` is ``always``. If
+    it is ``failure``, only X server is started and last frames are kept by
+    ``decapod`` fixture. Video isn't captured in headless browser.
+    """
+    if not config.BROWSER_HEADLESS:
+        if config.VIDEO_CAPTURE == 'always':
+            request.getfixturevalue('stepler_video_capture')
+        elif config.VIDEO_CAPTURE == 'failure':
+            request.getfixturevalue('virtual_display')
+    yield
+
+
+@pytest.yield_fixture(scope='session')
+def browser_pool():
+    """Session fixture to get pool of browsers with Decapod app.
+
+    With xdist each worker has own pool. Browsers are quit at the end of
+    session.
+    """
+    pool = app.BrowserPool(config.DECAPOD_WD_URL)
+    yield pool
+    pool.close()
+
 
 @pytest.yield_fixture
-def decapod(video_capture):
-    """Initial fixture to start."""
-    application = app.Decapod(config.DECAPOD_WD_URL)
+def decapod(request, report_dir, video_capture, browser_pool):
+    """Initial fixture to start.
+
+    Browser is acquired from pool and is reset and returned back after test.
+    Screenshot of browser is saved to report dir if test is failed. If
+    ``VIDEO_CAPTURE`` is ``failure``, last frames of X display are kept in
+    memory and video of them is saved only if test is failed.
+    """
+    application = browser_pool.acquire()
+    recorder = None
+    if (config.VIDEO_CAPTURE == 'failure' and not config.BROWSER_HEADLESS and
+            os.environ.get('DISPLAY')):
+        recorder = app.FrameRecorder(os.environ['DISPLAY'],
+                                     config.BROWSER_WINDOW_SIZE).start()
+
+    # artifacts of failed test are saved by report hook before teardown of
+    # other fixtures (for ex. logout) changes page
+    request.node.decapod_app = application
+    request.node.decapod_recorder = recorder
+    request.node.decapod_report_dir = report_dir
+
     yield application
-    application.quit()
+
+    del request.node.decapod_app
+    del request.node.decapod_recorder
+    if recorder:
+        recorder.stop()
+
+    browser_pool.release(application)
+
+
+def save_failure_artifacts(item):
+    """Save screenshot and video of browser of failed test to its report dir.
+
+    Args:
+        item (pytest.Item): failed test
+    """
+    application = getattr(item, 'decapod_app', None)
+    if application is None:
+        return
+
+    try:
+        application.webdriver.save_screenshot(
+            os.path.join(item.decapod_report_dir, 'screenshot.png'))
+    except Exception:
+        LOGGER.exception("Can't save screenshot of failed test")
+
+    recorder = item.decapod_recorder
+    if recorder:
+        recorder.stop()
+        recorder.save(os.path.join(item.decapod_report_dir, 'video.mp4'))
 
 
 @pytest.fixture
@@ -52,11 +147,19 @@ def auth_steps(decapod):
 
 
 @pytest.fixture
-def login(auth_steps):
+def login(auth_steps, get_decapod_client):
     """Login to decapod.
 
-    Majority of tests requires user login. Logs out after test.
+    Majority of tests requires user login. If ``UI_LOGIN`` is ``token``,
+    token got from Decapod API is put to browser storage instead of login
+    form filling, and it's dropped with browser state after test. Otherwise
+    user logs in via login form and logs out after test.
     """
+    if config.UI_LOGIN == 'token':
+        auth_steps.login_with_token(get_decapod_client().login())
+        yield
+        return
+
     auth_steps.login()
     yield
     # reload page to be sure that modal form doesn't prevent to logout
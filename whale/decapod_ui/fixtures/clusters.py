@@ -25,14 +25,15 @@ __all__ = ['ui_cluster_steps']
 
 
 @pytest.fixture
-def ui_cluster_steps(decapod, login):
+def ui_cluster_steps(decapod, login, resource_ledger):
     """Function fixture to get cluster steps.
 
     Args:
         decapod (Decapod): instatiated decapod application
         login (None): user should log in before cluster actions
+        resource_ledger (ResourceLedger): ledger of created resources
 
     Returns:
         ClusterSteps: instantiated cluster steps
     """
-    return ClusterSteps(decapod)
+    return ClusterSteps(decapod, ledger=resource_ledger)
@@ -28,14 +28,16 @@ __all__ = [
 
 
 @pytest.fixture
-def ui_configuration_steps(decapod, login):
+def ui_configuration_steps(decapod, login, resource_ledger):
     """Function fixture to get configuration steps.
 
     Args:
         decapod (Decapod): instantiated decapod web application
         login (None): should log in decapod before steps using
+        resource_ledger (ResourceLedger): ledger of created resources
 
     Returns:
         ConfigurationSteps: instantiated configuration steps
     """
-    return configuration.ConfigurationSteps(decapod)
+    return configuration.ConfigurationSteps(decapod,
+                                            ledger=resource_ledger)
@@ -27,14 +27,15 @@ __all__ = [
 
 
 @pytest.fixture
-def ui_role_steps(decapod, login):
+def ui_role_steps(decapod, login, resource_ledger):
     """Function fixture to get role steps.
 
     Args:
         login (None): should log in decapod before steps using
         decapod (Decapod): instantiated decapod web application
+        resource_ledger (ResourceLedger): ledger of created resources
 
     Returns:
         RoleSteps: Instantiated role steps
     """
-    return role.RoleSteps(decapod)
+    return role.RoleSteps(decapod, ledger=resource_ledger)
@@ -27,14 +27,15 @@ __all__ = [
 
 
 @pytest.fixture
-def ui_user_steps(decapod, login):
+def ui_user_steps(decapod, login, resource_ledger):
     """Function fixture to get user steps.
 
     Args:
         login (None): should log in decapod before steps using
         decapod (Decapod): instantiated decapod web application
+        resource_ledger (ResourceLedger): ledger of created resources
 
     Returns:
         UserSteps: Instantiated user steps
     """
-    return user.UserSteps(decapod)
+    return user.UserSteps(decapod, ledger=resource_ledger)
@@ -17,6 +17,8 @@ Decapod steps for authentication
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import json
+
 from stepler.third_party import steps_checker
 
 from whale import config
@@ -48,6 +50,30 @@ class AuthSteps(base.BaseSteps):
         if check:
             self.app.page_base.current_user.wait_for_presence(30)
 
+    @steps_checker.step
+    def login_with_token(self, token, username=config.DECAPOD_LOGIN,
+                         check=True):
+        """Step to log in user account with token got from Decapod API.
+
+        Token is put to browser local storage, so login form is skipped.
+
+        Arguments:
+            - token: dict, model of auth token.
+            - username: string, user name of token.
+        """
+        webdriver = self.app.webdriver
+        # local storage is accessible only on page of app origin
+        if not webdriver.current_url.startswith(self.app.app_url):
+            webdriver.get(self.app.app_url)
+        webdriver.execute_script(
+            'window.localStorage.setItem(arguments[0], arguments[1]);',
+            config.UI_TOKEN_STORAGE_KEY, json.dumps(token))
+        webdriver.get(self.app.app_url)
+        self.app.current_username = username
+
+        if check:
+            self.app.page_base.current_user.wait_for_presence(30)
+
     @steps_checker.step
     def logout(self, check=True):
         """Step to log out user account."""
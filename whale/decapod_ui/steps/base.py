@@ -24,13 +24,30 @@ from stepler.third_party import steps_checker
 class BaseSteps(object):
     """Base steps."""
 
-    def __init__(self, app):
+    def __init__(self, app, ledger=None):
         """Constructor.
 
         Arguments:
             - app: decapod application instance.
+            - ledger: ledger to record names of created resources.
         """
         self.app = app
+        self._ledger = ledger
+
+    def _record(self, resource, name):
+        """Record name of created resource to ledger."""
+        if self._ledger is not None:
+            self._ledger.add_name(resource, name)
+
+    def _rename(self, resource, name, new_name):
+        """Update name of renamed resource in ledger."""
+        if self._ledger is not None:
+            self._ledger.rename(resource, name, new_name)
+
+    def _forget(self, resource, name):
+        """Forget name of deleted resource in ledger."""
+        if self._ledger is not None:
+            self._ledger.discard_name(resource, name)
 
     def _open(self, page):
         current_page = self.app.current_page
@@ -21,6 +21,7 @@ from stepler.third_party import steps_checker
 from stepler.third_party import utils
 
 from whale.decapod_ui.steps import base
+from whale import ledger
 
 __all__ = ['ClusterSteps']
 
@@ -54,9 +55,10 @@ class ClusterSteps(base.BaseSteps):
         page.button_create_cluster.click()
         page.form_create_cluster.field_name.value = name
         page.form_create_cluster.submit(modal_absent=False)
+        self._record(ledger.CLUSTERS, name)
 
         if check:
-            page.list_clusters.row(name).wait_for_presence()
+            page.list_clusters.wait_for_rows(present=[name])
 
         return name
 
@@ -84,9 +86,10 @@ class ClusterSteps(base.BaseSteps):
         page.form_create_cluster.field_name.value = new_name
 
         page.form_create_cluster.submit(modal_absent=False)
+        self._rename(ledger.CLUSTERS, name, new_name)
 
         if check:
-            page.list_clusters.row(name).wait_for_absence()
-            page.list_clusters.row(new_name).wait_for_presence()
+            page.list_clusters.wait_for_rows(present=[new_name],
+                                             absent=[name])
 
         return new_name
@@ -26,6 +26,7 @@ from stepler.third_party import waiter
 
 from whale import config
 from whale.decapod_ui.steps import base
+from whale import ledger
 
 
 class ConfigurationSteps(base.BaseSteps):
@@ -79,9 +80,10 @@ class ConfigurationSteps(base.BaseSteps):
             page.form_playbook_servers.checkbox_servers.row(
                 server['data']['name']).checkbox_server.click()
         page.form_playbook_servers.submit(modal_absent=False)
+        self._record(ledger.PLAYBOOK_CONFIGS, name)
 
         if check:
-            page.list_configurations.row(name).wait_for_presence()
+            page.list_configurations.wait_for_rows(present=[name])
 
         return name
 
@@ -134,9 +136,10 @@ class ConfigurationSteps(base.BaseSteps):
         page.list_configurations.row(config_name).maximize_icon.click()
         page.list_configurations.row(config_name).button_delete_config.click()
         page.form_confirm_config_deletion.submit(modal_absent=False)
+        self._forget(ledger.PLAYBOOK_CONFIGS, config_name)
 
         if check:
-            page.list_configurations.row(config_name).wait_for_absence()
+            page.list_configurations.wait_for_rows(absent=[config_name])
 
     @steps_checker.step
     def create_execution(self, config_name, check=True):
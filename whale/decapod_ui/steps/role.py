@@ -21,6 +21,7 @@ from stepler.third_party import steps_checker
 from stepler.third_party import utils
 
 from whale.decapod_ui.steps import base
+from whale import ledger
 
 
 class RoleSteps(base.BaseSteps):
@@ -53,6 +54,7 @@ class RoleSteps(base.BaseSteps):
         page_roles.button_create_role.click()
         page_roles.form_create_role.field_role_name.value = role_name
         page_roles.form_create_role.submit(modal_absent=False)
+        self._record(ledger.ROLES, role_name)
 
         if check:
             page_roles.table_roles.header.cell(role_name).wait_for_presence()
@@ -104,6 +106,7 @@ class RoleSteps(base.BaseSteps):
                 value).click()
 
         page_roles.form_role_permissions.submit(modal_absent=False)
+        self._rename(ledger.ROLES, role_name, new_role_name)
 
         if check:
             page_roles.table_roles.header.cell(role_name).wait_for_absence()
@@ -127,6 +130,7 @@ class RoleSteps(base.BaseSteps):
 
         page_roles.table_roles.header.cell(role_name).button_delete.click()
         page_roles.form_confirm_role_deletion.submit(modal_absent=False)
+        self._forget(ledger.ROLES, role_name)
 
         if check:
             page_roles.table_roles.header.cell(role_name).wait_for_absence()
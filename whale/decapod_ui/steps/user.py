@@ -22,6 +22,7 @@ from stepler.third_party import steps_checker
 from stepler.third_party import utils
 
 from whale.decapod_ui.steps import base
+from whale import ledger
 
 
 class UserSteps(base.BaseSteps):
@@ -60,9 +61,10 @@ class UserSteps(base.BaseSteps):
             form.combobox_role.value = role_name
 
             form.submit(modal_absent=False)
+        self._record(ledger.USERS, login)
 
         if check:
-            page_users.list_users.row(login).wait_for_presence()
+            page_users.list_users.wait_for_rows(present=[login])
 
         return login
 
@@ -105,12 +107,13 @@ class UserSteps(base.BaseSteps):
                 form.combobox_role.value = new_role_name
 
             form.submit(modal_absent=False)
+        self._rename(ledger.USERS, login, new_login)
 
         page_users.list_users.row(new_login).minimize_icon.click()
 
         if check:
-            page_users.list_users.row(login).wait_for_absence()
-            page_users.list_users.row(new_login).wait_for_presence()
+            page_users.list_users.wait_for_rows(present=[new_login],
+                                                absent=[login])
 
             page_users.list_users.row(new_login).maximize_icon.click()
             with page_users.form_user_details as form:
@@ -140,6 +143,7 @@ class UserSteps(base.BaseSteps):
 
         page_users.form_user_details.cancel(modal_absent=False)
         page_users.form_confirm_user_deletion.submit(modal_absent=False)
+        self._forget(ledger.USERS, login)
 
         if check:
-            page_users.list_users.row(login).wait_for_absence()
+            page_users.list_users.wait_for_rows(absent=[login])
@@ -0,0 +1,92 @@
+"""
+--------------
+Resource index
+--------------
+"""
+
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or
+# implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import threading
+import time
+
+from whale import config
+
+__all__ = [
+    'ResourceIndex',
+]
+
+
+class ResourceIndex(object):
+    """Index of resource collections by field value.
+
+    Collection is downloaded once and indexed by field, so repeated lookups
+    are made in memory. Index of collection expires after TTL and is dropped
+    by steps which change the collection. Lookup of missing value rebuilds
+    index, because resource could be created out of steps (for ex. via UI).
+    """
+
+    def __init__(self, ttl=config.RESOURCE_INDEX_TTL):
+        """Constructor.
+
+        Args:
+            ttl (float): seconds to keep index of collection
+        """
+        self._ttl = ttl
+        self._lock = threading.Lock()
+        self._indexes = {}
+        self._generations = {}
+
+    def get(self, resource, field_value, getter, field_name='name'):
+        """Get resource by field value.
+
+        Args:
+            resource (str): resource type
+            field_value (str): field value that is used to identify resource
+            getter (function): function to get all resources of type
+            field_name (str): field name that is used to identify resource
+
+        Returns:
+            dict|None: model of resource
+        """
+        key = (resource, field_name)
+        with self._lock:
+            expires_at, index = self._indexes.get(key, (0, {}))
+            generation = self._generations.get(resource, 0)
+
+        if expires_at > time.time() and field_value in index:
+            return index[field_value]
+
+        index = {}
+        for model in getter():
+            index.setdefault(model['data'][field_name], model)
+
+        with self._lock:
+            # collection could be changed during download
+            if self._generations.get(resource, 0) == generation:
+                self._indexes[key] = (time.time() + self._ttl, index)
+
+        return index.get(field_value)
+
+    def invalidate(self, resource):
+        """Drop indexes of resource collection.
+
+        Args:
+            resource (str): resource type
+        """
+        with self._lock:
+            self._generations[resource] = (
+                self._generations.get(resource, 0) + 1)
+            for key in list(self._indexes):
+                if key[0] == resource:
+                    del self._indexes[key]
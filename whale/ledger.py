@@ -0,0 +1,128 @@
+"""
+---------------
+Resource ledger
+---------------
+"""
+
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or
+# implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import collections
+import threading
+
+__all__ = [
+    'ResourceLedger',
+    'CLUSTERS',
+    'PLAYBOOK_CONFIGS',
+    'ROLES',
+    'USERS',
+]
+
+CLUSTERS = 'clusters'
+PLAYBOOK_CONFIGS = 'playbook_configs'
+ROLES = 'roles'
+USERS = 'users'
+
+
+class ResourceLedger(object):
+    """Ledger of resources created by steps.
+
+    API steps record ids of created resources, UI steps record their names,
+    because ids aren't shown in UI. Cleanup fixtures pop recorded resources
+    and delete exactly them instead of listing all existing resources.
+    """
+
+    def __init__(self):
+        """Constructor."""
+        self._lock = threading.Lock()
+        self._ids = collections.defaultdict(collections.OrderedDict)
+        self._names = collections.defaultdict(collections.OrderedDict)
+
+    def add(self, resource, resource_id):
+        """Record id of created resource.
+
+        Args:
+            resource (str): resource type
+            resource_id (str): resource id
+        """
+        with self._lock:
+            self._ids[resource][resource_id] = None
+
+    def discard(self, resource, resource_id):
+        """Forget id of deleted resource.
+
+        Args:
+            resource (str): resource type
+            resource_id (str): resource id
+        """
+        with self._lock:
+            self._ids[resource].pop(resource_id, None)
+
+    def add_name(self, resource, name):
+        """Record name of resource created via UI.
+
+        Args:
+            resource (str): resource type
+            name (str): resource name
+        """
+        with self._lock:
+            self._names[resource][name] = None
+
+    def rename(self, resource, name, new_name):
+        """Update name of recorded resource renamed via UI.
+
+        Args:
+            resource (str): resource type
+            name (str): old resource name
+            new_name (str): new resource name
+        """
+        with self._lock:
+            names = self._names[resource]
+            if name in names:
+                del names[name]
+                names[new_name] = None
+
+    def discard_name(self, resource, name):
+        """Forget name of resource deleted via UI.
+
+        Args:
+            resource (str): resource type
+            name (str): resource name
+        """
+        with self._lock:
+            self._names[resource].pop(name, None)
+
+    def pop(self, resource, getter=None, field_name='name'):
+        """Pop ids of resources recorded since previous pop.
+
+        Recorded names are resolved to ids with single call of getter.
+
+        Args:
+            resource (str): resource type
+            getter (function|None): step to get all resources of type
+            field_name (str): field name that is used to identify resource
+
+        Returns:
+            list: resource ids in order of creation
+        """
+        with self._lock:
+            resource_ids = list(self._ids.pop(resource, {}))
+            names = self._names.pop(resource, {})
+
+        if names and getter:
+            resource_ids.extend(
+                model['id'] for model in getter(check=False)
+                if model['data'][field_name] in names and
+                model['id'] not in resource_ids)
+
+        return resource_ids
@@ -0,0 +1,124 @@
+"""
+-------
+Polling
+-------
+"""
+
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or
+# implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import random
+import time
+
+from stepler.third_party import waiter
+
+from whale import config
+from whale import timing
+
+__all__ = [
+    'PollingPolicy',
+    'wait',
+    'BENCHMARK_POLICY',
+    'EXECUTION_POLICY',
+    'RESOURCE_POLICY',
+]
+
+
+class PollingPolicy(object):
+    """Policy of polling with exponential backoff, jitter and cap."""
+
+    def __init__(self, sleep_seconds, max_sleep_seconds,
+                 multiplier=config.POLLING_MULTIPLIER,
+                 jitter=config.POLLING_JITTER):
+        """Constructor.
+
+        Args:
+            sleep_seconds (float): sleep after first check
+            max_sleep_seconds (float): max sleep between checks
+            multiplier (float): growth factor of sleep after each check
+            jitter (float): max relative deviation of sleep
+        """
+        self.sleep_seconds = sleep_seconds
+        self.max_sleep_seconds = max_sleep_seconds
+        self.multiplier = multiplier
+        self.jitter = jitter
+
+    def sleeps(self):
+        """Generate sleeps between consecutive checks.
+
+        Yields:
+            float: seconds to sleep
+        """
+        sleep_seconds = self.sleep_seconds
+        while True:
+            if config.DECAPOD_REPLAY:
+                # replayed responses don't need time to change
+                yield 0
+                continue
+
+            yield sleep_seconds * random.uniform(1 - self.jitter,
+                                                 1 + self.jitter)
+            sleep_seconds = min(sleep_seconds * self.multiplier,
+                                self.max_sleep_seconds)
+
+
+# user, role, playbook config, etc CRUD takes milliseconds
+RESOURCE_POLICY = PollingPolicy(config.RESOURCE_POLLING_INTERVAL,
+                                config.RESOURCE_POLLING_MAX_INTERVAL)
+# executions take from minutes to half an hour
+EXECUTION_POLICY = PollingPolicy(config.EXECUTION_POLLING_INTERVAL,
+                                 config.EXECUTION_POLLING_MAX_INTERVAL)
+# benchmarks poll executions often to notice their start in time
+BENCHMARK_POLICY = PollingPolicy(config.BENCHMARK_POLLING_INTERVAL,
+                                 config.BENCHMARK_POLLING_INTERVAL,
+                                 multiplier=1, jitter=0)
+
+
+def wait(predicate, timeout_seconds=0, policy=RESOURCE_POLICY):
+    """Wait for predicate is true, sleeping between checks due to policy.
+
+    Last check is made via stepler waiter, so failed waiting raises the same
+    error as ``waiter.wait`` does.
+
+    Args:
+        predicate (function): function to check
+        timeout_seconds (float): seconds to wait predicate is true
+        policy (PollingPolicy): policy of sleeps between checks
+
+    Returns:
+        object: result of predicate
+
+    Raises:
+        TimeoutExpired: if predicate isn't true after timeout
+    """
+    with timing.span(getattr(predicate, '__name__', 'wait'), timing.POLLING,
+                     timeout=timeout_seconds):
+        return _poll(predicate, timeout_seconds, policy)
+
+
+def _poll(predicate, timeout_seconds, policy):
+    deadline = time.time() + timeout_seconds
+
+    for sleep_seconds in policy.sleeps():
+        remaining_seconds = deadline - time.time()
+        if remaining_seconds <= 0:
+            break
+
+        result = predicate()
+        if result:
+            return result
+
+        with timing.span('sleep', timing.WAIT):
+            time.sleep(min(sleep_seconds, remaining_seconds))
+
+    return waiter.wait(predicate, timeout_seconds=0)
@@ -0,0 +1,156 @@
+"""
+-----------------
+API budget plugin
+-----------------
+
+Counts calls of Decapod API made by each test, grouped by client method
+(i.e. by endpoint and verb). Test may limit calls with marker::
+
+    @pytest.mark.api_budget(get_clusters=2, get_execution=10)
+    def test_foo(...):
+        ...
+
+Test fails if it makes more calls than budget allows. Only calls made in
+test body are checked, calls of fixtures are counted but not limited. Calls
+are counted in thread running test only, so calls of cluster pool, resource
+teardown and execution waiter threads aren't attributed to test. With
+option ``--api-calls-limit=N`` any method called more than ``N`` times in
+test body fails test, which detects N+1 requests and polling storms. Top of
+tests by count of API calls is printed at the end of session.
+"""
+
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or
+# implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import collections
+import threading
+
+import pytest
+
+from whale import timing
+
+__all__ = [
+    'pytest_addoption',
+    'pytest_configure',
+    'pytest_unconfigure',
+]
+
+SUMMARY_SIZE = 10
+
+
+def pytest_addoption(parser):
+    """Add option to limit API calls of each method in test."""
+    parser.addoption('--api-calls-limit', action='store', type=int,
+                     metavar='N',
+                     help='Fail test which calls any Decapod API method more '
+                          'than N times.')
+
+
+def pytest_configure(config):
+    """Register API budget marker and plugin."""
+    config.addinivalue_line(
+        'markers',
+        'api_budget(**calls): max count of calls of Decapod client methods '
+        'in test, for ex. api_budget(get_clusters=2)')
+    config.pluginmanager.register(
+        ApiBudget(config.getoption('api_calls_limit')), 'whale_api_budget')
+
+
+def pytest_unconfigure(config):
+    """Stop counting of API calls."""
+    plugin = config.pluginmanager.get_plugin('whale_api_budget')
+    if plugin:
+        plugin.close()
+        config.pluginmanager.unregister(plugin)
+
+
+class ApiBudget(object):
+    """Plugin to count API calls of tests."""
+
+    def __init__(self, calls_limit=None):
+        """Constructor.
+
+        Args:
+            calls_limit (int|None): max count of calls of each method in test
+        """
+        self._calls_limit = calls_limit
+        self._thread = threading.current_thread()
+        self._calls = collections.Counter()
+        self._tests = {}
+        timing.add_listener(self._count)
+
+    def _count(self, record):
+        if (record['category'] == timing.API and
+                record['thread'] is self._thread):
+            self._calls[record['name']] += 1
+
+    def _pop_calls(self):
+        calls, self._calls = self._calls, collections.Counter()
+        return calls
+
+    def close(self):
+        """Stop counting of API calls."""
+        timing.remove_listener(self._count)
+
+    @pytest.hookimpl(hookwrapper=True)
+    def pytest_runtest_protocol(self, item, nextitem):
+        """Count API calls of test including its fixtures."""
+        self._thread = threading.current_thread()
+        self._pop_calls()
+        yield
+        self._tests[item.nodeid] = (
+            self._tests.get(item.nodeid, collections.Counter()) +
+            self._pop_calls())
+
+    @pytest.hookimpl(hookwrapper=True)
+    def pytest_runtest_call(self, item):
+        """Check API calls of test body against budget."""
+        setup_calls = self._pop_calls()
+        outcome = yield
+        calls = self._pop_calls()
+        self._tests[item.nodeid] = setup_calls + calls
+
+        if outcome.excinfo is not None:
+            return
+
+        budget = {}
+        if self._calls_limit is not None:
+            budget.update((method, self._calls_limit) for method in calls)
+        marker = item.keywords.get('api_budget')
+        if marker:
+            budget.update(marker.kwargs)
+
+        exceeded = ['{}: {} calls, budget {}'.format(method, calls[method],
+                                                     limit)
+                    for method, limit in sorted(budget.items())
+                    if calls[method] > limit]
+        if exceeded:
+            pytest.fail('API budget is exceeded:\n' + '\n'.join(exceeded),
+                        pytrace=False)
+
+    def pytest_terminal_summary(self, terminalreporter):
+        """Print tests with the most API calls."""
+        tests = sorted(self._tests.items(),
+                       key=lambda item: sum(item[1].values()), reverse=True)
+        tests = [(nodeid, calls) for nodeid, calls in tests[:SUMMARY_SIZE]
+                 if calls]
+        if not tests:
+            return
+
+        terminalreporter.write_sep('=', 'Decapod API calls')
+        for nodeid, calls in tests:
+            terminalreporter.write_line('{} {}'.format(
+                sum(calls.values()), nodeid))
+            for method, count in calls.most_common():
+                terminalreporter.write_line(
+                    '    {:>5} {}'.format(count, method))
@@ -0,0 +1,80 @@
+"""
+---------------------
+Steps instrumentation
+---------------------
+
+Wraps public methods of API and UI step classes to measure their invocations.
+Steps are instrumented while at least one plugin needs them.
+"""
+
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or
+# implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import inspect
+import threading
+
+from whale import base
+# steps are imported to find all subclasses of base steps
+from whale.decapod import steps  # noqa
+from whale.decapod_ui.steps import base as ui_base
+# configuration steps aren't exported by UI steps package
+from whale.decapod_ui.steps import configuration  # noqa
+from whale import timing
+
+__all__ = [
+    'instrument_steps',
+    'restore_steps',
+]
+
+_lock = threading.Lock()
+_originals = []
+_users = [0]
+
+
+def _get_step_classes():
+    classes = []
+    bases = [base.BaseSteps, ui_base.BaseSteps]
+    while bases:
+        cls = bases.pop()
+        classes.append(cls)
+        bases.extend(cls.__subclasses__())
+    return classes
+
+
+def instrument_steps():
+    """Wrap steps to measure their invocations."""
+    with _lock:
+        _users[0] += 1
+        if _users[0] > 1:
+            return
+
+        for cls in _get_step_classes():
+            for name, attr in list(vars(cls).items()):
+                if (name.startswith('_') or not inspect.isfunction(attr) or
+                        getattr(attr, '_timed', False)):
+                    continue
+                _originals.append((cls, name, attr))
+                setattr(cls, name, timing.timed(
+                    '{}.{}'.format(cls.__name__, name), attr))
+
+
+def restore_steps():
+    """Restore original steps if no plugin needs them instrumented."""
+    with _lock:
+        _users[0] -= 1
+        if _users[0] > 0:
+            return
+
+        while _originals:
+            cls, name, attr = _originals.pop()
+            setattr(cls, name, attr)
@@ -0,0 +1,138 @@
+"""
+-------------------
+Step timings plugin
+-------------------
+
+Measures each step invocation and splits its wall time to time of requests
+to Decapod API, time of polling sleeps and local time. With option
+``--step-timings=DIR`` timings of each test are saved to JSON file in
+``DIR`` and summary table of steps is printed at the end of session and
+saved to ``DIR/summary.json``.
+"""
+
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or
+# implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import collections
+import json
+import os
+import re
+
+import pytest
+
+from whale.third_party import instrumentation
+from whale import timing
+
+__all__ = [
+    'pytest_addoption',
+    'pytest_configure',
+    'pytest_unconfigure',
+]
+
+COLUMNS = ('total', timing.API, timing.WAIT, 'local')
+
+
+def pytest_addoption(parser):
+    """Add option to save step timings."""
+    parser.addoption('--step-timings', action='store', metavar='DIR',
+                     help='Directory to save timings of steps of each test.')
+
+
+def pytest_configure(config):
+    """Register step timings plugin if option is passed."""
+    timings_dir = config.getoption('step_timings')
+    if timings_dir:
+        config.pluginmanager.register(StepTimings(timings_dir),
+                                      'whale_step_timings')
+
+
+def pytest_unconfigure(config):
+    """Restore steps measured by step timings plugin."""
+    plugin = config.pluginmanager.get_plugin('whale_step_timings')
+    if plugin:
+        plugin.close()
+        config.pluginmanager.unregister(plugin)
+
+
+class StepTimings(object):
+    """Plugin to measure steps."""
+
+    def __init__(self, timings_dir):
+        """Constructor.
+
+        Args:
+            timings_dir (str): directory to save timings
+        """
+        self._timings_dir = timings_dir
+        self._timer = timing.StepTimer()
+        self._summary = collections.OrderedDict()
+
+        if not os.path.isdir(timings_dir):
+            os.makedirs(timings_dir)
+
+        instrumentation.instrument_steps()
+        timing.add_listener(self._timer)
+
+    def close(self):
+        """Stop measuring of steps."""
+        timing.remove_listener(self._timer)
+        instrumentation.restore_steps()
+
+    def _aggregate(self, records):
+        for record in records:
+            row = self._summary.setdefault(
+                record['step'], dict({'calls': 0}, **{c: 0 for c in COLUMNS}))
+            row['calls'] += 1
+            for column in COLUMNS:
+                row[column] += record[column]
+
+    @pytest.hookimpl(hookwrapper=True)
+    def pytest_runtest_protocol(self, item, nextitem):
+        """Save timings of steps of test including its fixtures."""
+        self._aggregate(self._timer.pop_records())
+        yield
+        records = self._timer.pop_records()
+        self._aggregate(records)
+
+        file_name = re.sub(r'[^\w.-]+', '_', item.nodeid) + '.json'
+        with open(os.path.join(self._timings_dir, file_name), 'w') as f:
+            json.dump({'test': item.nodeid,
+                       'totals': {column: sum(record[column]
+                                              for record in records
+                                              if record['depth'] == 0)
+                                  for column in COLUMNS},
+                       'steps': records}, f, indent=2)
+
+    def pytest_terminal_summary(self, terminalreporter):
+        """Print and save summary table of step timings."""
+        self._aggregate(self._timer.pop_records())
+        rows = sorted(self._summary.items(),
+                      key=lambda item: item[1]['total'], reverse=True)
+
+        with open(os.path.join(self._timings_dir, 'summary.json'), 'w') as f:
+            json.dump(collections.OrderedDict(rows), f, indent=2)
+
+        if not rows:
+            return
+
+        width = max(len(step) for step, _ in rows)
+        header = '{:<{w}} {:>7}'.format('step', 'calls', w=width) + ''.join(
+            ' {:>10}'.format(column) for column in COLUMNS)
+
+        terminalreporter.write_sep('=', 'step timings, seconds')
+        terminalreporter.write_line(header)
+        for step, row in rows:
+            terminalreporter.write_line(
+                '{:<{w}} {:>7}'.format(step, row['calls'], w=width) +
+                ''.join(' {:>10.2f}'.format(row[column])
+                        for column in COLUMNS))
@@ -0,0 +1,163 @@
+"""
+-------------------
+Trace events plugin
+-------------------
+
+With option ``--trace-events=FILE`` timeline of test session is saved to
+``FILE`` in Chrome trace event format, which may be loaded to
+``chrome://tracing`` or Perfetto UI. Timeline contains nested spans of tests,
+fixtures setup and teardown, steps, requests to Decapod API, polling loops
+and sleeps, one track per thread.
+"""
+
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or
+# implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import json
+import os
+import threading
+import time
+
+import pytest
+
+from whale.third_party import instrumentation
+from whale import timing
+
+__all__ = [
+    'pytest_addoption',
+    'pytest_configure',
+    'pytest_unconfigure',
+]
+
+FIXTURE = 'fixture'
+TEST = 'test'
+
+
+def pytest_addoption(parser):
+    """Add option to save trace events."""
+    parser.addoption('--trace-events', action='store', metavar='FILE',
+                     help='File to save timeline of session in Chrome trace '
+                          'event format.')
+
+
+def pytest_configure(config):
+    """Register trace events plugin if option is passed."""
+    trace_file = config.getoption('trace_events')
+    if trace_file:
+        config.pluginmanager.register(TraceEvents(trace_file),
+                                      'whale_trace_events')
+
+
+def pytest_unconfigure(config):
+    """Save trace events and restore steps."""
+    plugin = config.pluginmanager.get_plugin('whale_trace_events')
+    if plugin:
+        plugin.close()
+        config.pluginmanager.unregister(plugin)
+
+
+class TraceEvents(object):
+    """Plugin to record timeline of session."""
+
+    def __init__(self, trace_file):
+        """Constructor.
+
+        Args:
+            trace_file (str): file to save trace events
+        """
+        self._trace_file = trace_file
+        self._pid = os.getpid()
+        self._lock = threading.Lock()
+        self._events = []
+        self._threads = {}
+
+        instrumentation.instrument_steps()
+        timing.add_listener(self._add)
+
+    def _add(self, record):
+        thread = record['thread']
+        event = {
+            'name': record['name'],
+            'cat': record['category'],
+            'ph': 'X',
+            'ts': int(record['start'] * 1e6),
+            'dur': int(record['duration'] * 1e6),
+            'pid': self._pid,
+            'tid': thread.ident,
+            'args': record['args'],
+        }
+        with self._lock:
+            self._threads[thread.ident] = thread.name
+            self._events.append(event)
+
+    def _span(self, name, category, start, **args):
+        self._add({'name': name,
+                   'category': category,
+                   'start': start,
+                   'duration': time.time() - start,
+                   'thread': threading.current_thread(),
+                   'args': args})
+
+    @pytest.hookimpl(hookwrapper=True)
+    def pytest_fixture_setup(self, fixturedef, request):
+        """Trace setup and teardown of fixture."""
+        teardown = {}
+
+        def _end_teardown():
+            if teardown:
+                self._span(fixturedef.argname, FIXTURE, teardown['start'],
+                           phase='teardown', scope=fixturedef.scope)
+
+        # finalizers are called in reverse order, so this one is the last
+        fixturedef.addfinalizer(_end_teardown)
+
+        start = time.time()
+        yield
+        self._span(fixturedef.argname, FIXTURE, start,
+                   phase='setup', scope=fixturedef.scope)
+
+        def _start_teardown():
+            teardown['start'] = time.time()
+
+        fixturedef.addfinalizer(_start_teardown)
+
+    @pytest.hookimpl(hookwrapper=True)
+    def pytest_runtest_protocol(self, item, nextitem):
+        """Trace test including its fixtures."""
+        start = time.time()
+        yield
+        self._span(item.nodeid, TEST, start)
+
+    @pytest.hookimpl(hookwrapper=True)
+    def pytest_runtest_call(self, item):
+        """Trace test body."""
+        start = time.time()
+        yield
+        self._span(item.name, TEST, start, phase='call')
+
+    def close(self):
+        """Stop tracing and save trace events."""
+        timing.remove_listener(self._add)
+        instrumentation.restore_steps()
+
+        with self._lock:
+            events = [{'name': 'thread_name',
+                       'ph': 'M',
+                       'pid': self._pid,
+                       'tid': tid,
+                       'args': {'name': name}}
+                      for tid, name in self._threads.items()]
+            events.extend(sorted(self._events, key=lambda e: e['ts']))
+
+        with open(self._trace_file, 'w') as f:
+            json.dump({'traceEvents': events, 'displayTimeUnit': 'ms'}, f)
@@ -0,0 +1,186 @@
+"""
+------------
+Step timings
+------------
+"""
+
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or
+# implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import contextlib
+import functools
+import threading
+import time
+
+__all__ = [
+    'StepTimer',
+    'add_listener',
+    'remove_listener',
+    'span',
+    'timed',
+    'API',
+    'POLLING',
+    'STEP',
+    'WAIT',
+]
+
+API = 'api'
+POLLING = 'polling'
+STEP = 'step'
+WAIT = 'wait'
+
+_local = threading.local()
+_listeners = []
+
+
+def _frames():
+    if not hasattr(_local, 'frames'):
+        _local.frames = []
+    return _local.frames
+
+
+def add_listener(listener):
+    """Add listener of finished spans.
+
+    Args:
+        listener (function): function to call with record of each span
+    """
+    _listeners.append(listener)
+
+
+def remove_listener(listener):
+    """Remove listener of finished spans.
+
+    Args:
+        listener (function): added listener
+    """
+    _listeners.remove(listener)
+
+
+def _notify(record):
+    for listener in list(_listeners):
+        listener(record)
+
+
+@contextlib.contextmanager
+def span(name, category, **args):
+    """Measure block of code as span.
+
+    Time of ``api`` and ``wait`` spans is attributed to steps which are
+    running in current thread.
+
+    Args:
+        name (str): name of span
+        category (str): ``api`` for requests to Decapod API, ``wait`` for
+            sleeps, ``polling`` for polling loops, etc
+        **args: any details of span
+    """
+    frames = _frames()
+    if not (frames or _listeners):
+        yield
+        return
+
+    start = time.time()
+    try:
+        yield
+    finally:
+        duration = time.time() - start
+        if category in (API, WAIT):
+            for frame in frames:
+                frame[category] += duration
+        if _listeners:
+            _notify({'name': name,
+                     'category': category,
+                     'start': start,
+                     'duration': duration,
+                     'thread': threading.current_thread(),
+                     'args': args})
+
+
+def timed(step_name, func):
+    """Wrap step function to measure its invocations.
+
+    Args:
+        step_name (str): name of step, for ex. ``UserSteps.create_user``
+        func (function): step function
+
+    Returns:
+        function: wrapped step function
+    """
+    @functools.wraps(func)
+    def _step(*args, **kwargs):
+        frames = _frames()
+        frame = {API: 0, WAIT: 0}
+        frames.append(frame)
+        start = time.time()
+        try:
+            return func(*args, **kwargs)
+        finally:
+            duration = time.time() - start
+            frames.pop()
+            _notify({'name': step_name,
+                     'category': STEP,
+                     'start': start,
+                     'duration': duration,
+                     'thread': threading.current_thread(),
+                     'args': {'depth': len(frames),
+                              API: frame[API],
+                              WAIT: frame[WAIT]}})
+
+    _step._timed = True
+    return _step
+
+
+class StepTimer(object):
+    """Timer of step invocations.
+
+    Each invocation is measured by wall time, which is split to time of
+    requests to Decapod API, time of polling sleeps and local time. Time of
+    nested steps is included to time of outer step.
+    """
+
+    def __init__(self):
+        """Constructor."""
+        self._lock = threading.Lock()
+        self._records = []
+
+    def __call__(self, record):
+        """Add record of step invocation.
+
+        Args:
+            record (dict): record of finished span
+        """
+        if record['category'] != STEP:
+            return
+
+        args = record['args']
+        with self._lock:
+            self._records.append({
+                'step': record['name'],
+                'start': record['start'],
+                'depth': args['depth'],
+                'total': record['duration'],
+                API: args[API],
+                WAIT: args[WAIT],
+                'local': max(record['duration'] - args[API] - args[WAIT], 0),
+            })
+
+    def pop_records(self):
+        """Pop records of step invocations since previous pop.
+
+        Returns:
+            list: records of step invocations
+        """
+        with self._lock:
+            records, self._records = self._records, []
+        return records